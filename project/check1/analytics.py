@@ -0,0 +1,244 @@
+import pandas as pd
+import numpy as np
+from datetime import date, timedelta
+
+from storage import (
+    BOOKING_FILE, EPOCH, ROOM_FILE, STAY_COLUMNS, booking_stays, clean_price,
+    day_number, day_ordinals, load_columns, parse_booking_date, rows_between,
+    show_cache_stats, show_memory_report, table_stamp, to_day_ordinals,
+)
+
+import inventory
+import rooms
+
+# Materialized revenue rollups (day number / "YYYY-MM" / room type -> revenue).
+# Built once from bookings x rooms, then updated in place as bookings are made.
+REVENUE_ROLLUPS = {"daily": None, "monthly": None, "room_type": None, "stamp": None}
+
+
+# ==========================================================
+# 📊 PERFORMANCE & ANALYTICS
+# ==========================================================
+def performance():
+    while True:
+        print("\n ✎ᝰ.ᐟ⋆⑅˚₊ MANAGER MENU ⋆⑅˚₊✎ᝰ.ᐟ")
+        print("1. Daily Summary & Occupancy Rate")
+        print("2. Revenue Growth / Decline")
+        print("3. Occupancy Trend (date range)")
+        print("4. Inventory Report")
+        print("5. Table Cache Statistics")
+        print("6. Table Memory Report")
+        print("7. Back to Manager Menu")
+        ch = input("Enter choice: ")
+
+        if ch == "1":
+            summary()
+        elif ch == "2":
+            revenue()
+        elif ch == "3":
+            occupancy_report()
+        elif ch == "4":
+            inventory.inventory()
+        elif ch == "5":
+            show_cache_stats()
+        elif ch == "6":
+            show_memory_report()
+        elif ch == "7":
+            break
+        else:
+            print("❌ Invalid input.")
+
+
+def occupancy_series(start_day, end_day, room_df=None, booking_df=None):
+    """
+    Rooms occupied per night in [start_day, end_day) (day numbers), overall and
+    per room type, from a single sweep: +1 at check-in, -1 at check-out and a
+    cumulative sum over the nights.
+    Returns (occupied, rate) DataFrames indexed by date with one column per
+    room type plus "Total"; rate is in percent of that type's room count.
+    """
+    room_df = load_columns(ROOM_FILE, ["RoomID", "RoomType"]) if room_df is None else room_df
+    n_days = max(end_day - start_day, 0)
+
+    room_types = room_df.assign(RoomID=room_df["RoomID"].astype(str).str.strip())
+    room_types = room_types.drop_duplicates("RoomID").set_index("RoomID")["RoomType"]
+    room_types = room_types.astype("string").fillna("Unknown")
+    types = sorted(room_types.unique())
+    capacity = room_types.value_counts().reindex(types).to_numpy()
+
+    room_ids, starts, ends = booking_stays(booking_df)
+    codes = pd.Categorical(pd.Series(room_ids).map(room_types), categories=types).codes
+    starts = np.clip(starts, start_day, end_day) - start_day
+    ends = np.clip(ends, start_day, end_day) - start_day
+    keep = (codes >= 0) & (ends > starts)
+    codes, starts, ends = codes[keep].astype(np.int64), starts[keep], ends[keep]
+
+    width = n_days + 1
+    events = np.bincount(codes * width + starts, minlength=len(types) * width)
+    events = events - np.bincount(codes * width + ends, minlength=len(types) * width)
+    occupied = events.reshape(len(types), width).cumsum(axis=1)[:, :n_days]
+
+    dates = pd.to_datetime(np.arange(start_day, start_day + n_days), unit="D")
+    occupied = pd.DataFrame(occupied.T, index=dates, columns=types)
+    occupied["Total"] = occupied.sum(axis=1)
+
+    rooms_per_col = np.append(capacity, capacity.sum()).astype(float)
+    rooms_per_col[rooms_per_col == 0] = np.nan
+    rate = (occupied / rooms_per_col * 100).round(2)
+    return occupied, rate
+
+
+def summary():
+
+    room_df = load_columns(ROOM_FILE, ["RoomID", "RoomType"])
+    today = day_number(date.today())
+    occupied, rate = occupancy_series(today, today + 7, room_df)
+
+    tot_rooms = len(room_df)
+    booked = int(occupied["Total"].iloc[0]) if tot_rooms > 0 else 0
+    available_rooms = tot_rooms - booked
+    occupancy_rate = (booked / tot_rooms * 100) if tot_rooms > 0 else 0
+
+    print("\nˏ ✄┈┈┈┈┈┈┈┈ Daily Summary ┈┈┈┈┈┈┈┈")
+    print()
+    print(f"Total Rooms: {tot_rooms}")
+    print(f"Booked Rooms: {booked}")
+    print(f"Available Rooms: {available_rooms}")
+    print(f"Occupancy Rate: {occupancy_rate:.2f}%")
+    print(f"Total Bookings on Record: {len(day_ordinals(BOOKING_FILE, 'CheckIn'))}")
+
+    t_bookings = rows_between(BOOKING_FILE, "CheckIn", today, today + 1, ["BookingID", "CustomerName", "RoomID"])
+    if not t_bookings.empty:
+        print("\nToday's Check-ins:")
+        print(t_bookings[["BookingID", "CustomerName", "RoomID"]].to_string(index=False))
+    else:
+        print("\nNo check-ins today.")
+
+    if tot_rooms > 0:
+        print("\nOccupancy Rate (%) — next 7 nights:")
+        rate.index = rate.index.strftime("%d-%m-%Y")
+        print(rate.to_string())
+
+
+def occupancy_report():
+    first = parse_booking_date(input("From (dd-mm-yyyy): ").strip())
+    last = parse_booking_date(input("To (dd-mm-yyyy): ").strip())
+    if first is None or last is None or last < first:
+        print("❌ Invalid date range.")
+        return
+
+    occupied, rate = occupancy_series(first, last + 1)
+    occupied.index = occupied.index.strftime("%d-%m-%Y")
+    rate.index = occupied.index
+    print("\n🛏️ Rooms Occupied per Night:")
+    print(occupied.to_string())
+    print("\n📊 Occupancy Rate (%) by Room Type:")
+    print(rate.to_string())
+    print("\nAverage Occupancy (%):")
+    print(rate.mean().round(2).to_string())
+
+
+def revenue_by_night(booking_df, room_df):
+    """
+    Expands bookings into one row per stay night with that night's rate
+    (Price x the rate table's multiplier, as billed), so a booking's revenue
+    is spread over the dates it covers.
+    Takes typed frames (load_table), so dates and prices are already parsed.
+    """
+    merged = booking_df.merge(room_df[["RoomID", "RoomType", "Price"]], on="RoomID", how="left")
+    start, end, rate = merged["CheckIn"], merged["CheckOut"], merged["Price"]
+    nights = (end - start).dt.days
+    valid = (nights > 0) & rate.notna()
+
+    nights = nights[valid].to_numpy(dtype=np.int64)
+    first_day = to_day_ordinals(start[valid])
+    row = np.repeat(np.arange(len(nights)), nights)
+    offset = np.arange(nights.sum()) - np.repeat(np.cumsum(nights) - nights, nights)
+
+    days = first_day[row] + offset
+    types = pd.Categorical(merged.loc[valid, "RoomType"].astype("string").fillna("Unknown"))
+    room_types = pd.Categorical.from_codes(types.codes[row], types.categories)
+    return pd.DataFrame({
+        "Day": days,
+        "RoomType": room_types,
+        "Revenue": rate[valid].to_numpy()[row] * rooms.night_multipliers(room_types, days),
+    })
+
+
+def revenue_stamp():
+    return (table_stamp(BOOKING_FILE), table_stamp(ROOM_FILE))
+
+
+def build_revenue_rollups():
+    """Recomputes the daily, monthly and room-type revenue rollups from scratch."""
+    stamp = revenue_stamp()
+    nightly = revenue_by_night(load_columns(BOOKING_FILE, STAY_COLUMNS),
+                               load_columns(ROOM_FILE, ["RoomID", "RoomType", "Price"]))
+    months = nightly["Day"].to_numpy().astype("datetime64[D]").astype("datetime64[M]").astype(str)
+    REVENUE_ROLLUPS["daily"] = nightly.groupby("Day")["Revenue"].sum().to_dict()
+    REVENUE_ROLLUPS["monthly"] = nightly.groupby(months)["Revenue"].sum().to_dict()
+    REVENUE_ROLLUPS["room_type"] = nightly.groupby("RoomType")["Revenue"].sum().to_dict()
+    REVENUE_ROLLUPS["stamp"] = stamp
+
+
+def ensure_revenue_rollups():
+    if REVENUE_ROLLUPS["stamp"] is None or REVENUE_ROLLUPS["stamp"] != revenue_stamp():
+        build_revenue_rollups()
+    return REVENUE_ROLLUPS
+
+
+def add_booking_revenue(room, start, end):
+    """
+    Folds one new booking (room row, day numbers) into the rollups without a
+    rebuild. Only call it if the rollups were current before the booking was
+    appended, or bookings written in between would never be counted.
+    """
+    price = clean_price(pd.Series([room["Price"]])).iloc[0]
+    if pd.isna(price):
+        REVENUE_ROLLUPS["stamp"] = revenue_stamp()
+        return
+    room_type = room["RoomType"] if pd.notna(room["RoomType"]) else "Unknown"
+    days = np.arange(start, end)
+    for day, mult in zip(days.tolist(), rooms.night_multipliers([room_type] * len(days), days).tolist()):
+        rate = price * mult
+        month = (EPOCH + timedelta(days=day)).strftime("%Y-%m")
+        REVENUE_ROLLUPS["daily"][day] = REVENUE_ROLLUPS["daily"].get(day, 0) + rate
+        REVENUE_ROLLUPS["monthly"][month] = REVENUE_ROLLUPS["monthly"].get(month, 0) + rate
+        REVENUE_ROLLUPS["room_type"][room_type] = REVENUE_ROLLUPS["room_type"].get(room_type, 0) + rate
+    REVENUE_ROLLUPS["stamp"] = revenue_stamp()
+
+
+def rollup_frame(rollup, key):
+    """Turns a rollup dict into a sorted DataFrame with a Growth % column."""
+    df = pd.DataFrame({key: list(rollup.keys()), "Revenue": list(rollup.values())})
+    df = df.sort_values(key, ignore_index=True)
+    df["Growth %"] = (df["Revenue"].pct_change() * 100).round(2)
+    return df
+
+
+def revenue():
+    rollups = ensure_revenue_rollups()
+    if not rollups["daily"]:
+        print("No data available for revenue analysis.")
+        return
+
+    daily = rollup_frame(rollups["daily"], "Date")
+    daily["Date"] = pd.to_datetime(daily["Date"], unit="D").dt.strftime("%d-%m-%Y")
+    monthly = rollup_frame(rollups["monthly"], "Month")
+    by_type = pd.DataFrame(
+        sorted(rollups["room_type"].items(), key=lambda kv: -kv[1]), columns=["RoomType", "Revenue"]
+    )
+
+    print("\n ˚₊‧꒰ა $ ໒꒱ ‧₊˚ REVENUE REPORT ˚₊‧꒰ა $ ໒꒱ ‧₊˚ ")
+    print(daily[["Date", "Revenue"]].to_string(index=False))
+
+    if len(daily) > 1:
+        print("\n📈 Revenue Growth/Decline Trend:")
+        print(daily.to_string(index=False))
+        print("\n📅 Monthly Revenue:")
+        print(monthly.to_string(index=False))
+    else:
+        print("\nNot enough data to calculate growth trend.")
+
+    print("\n🛏️ Revenue by Room Type:")
+    print(by_type.to_string(index=False))
@@ -0,0 +1,348 @@
+"""
+Benchmark harness for main2.py and its subsystem modules.
+
+Generates a synthetic hotel (rooms, customers, bookings, bills, payments,
+inventory and staff) at a configurable scale in a scratch directory, then
+times the core of each operation and prints the results as JSON.
+
+    python benchmark.py --rows 100000 --repeat 3 --out bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import analytics  # noqa: E402
+import billing  # noqa: E402
+import bookings  # noqa: E402
+import customers  # noqa: E402
+import inventory  # noqa: E402
+import main2  # noqa: E402
+import rooms  # noqa: E402
+import storage  # noqa: E402
+
+
+FIRST_NAMES = ["Aarav", "Divya", "Tanvi", "Vedant", "Jasraj", "Katyayani", "Reyansh", "Anushka",
+               "Aastha", "Ishaan", "Meera", "Kabir", "Riya", "Arjun", "Saanvi", "Vihaan"]
+LAST_NAMES = ["Sharma", "Verma", "Maskara", "Hanish", "Gupta", "Iyer", "Khan", "Reddy",
+              "Singh", "Patel", "Nair", "Das"]
+ROOM_TYPES = {"Single": 1500, "Double": 2500, "Suite": 5000, "Deluxe": 3500}
+ITEM_CATEGORIES = ["Linen", "Cleaning", "Toiletries", "Food", "Minibar"]
+STAFF_ROLES = ["Manager", "Receptionist", "Chef", "Housekeeping", "Security", "Waiter"]
+PAY_METHODS = ["Cash", "UPI", "Credit Card", "Debit Card"]
+
+
+# ==========================================================
+# SYNTHETIC DATA
+# ==========================================================
+def table_sizes(rows):
+    """Row counts per table for a given scale (rows = customers = bookings)."""
+    return {
+        "customers": rows,
+        "bookings": rows,
+        "bills": rows // 2,
+        "payments": rows // 2,
+        "rooms": max(100, rows // 200),
+        "inventory": max(100, rows // 100),
+        "movements": rows,
+        "staff": max(20, rows // 1000),
+    }
+
+
+def random_names(rng, n):
+    first = rng.choice(FIRST_NAMES, n)
+    last = rng.choice(LAST_NAMES, n)
+    return pd.Series(first).str.cat(pd.Series(last), sep=" ")
+
+
+def random_days(rng, n, start="2023-01-01", span_days=3 * 365):
+    base = np.datetime64(start, "D")
+    return base + rng.integers(0, span_days, n).astype("timedelta64[D]")
+
+
+def generate_data(directory, rows, seed=42):
+    """Writes every table main2.py reads into directory. Returns the row counts."""
+    rng = np.random.default_rng(seed)
+    sizes = table_sizes(rows)
+
+    n = sizes["rooms"]
+    types = rng.choice(list(ROOM_TYPES), n)
+    rooms = pd.DataFrame({
+        "RoomID": np.arange(101, 101 + n).astype(str),
+        "RoomType": types,
+        "Price": np.array([ROOM_TYPES[t] for t in types]) + rng.integers(0, 10, n) * 100,
+        "Status": np.where(rng.random(n) < 0.6, "Available", "Booked"),
+    })
+
+    n = sizes["customers"]
+    reg = random_days(rng, n)
+    customers = pd.DataFrame({
+        "CustomerID": np.arange(1, n + 1),
+        "Name": random_names(rng, n),
+        "Email": pd.Series(np.arange(n)).astype(str).radd("guest").add("@example.com"),
+        "Phone": (6000000000 + rng.permutation(n)).astype(str),
+        "RegDate": pd.to_datetime(reg).strftime("%Y-%m-%d"),
+        "RoomID": rng.choice(rooms["RoomID"].to_numpy(), n),
+        "DaysOfStay": rng.integers(1, 15, n),
+    })
+
+    n = sizes["bookings"]
+    check_in = random_days(rng, n)
+    check_out = check_in + rng.integers(1, 15, n).astype("timedelta64[D]")
+    bookings = pd.DataFrame({
+        "BookingID": pd.Series(np.arange(1, n + 1)).astype(str).radd("B"),
+        "CustomerName": random_names(rng, n),
+        "RoomID": rng.choice(rooms["RoomID"].to_numpy(), n),
+        "CheckIn": pd.to_datetime(check_in).strftime("%d-%m-%Y"),
+        "CheckOut": pd.to_datetime(check_out).strftime("%d-%m-%Y"),
+    })
+
+    n = sizes["bills"]
+    room_charge = rng.integers(1, 15, n) * 2000
+    service = rng.choice([0, 200, 500, 1000], n)
+    discount = rng.choice([0, 100, 200], n)
+    tax = np.round((room_charge + service) * 0.18, 2)
+    bills = pd.DataFrame({
+        "BillingID": np.arange(1, n + 1),
+        "CustomerID": rng.integers(1, sizes["customers"] + 1, n),
+        "RoomID": rng.choice(rooms["RoomID"].to_numpy(), n),
+        "RoomCharge": room_charge,
+        "ServiceCharge": service,
+        "Tax": tax,
+        "Discount": discount,
+        "Total": room_charge + service + tax - discount,
+        "Date": pd.to_datetime(random_days(rng, n)).strftime("%Y-%m-%d"),
+    })
+
+    n = sizes["payments"]
+    paid = rng.integers(1, sizes["bills"] + 1, n) if sizes["bills"] else np.zeros(0, dtype=int)
+    payments = pd.DataFrame({
+        "PaymentID": np.arange(1, n + 1),
+        "BillingID": paid,
+        "PaymentMethod": rng.choice(PAY_METHODS, n),
+        "AmountPaid": bills["Total"].to_numpy()[paid - 1] if len(paid) else [],
+        "PaymentDate": pd.to_datetime(random_days(rng, n)).strftime("%Y-%m-%d"),
+        "Status": "Paid",
+    })
+
+    n = sizes["inventory"]
+    inventory = pd.DataFrame({
+        "ItemID": pd.Series(np.arange(1001, 1001 + n)).astype(str).radd("IT"),
+        "ItemName": pd.Series(np.arange(n)).astype(str).radd("Item "),
+        "Category": rng.choice(ITEM_CATEGORIES, n),
+        "Quantity": rng.integers(0, 500, n),
+        "MinThreshold": rng.integers(10, 100, n),
+        "UnitPrice": np.round(rng.uniform(5, 2000, n), 2),
+        "LastUpdated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    })
+
+    n = sizes["movements"]
+    moved = rng.integers(0, len(inventory), n)
+    moved_at = pd.Timestamp.now().normalize() - pd.to_timedelta(rng.integers(0, 60 * 86400, n), unit="s")
+    movements = pd.DataFrame({
+        "MoveID": np.arange(1, n + 1),
+        "Timestamp": moved_at.strftime("%Y-%m-%d %H:%M:%S"),
+        "ItemID": inventory["ItemID"].to_numpy()[moved],
+        "Type": "Use",
+        "Change": -rng.integers(1, 5, n),
+        "QuantityAfter": inventory["Quantity"].to_numpy()[moved],
+        "Note": "",
+    }).sort_values("Timestamp", ignore_index=True)
+    movements["MoveID"] = np.arange(1, n + 1)
+
+    n = sizes["staff"]
+    staff = pd.DataFrame({
+        "StaffID": [f"S{i:03}" for i in range(1, n + 1)],
+        "Name": random_names(rng, n),
+        "Role": rng.choice(STAFF_ROLES, n),
+        "Contact": (9000000000 + rng.permutation(n)).astype(str),
+        "Salary": rng.integers(15, 120, n) * 1000,
+        "JoinDate": pd.to_datetime(random_days(rng, n, "2018-01-01")).strftime("%Y-%m-%d"),
+    })
+
+    for filename, df in [
+        (storage.ROOM_FILE, rooms), (storage.CUSTOMER_FILE, customers), (storage.BOOKING_FILE, bookings),
+        (storage.BILLING_FILE, bills), (storage.PAYMENT_FILE, payments),
+        (storage.INVENTORY_FILE, inventory), (storage.MOVEMENTS_FILE, movements), (storage.STAFF_FILE, staff),
+    ]:
+        df.to_csv(os.path.join(directory, filename), index=False)
+    return sizes
+
+
+# ==========================================================
+# TIMING
+# ==========================================================
+@contextmanager
+def quiet():
+    """Discards everything printed, so report output does not skew the timings."""
+    old_out = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        yield
+    finally:
+        sys.stdout.close()
+        sys.stdout = old_out
+
+
+def time_operation(func, repeat, cold=False):
+    """Runs func(run) for run = 0 .. repeat-1 and returns timing stats in seconds."""
+    timings = []
+    for run in range(repeat):
+        if cold:
+            storage.TABLE_CACHE.clear()
+        with quiet():
+            start = time.perf_counter()
+            func(run)
+            timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": float(np.median(timings)),
+        "max": max(timings),
+        "runs": repeat,
+    }
+
+
+def run_benchmarks(rows, repeat):
+    room_df = storage.load_csv(storage.ROOM_FILE, storage.ROOM_COLUMNS)
+    room_id = room_df["RoomID"].iloc[0]
+    customer_df = customers.load_data()
+    middle = customer_df.iloc[len(customer_df) // 2]
+
+    reconciled = billing.reconcile_payments()
+    unpaid = reconciled.loc[reconciled["Status"] == "Pending", "BillingID"].tolist() or ["1"]
+
+    def pay_bill(run):
+        # A different unpaid bill per run, paid in full.
+        billing.record_payment(unpaid[run % len(unpaid)], "UPI", allow_duplicate=True)
+
+    def book_room(run):
+        # A far-future window per run so the room is always free.
+        check_in = (pd.Timestamp("2099-01-01") + pd.Timedelta(days=3 * run)).strftime("%d-%m-%Y")
+        check_out = (pd.Timestamp("2099-01-02") + pd.Timedelta(days=3 * run)).strftime("%d-%m-%Y")
+        bookings.create_booking(room_id, "Bench Guest", check_in, check_out)
+
+    def revenue_cold(run):
+        # A fresh session: no typed frames or rollups in memory, so the
+        # report reads the columnar snapshots (or the CSVs without pyarrow).
+        storage.TYPED_CACHE.clear()
+        analytics.REVENUE_ROLLUPS["stamp"] = None
+        analytics.revenue()
+
+    def rate_table_build(run):
+        today = storage.day_number(date.today())
+        rooms.build_rate_table(today, today + rooms.RATE_HORIZON_DAYS)
+
+    def quote_week(run):
+        today = storage.day_number(date.today())
+        return rooms.stay_charge(float(room_df["Price"].iloc[0]), room_df["RoomType"].iloc[0], today, today + 7)
+
+    rng = np.random.default_rng(7)
+    stay_in = random_days(rng, 1000, start="2025-06-01", span_days=90)
+    assignment_requests = pd.DataFrame({
+        "CustomerName": random_names(rng, 1000),
+        "RoomType": rng.choice(list(ROOM_TYPES), 1000),
+        "CheckIn": pd.Series(stay_in).dt.strftime("%d-%m-%Y"),
+        "CheckOut": pd.Series(stay_in + rng.integers(1, 8, 1000).astype("timedelta64[D]")).dt.strftime("%d-%m-%Y"),
+    })
+
+    def assign_rooms_1000(run):
+        # Solver only, so every run sees the same free rooms.
+        bookings.ensure_availability_index()
+        bookings.assign_rooms(assignment_requests, room_df)
+
+    january = (storage.day_number(date(2025, 1, 1)), storage.day_number(date(2025, 2, 1)))
+
+    # The non-interactive cores behind the menus, so no input() or printing
+    # is timed along with them.
+    operations = {
+        "startup": (lambda run: main2.measure_launch(runs=1), False),
+        "load_csv_cold": (lambda run: storage.load_csv(storage.CUSTOMER_FILE, storage.CUSTOMER_COLUMNS), True),
+        "load_csv_warm": (lambda run: storage.load_csv(storage.CUSTOMER_FILE, storage.CUSTOMER_COLUMNS), False),
+        "generate_customer_id": (lambda run: customers.generate_customer_id(None), False),
+        "reserve_ids_block_1000": (lambda run: storage.reserve_ids("customer", 1000), False),
+        "find_customers_by_phone": (lambda run: customers.find_customers(middle["Phone"]), False),
+        "find_customers_by_name": (lambda run: customers.find_customers(middle["Name"][:4]), False),
+        "create_booking": (book_room, False),
+        "assign_rooms_1000": (assign_rooms_1000, False),
+        "summary": (lambda run: analytics.summary(), False),
+        "bookings_in_month": (lambda run: storage.rows_between(storage.BOOKING_FILE, "CheckIn", *january), False),
+        "revenue": (lambda run: analytics.revenue(), False),
+        "revenue_cold": (revenue_cold, False),
+        "rate_table_build": (rate_table_build, False),
+        "quote_week": (quote_week, False),
+        "create_bill": (lambda run: billing.create_bill(int(middle["CustomerID"])), False),
+        "record_payment": (pay_bill, False),
+        "reconcile_payments": (lambda run: billing.reconcile_payments(), False),
+        "forecast_inventory": (lambda run: inventory.forecast_inventory(), False),
+        "stock_at_item": (lambda run: inventory.stock_at(pd.Timestamp.now(), "IT1001"), False),
+    }
+
+    results = {}
+    for name, (func, cold) in operations.items():
+        results[name] = time_operation(func, repeat, cold)
+        print(f"{name:<26} {results[name]['median'] * 1000:10.2f} ms", file=sys.stderr)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark main2.py on synthetic data.")
+    parser.add_argument("--rows", type=int, default=10_000, help="customers/bookings rows (10k-10M)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dir", help="data directory (default: a temporary directory, removed afterwards)")
+    parser.add_argument("--out", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    workdir = args.dir or tempfile.mkdtemp(prefix="hotel_bench_")
+    os.makedirs(workdir, exist_ok=True)
+
+    old_cwd = os.getcwd()
+    try:
+        start = time.perf_counter()
+        sizes = generate_data(workdir, args.rows, args.seed)
+        generate_seconds = time.perf_counter() - start
+
+        os.chdir(workdir)
+        results = run_benchmarks(args.rows, args.repeat)
+        memory = storage.memory_report().round(3).to_dict("records")
+    finally:
+        os.chdir(old_cwd)
+        # A scratch directory we created is removed; one given with --dir is kept.
+        if not args.dir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "rows": args.rows,
+        "table_sizes": sizes,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "storage_backend": storage.STORAGE_BACKEND,
+        "generate_seconds": generate_seconds,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "results": results,
+        "memory": memory,
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime, date
+
+from storage import (
+    BILL_COLS, BILLING_FILE, CHARGE_COLUMNS, CHARGES_FILE, CUSTOMER_FILE,
+    NO_DAY, PAGE_ROWS, PAY_COLS, PAYMENT_FILE, ROOM_COLUMNS, ROOM_FILE,
+    append_record, append_records, clean_money, clean_price, date_formats,
+    day_number, DuplicatePaymentError, find_rows, load_columns, load_table,
+    next_id, page_table, parse_dates, reserve_ids, save_csv, table_lock,
+    table_stamp, to_day_ordinals,
+)
+
+import customers
+import rooms
+
+# BillingID -> total amount paid so far, so a payment can be checked against
+# what is still owed without rescanning payments.csv. Rebuilt when payments
+# change behind our back, otherwise kept current by record_payment.
+PAYMENT_INDEX = {"stamp": None, "paid": {}}
+# CustomerID -> unbilled folio balance, kept current by post_charge.
+CHARGE_INDEX = {"stamp": None, "balance": {}}
+# Amounts within this many rupees of the bill total count as settled.
+PAYMENT_TOLERANCE = 0.01
+
+
+# ==========================================================
+# 💰 BILLING & PAYMENTS MODULE
+##########  JASRAJ  #############
+# ==========================================================
+def load_billing_data():
+    return load_table(BILLING_FILE)
+
+
+def load_payment_data():
+    return load_table(PAYMENT_FILE)
+
+
+def save_billing_data(df):
+    save_csv(BILLING_FILE, df)
+
+
+def save_payment_data(df):
+    save_csv(PAYMENT_FILE, df)
+
+
+# ---------------------- GUEST FOLIO ----------------------
+def build_charge_index():
+    """Rebuilds CHARGE_INDEX (CustomerID -> unbilled balance) in one groupby."""
+    with table_lock(CHARGES_FILE, shared=True):
+        stamp = table_stamp(CHARGES_FILE)
+        charges = load_columns(CHARGES_FILE, ["CustomerID", "Amount"])
+    balance = charges.dropna(subset=["CustomerID"]).groupby("CustomerID")["Amount"].sum().round(2)
+    CHARGE_INDEX["balance"] = {int(cid): float(total) for cid, total in balance.items()}
+    CHARGE_INDEX["stamp"] = stamp
+
+
+def ensure_charge_index():
+    if CHARGE_INDEX["stamp"] is None or CHARGE_INDEX["stamp"] != table_stamp(CHARGES_FILE):
+        build_charge_index()
+    return CHARGE_INDEX["balance"]
+
+
+def folio_balance(cid):
+    """A guest's unbilled charges."""
+    return ensure_charge_index().get(int(cid), 0.0)
+
+
+def post_charges(entries):
+    """
+    Appends folio entries (dicts with CustomerID, Source, Description,
+    Amount and optionally BillingID) in one write, filling in ChargeID,
+    Date and the running Balance. Returns the saved records.
+    """
+    if not entries:
+        return []
+    with table_lock(CHARGES_FILE):
+        balances = ensure_charge_index()
+        ids = reserve_ids("charge", len(entries))
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Running balances are kept aside until the write succeeds, so a
+        # failed append leaves the index untouched.
+        running = {}
+        records = []
+        for charge_id, entry in zip(ids, entries):
+            cid = int(entry["CustomerID"])
+            amount = round(float(entry["Amount"]), 2)
+            running[cid] = round(running.get(cid, balances.get(cid, 0.0)) + amount, 2)
+            records.append({
+                "ChargeID": charge_id,
+                "CustomerID": cid,
+                "Date": now,
+                "Source": entry.get("Source", "Service"),
+                "Description": entry.get("Description", ""),
+                "Amount": amount,
+                "Balance": running[cid],
+                "BillingID": entry.get("BillingID", np.nan),
+            })
+        append_records(CHARGES_FILE, records, CHARGE_COLUMNS)
+        balances.update(running)
+        CHARGE_INDEX["stamp"] = table_stamp(CHARGES_FILE)
+    return records
+
+
+def update_customer_bill(cust_id, amount, source="Service", description=""):
+    """Posts one charge to a guest's folio. Returns the ledger record."""
+    if customers.get_customer(int(cust_id)) is None:
+        raise ValueError("Invalid Customer ID.")
+    return post_charges([{"CustomerID": cust_id, "Source": source,
+                          "Description": description, "Amount": amount}])[0]
+
+
+def customer_folio(cid):
+    """Every folio entry for one guest, oldest first."""
+    charges = load_table(CHARGES_FILE)
+    return charges[charges["CustomerID"] == int(cid)].reset_index(drop=True)
+
+
+# ---------------------- BILLING API ----------------------
+def create_bill(cid, service_charge=0.0, discount=0.0):
+    """
+    Bills one customer for their room stay plus the unbilled charges on
+    their folio, which are then settled. Returns the saved bill record.
+    """
+    cust = customers.get_customer(cid)
+    if cust is None:
+        raise ValueError("Invalid Customer ID.")
+
+    room_id = cust["RoomID"]
+    stay_days = int(float(cust["DaysOfStay"])) if pd.notna(cust["DaysOfStay"]) else 0
+    room_charge = room_rate = 0.0
+    room = find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id) if pd.notna(room_id) else pd.DataFrame()
+    if not room.empty and stay_days > 0:
+        # Priced night by night from the rate table, starting at registration.
+        reg = parse_dates(pd.Series([cust["RegDate"]], dtype=object), date_formats(CUSTOMER_FILE, "RegDate"))
+        start = int(to_day_ordinals(reg)[0])
+        start = day_number(date.today()) if start == NO_DAY else start
+        price = clean_price(room["Price"]).iloc[0]
+        if pd.notna(price):
+            room_charge = rooms.stay_charge(price, room["RoomType"].iloc[0], start, start + stay_days)
+            room_rate = round(room_charge / stay_days, 2)
+    discount = float(discount)
+
+    # Folio read, bill written and folio settled under the same locks (in the
+    # same order as generate_bills_batch), so a charge posted meanwhile is
+    # neither lost nor billed twice.
+    with table_lock(BILLING_FILE), table_lock(CHARGES_FILE):
+        folio = folio_balance(cid)
+        service_charge = round(float(service_charge) + folio, 2)
+        tax = round((room_charge + service_charge) * 0.18, 2)
+        total = round(room_charge + service_charge + tax - discount, 2)
+
+        bill = {
+            "BillingID": next_id("bill"),
+            "CustomerID": cid,
+            "RoomID": room_id,
+            "RoomCharge": room_charge,
+            "ServiceCharge": service_charge,
+            "Tax": tax,
+            "Discount": discount,
+            "Total": total,
+            "Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        append_record(BILLING_FILE, bill, BILL_COLS)
+        if folio:
+            post_charges([{"CustomerID": cid, "Source": "Bill", "Amount": -folio,
+                           "Description": f"Billed on bill {bill['BillingID']}",
+                           "BillingID": bill["BillingID"]}])
+    bill.update({"CustomerName": cust["Name"], "DaysOfStay": stay_days, "Rate": room_rate, "Folio": folio})
+    return bill
+
+
+def get_bill(bill_id):
+    rows = find_rows(BILLING_FILE, BILL_COLS, "BillingID", bill_id)
+    return None if rows.empty else rows.iloc[0].to_dict()
+
+
+def build_payment_index():
+    """Rebuilds PAYMENT_INDEX (BillingID -> amount paid) in one groupby."""
+    with table_lock(PAYMENT_FILE, shared=True):
+        stamp = table_stamp(PAYMENT_FILE)
+        payments = load_columns(PAYMENT_FILE, ["BillingID", "AmountPaid"])
+    paid = payments.groupby(payments["BillingID"].astype(str).str.strip())["AmountPaid"].sum()
+    PAYMENT_INDEX["paid"] = paid.to_dict()
+    PAYMENT_INDEX["stamp"] = stamp
+
+
+def ensure_payment_index():
+    if PAYMENT_INDEX["stamp"] is None or PAYMENT_INDEX["stamp"] != table_stamp(PAYMENT_FILE):
+        build_payment_index()
+    return PAYMENT_INDEX["paid"]
+
+
+def amount_paid(bill_id):
+    """Total paid so far against a bill (0.0 if nothing yet)."""
+    return float(ensure_payment_index().get(str(bill_id).strip(), 0.0))
+
+
+def record_payment(bill_id, method, amount=None, allow_duplicate=False):
+    """
+    Records a payment against a bill; amount defaults to what is still owed.
+    Raises DuplicatePaymentError if the bill is already settled, unless
+    allow_duplicate is set. Returns the payment record.
+    """
+    bill = get_bill(bill_id)
+    if bill is None:
+        raise ValueError("Invalid Billing ID.")
+    total = clean_money(pd.Series([bill["Total"]], dtype=object)).iloc[0]
+    total = 0.0 if pd.isna(total) else float(total)
+
+    # Check and append under one lock so two terminals cannot both pay
+    # the same outstanding balance.
+    with table_lock(PAYMENT_FILE):
+        paid = amount_paid(bill_id)
+        outstanding = round(total - paid, 2)
+        if outstanding <= PAYMENT_TOLERANCE and not allow_duplicate:
+            raise DuplicatePaymentError(f"Bill {bill_id} is already paid (₹{paid:.2f} of ₹{total:.2f}).")
+        amount = outstanding if amount is None else round(float(amount), 2)
+        if amount <= 0:
+            raise ValueError("Payment amount must be positive.")
+
+        payment = {
+            "PaymentID": next_id("payment"),
+            "BillingID": bill_id,
+            "PaymentMethod": method,
+            "AmountPaid": amount,
+            "PaymentDate": datetime.now().strftime("%Y-%m-%d"),
+            "Status": "Paid" if paid + amount >= total - PAYMENT_TOLERANCE else "Partial"
+        }
+        append_record(PAYMENT_FILE, payment, PAY_COLS)
+        key = str(bill_id).strip()
+        PAYMENT_INDEX["paid"][key] = PAYMENT_INDEX["paid"].get(key, 0.0) + amount
+        PAYMENT_INDEX["stamp"] = table_stamp(PAYMENT_FILE)
+    return payment
+
+
+def reconcile_payments():
+    """
+    Every bill joined with the sum of its payments, in one vectorized pass.
+    Returns a DataFrame with BillingID, CustomerID, Total, Paid, Payments,
+    Outstanding, Overpaid and Status (Pending / Partial / Paid / Overpaid).
+    """
+    bills = load_columns(BILLING_FILE, ["BillingID", "CustomerID", "Total"])
+    payments = load_columns(PAYMENT_FILE, ["BillingID", "AmountPaid"])
+    bills["BillingID"] = bills["BillingID"].astype(str).str.strip()
+    payments["BillingID"] = payments["BillingID"].astype(str).str.strip()
+
+    paid = payments.groupby("BillingID").agg(Paid=("AmountPaid", "sum"), Payments=("AmountPaid", "size"))
+    df = bills.merge(paid, left_on="BillingID", right_index=True, how="left")
+    df["Total"] = df["Total"].fillna(0.0)
+    df["Paid"] = df["Paid"].fillna(0.0)
+    df["Payments"] = df["Payments"].fillna(0).astype(int)
+    balance = (df["Total"] - df["Paid"]).round(2)
+    df["Outstanding"] = balance.clip(lower=0)
+    df["Overpaid"] = (df["Paid"] - df["Total"]).round(2).clip(lower=0)
+    df["Status"] = np.select(
+        [df["Paid"] <= PAYMENT_TOLERANCE, balance > PAYMENT_TOLERANCE, balance < -PAYMENT_TOLERANCE],
+        ["Pending", "Partial", "Overpaid"],
+        "Paid",
+    )
+    return df.reset_index(drop=True)
+
+
+def orphan_payments():
+    """Payments whose BillingID matches no bill."""
+    payments = load_table(PAYMENT_FILE)
+    bills = load_columns(BILLING_FILE, ["BillingID"])
+    known = set(bills["BillingID"].astype(str).str.strip())
+    return payments[~payments["BillingID"].astype(str).str.strip().isin(known)]
+
+
+def list_bills():
+    return load_billing_data()
+
+
+def list_payments():
+    return load_payment_data()
+
+
+# ---------------------- BILL GENERATION ----------------------
+def generate_bill():
+    if customers.load_data().empty:
+        print("No customers available.")
+        return
+
+    print("\n--- Generate Bill ---")
+    cid = input("Enter Customer ID: ").strip()
+
+    if not cid.isdigit() or customers.get_customer(int(cid)) is None:
+        print("Invalid Customer ID.")
+        return
+
+    folio = folio_balance(int(cid))
+    if folio:
+        print(f"Facility charges on folio: ₹{folio:.2f} (added automatically)")
+    service_charge = float(input("Enter any other service charge (if any): ") or 0)
+    discount = float(input("Enter discount (if any): ") or 0)
+    try:
+        bill = create_bill(int(cid), service_charge, discount)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    print("\n✅ Bill Generated Successfully!")
+    print(f"Billing ID: {bill['BillingID']}")
+    print(f"Customer: {bill['CustomerName']}")
+    print(f"Room: {bill['RoomID']} | Days: {bill['DaysOfStay']} | Avg Rate: ₹{bill['Rate']}/night")
+    if bill["Folio"]:
+        print(f"Facility Charges: ₹{bill['Folio']:.2f}")
+    print(f"Total Amount (after tax & discount): ₹{bill['Total']}\n")
+
+
+def generate_bills_batch(service_charge=0.0, discount=0.0):
+    """
+    Bills every checked-out guest (RegDate + DaysOfStay has passed) who has
+    no bill yet. Customers are joined to rooms once and all charges are
+    computed as column arithmetic; new bills are appended in one write.
+    Returns the DataFrame of generated bills.
+    """
+    # Held for the whole run so a second terminal cannot bill the same guests
+    # or post to a folio that is being settled.
+    with table_lock(BILLING_FILE), table_lock(CHARGES_FILE):
+        guests = load_table(CUSTOMER_FILE)
+        room_table = load_table(ROOM_FILE)
+        billings = load_billing_data()
+
+        pending = guests[~guests["CustomerID"].isin(billings["CustomerID"].dropna())]
+        merged = pending.merge(room_table[["RoomID", "Price", "RoomType"]], on="RoomID", how="inner")
+
+        days = merged["DaysOfStay"].astype("float64")
+        rate = merged["Price"]
+        checkin = merged["RegDate"].dt.normalize()
+        checkout = checkin + pd.to_timedelta(days, unit="D")
+        eligible = (days > 0) & rate.notna() & (checkout <= pd.Timestamp.now())
+        merged, days, rate, checkin = merged[eligible], days[eligible], rate[eligible], checkin[eligible]
+
+        if merged.empty:
+            return pd.DataFrame(columns=BILL_COLS)
+
+        starts = to_day_ordinals(checkin)
+        room_charge = pd.Series(rooms.stay_charges(rate, merged["RoomType"].astype(object), starts,
+                                             starts + days.to_numpy().astype(np.int64)),
+                                index=merged.index)
+        balances = ensure_charge_index()
+        folio = merged["CustomerID"].map(lambda cid: balances.get(int(cid), 0.0)).astype("float64")
+        services = (service_charge + folio).round(2)
+        tax = ((room_charge + services) * 0.18).round(2)
+        bills = pd.DataFrame({
+            "BillingID": reserve_ids("bill", len(merged)),
+            "CustomerID": merged["CustomerID"].values,
+            "RoomID": merged["RoomID"].values,
+            "RoomCharge": room_charge.values,
+            "ServiceCharge": services.values,
+            "Tax": tax.values,
+            "Discount": discount,
+            "Total": (room_charge + services + tax - discount).round(2).values,
+            "Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }, columns=BILL_COLS)
+
+        append_records(BILLING_FILE, bills.to_dict("records"), BILL_COLS)
+        settled = bills.assign(Folio=folio.values)
+        settled = settled[settled["Folio"] != 0]
+        post_charges([
+            {"CustomerID": row.CustomerID, "Source": "Bill", "Amount": -row.Folio,
+             "Description": f"Billed on bill {row.BillingID}", "BillingID": row.BillingID}
+            for row in settled.itertuples(index=False)
+        ])
+        return bills
+
+
+def batch_billing():
+    print("\n--- Batch Bill Checked-out Guests ---")
+    bills = generate_bills_batch()
+    if bills.empty:
+        print("No checked-out guests are waiting for a bill.")
+        return
+    print(bills[["BillingID", "CustomerID", "RoomID", "Total"]].to_string(index=False))
+    print(f"\n✅ Generated {len(bills)} bills totalling ₹{bills['Total'].sum():,.2f}\n")
+
+
+# ---------------------- PAYMENT ----------------------
+def make_payment():
+    try:
+        bill_id = int(input("Enter Billing ID to pay: ").strip())
+    except ValueError:
+        print("Invalid input. Please enter a valid numeric Billing ID.")
+        return
+
+    bill = get_bill(bill_id)
+    if bill is None:
+        print("Invalid Billing ID.")
+        return
+
+    print("\n--- BILL DETAILS ---")
+    print(pd.Series(bill).to_string())
+
+    total = clean_money(pd.Series([bill["Total"]], dtype=object)).iloc[0]
+    total = 0.0 if pd.isna(total) else float(total)
+    paid = amount_paid(bill_id)
+    outstanding = round(total - paid, 2)
+    print(f"Paid so far: ₹{paid:.2f}   Outstanding: ₹{max(outstanding, 0):.2f}")
+
+    allow_duplicate = False
+    if outstanding <= PAYMENT_TOLERANCE:
+        print(f"⚠️ Bill {bill_id} is already fully paid.")
+        if input("Record another payment anyway? (yes/no): ").strip().lower() != "yes":
+            return
+        allow_duplicate = True
+
+    method = input("Enter Payment Method (Cash/UPI/Card): ").strip()
+    amount = input(f"Amount (Enter for ₹{max(outstanding, 0):.2f}): ").strip()
+    try:
+        payment = record_payment(bill_id, method, float(amount) if amount else None, allow_duplicate)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    print(f"✅ Payment of ₹{payment['AmountPaid']} for Bill ID {bill_id} recorded successfully.")
+
+
+def show_folio():
+    cid = input("Enter Customer ID: ").strip()
+    if not cid.isdigit() or customers.get_customer(int(cid)) is None:
+        print("Invalid Customer ID.")
+        return
+    folio = customer_folio(int(cid))
+    if folio.empty:
+        print("No charges on this guest's folio.")
+        return
+    print(f"\n--- GUEST FOLIO: {cid} ---")
+    print(folio[["ChargeID", "Date", "Source", "Description", "Amount", "Balance", "BillingID"]]
+          .tail(PAGE_ROWS).to_string(index=False))
+    print(f"\nUnbilled Balance: ₹{folio_balance(int(cid)):.2f}")
+
+
+def show_reconciliation():
+    df = reconcile_payments()
+    if df.empty:
+        print("No bills found.")
+        return
+    print("\n--- PAYMENT RECONCILIATION ---")
+    by_status = df.groupby("Status").agg(
+        Bills=("BillingID", "size"), Total=("Total", "sum"), Paid=("Paid", "sum"),
+        Outstanding=("Outstanding", "sum"), Overpaid=("Overpaid", "sum"),
+    )
+    print(by_status.round(2).to_string())
+    print(f"\nTotal Outstanding: ₹{df['Outstanding'].sum():.2f}")
+    print(f"Total Overpaid: ₹{df['Overpaid'].sum():.2f}")
+
+    columns = ["BillingID", "CustomerID", "Total", "Paid", "Payments", "Outstanding", "Overpaid", "Status"]
+    owing = df[df["Outstanding"] > 0].nlargest(PAGE_ROWS, "Outstanding")
+    if not owing.empty:
+        print("\nLargest Outstanding Balances:")
+        print(owing[columns].to_string(index=False))
+    over = df[df["Overpaid"] > 0].nlargest(PAGE_ROWS, "Overpaid")
+    if not over.empty:
+        print("\n⚠️ Overpaid / Duplicate-paid Bills:")
+        print(over[columns].to_string(index=False))
+    orphans = orphan_payments()
+    if not orphans.empty:
+        print(f"\n⚠️ {len(orphans)} payment(s) reference unknown bills:")
+        print(orphans.head(PAGE_ROWS).to_string(index=False))
+
+
+def view_bills():
+    page_table(BILLING_FILE, "ALL BILLS", "No bills found.")
+
+
+def view_payments():
+    page_table(PAYMENT_FILE, "ALL PAYMENTS", "No payments found.")
+
+
+# ---------------------- BILLING MENU ----------------------
+def billing_menu():
+    while True:
+        print("""
+==================== BILLING & PAYMENTS ====================
+1. Generate Bill
+2. Batch Bill Checked-out Guests
+3. Make Payment
+4. View Bills
+5. View Payments
+6. Reconcile Payments
+7. Guest Folio
+8. Back
+============================================================
+""")
+        ch = input("Enter your choice: ").strip()
+        if ch == "1":
+            generate_bill()
+        elif ch == "2":
+            batch_billing()
+        elif ch == "3":
+            make_payment()
+        elif ch == "4":
+            view_bills()
+        elif ch == "5":
+            view_payments()
+        elif ch == "6":
+            show_reconciliation()
+        elif ch == "7":
+            show_folio()
+        elif ch == "8":
+            break
+        else:
+            print("Invalid choice.")
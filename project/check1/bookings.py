@@ -0,0 +1,320 @@
+import pandas as pd
+import numpy as np
+from datetime import date
+import os
+import bisect
+
+from storage import (
+    BOOK_COLUMNS, BOOKING_DATE_FORMAT, BOOKING_FILE, NO_DAY, PAGE_ROWS,
+    ROOM_COLUMNS, ROOM_FILE, append_record, append_records, atomic_write_csv,
+    booking_stays, canonical_categories, day_number, find_rows, load_csv,
+    next_id, page_table, parse_booking_date, parse_dates, reserve_ids,
+    table_lock, table_stamp, to_day_ordinals, update_rows,
+)
+
+import analytics
+import rooms
+
+# Columns of a group / OTA booking import for batch room assignment
+# (RequestID is optional and defaults to the row number).
+ASSIGN_REQUEST_COLUMNS = ["CustomerName", "RoomType", "CheckIn", "CheckOut"]
+# Stands in for "no stay before / after" when working with free windows.
+OPEN_END = 10 ** 9
+
+# RoomID -> (starts, ends): sorted, non-overlapping busy intervals as day
+# numbers (check-out day itself is free). Built once from bookings.csv and
+# then kept current by make_booking, so availability never rescans bookings.
+AVAILABILITY_INDEX = {}
+AVAILABILITY_STATE = {"stamp": None}
+
+
+# ==========================================================
+# 📘 BOOKING MANAGEMENT
+# ==========================================================
+def build_availability_index():
+    """Rebuilds AVAILABILITY_INDEX from the whole bookings table in one vectorized pass."""
+    # Stamp and read together, so a booking appended by another terminal
+    # right after our read still makes the stamp look stale.
+    with table_lock(BOOKING_FILE, shared=True):
+        stamp = table_stamp(BOOKING_FILE)
+        room_ids, starts, ends = booking_stays()
+    frame = pd.DataFrame({"RoomID": room_ids, "start": starts, "end": ends})
+    frame = frame.sort_values(["RoomID", "start"], kind="mergesort")
+
+    # Merge overlapping stays per room: a new interval begins wherever the
+    # start is past the furthest end seen so far for that room.
+    reach = frame.groupby("RoomID")["end"].cummax().groupby(frame["RoomID"]).shift()
+    segment = (reach.isna() | (frame["start"] >= reach)).cumsum()
+    merged = frame.groupby(segment).agg(
+        RoomID=("RoomID", "first"), start=("start", "min"), end=("end", "max")
+    )
+
+    AVAILABILITY_INDEX.clear()
+    for room_id, grp in merged.groupby("RoomID", sort=False):
+        AVAILABILITY_INDEX[room_id] = (grp["start"].tolist(), grp["end"].tolist())
+    AVAILABILITY_STATE["stamp"] = stamp
+
+
+def ensure_availability_index():
+    """Rebuilds the index only if bookings changed behind our back (e.g. another terminal)."""
+    if AVAILABILITY_STATE["stamp"] is None or AVAILABILITY_STATE["stamp"] != table_stamp(BOOKING_FILE):
+        build_availability_index()
+
+
+def room_is_free(room_id, start, end):
+    """True if the room has no stay overlapping the nights [start, end)."""
+    starts, ends = AVAILABILITY_INDEX.get(str(room_id), ([], []))
+    i = bisect.bisect_left(starts, end)
+    return i == 0 or ends[i - 1] <= start
+
+
+def add_to_availability_index(room_id, start, end):
+    """Adds one stay to the index, merging it with any stays it touches."""
+    starts, ends = AVAILABILITY_INDEX.setdefault(str(room_id), ([], []))
+    lo = bisect.bisect_right(ends, start)
+    hi = bisect.bisect_left(starts, end)
+    if lo < hi:
+        start = min(start, starts[lo])
+        end = max(end, ends[hi - 1])
+    starts[lo:hi] = [start]
+    ends[lo:hi] = [end]
+
+
+def in_service(rooms):
+    """Mask of rooms that can take bookings (not under maintenance or out of order)."""
+    return rooms["Status"].astype(str).str.lower().isin(["available", "booked"])
+
+
+def free_rooms(rooms, start, end):
+    """Rooms with no booking overlapping [start, end). Out-of-service rooms are excluded."""
+    ensure_availability_index()
+    free = rooms["RoomID"].map(lambda rid: room_is_free(rid, start, end))
+    return rooms[in_service(rooms) & free]
+
+
+def create_booking(room_id, customer_name, check_in, check_out):
+    """
+    Books a room for [check_in, check_out) (dd-mm-yyyy strings).
+    Raises ValueError if the dates are invalid or the room is taken.
+    Returns the saved booking record.
+    """
+    start, end = parse_booking_date(check_in), parse_booking_date(check_out)
+    if start is None or end is None or end <= start:
+        raise ValueError("Invalid dates. Use dd-mm-yyyy with check-out after check-in.")
+    room_id = str(room_id).strip()
+    room = find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id)
+    if room.empty:
+        raise ValueError("Invalid Room ID.")
+
+    # The availability check and the append must be atomic across terminals,
+    # otherwise two clerks can both see the room free and double-book it.
+    with table_lock(BOOKING_FILE):
+        ensure_availability_index()
+        if not room_is_free(room_id, start, end):
+            raise ValueError("Room is already booked for overlapping dates.")
+
+        # In-place updates are only valid if nothing was written since the
+        # rollups / rate table were built; otherwise they rebuild on next use.
+        stamp = analytics.revenue_stamp()
+        rollups_current = analytics.REVENUE_ROLLUPS["stamp"] == stamp
+        rates_current = rooms.RATE_TABLE["stamp"] == stamp
+        booking_id = next_id("booking")
+        record = dict(zip(BOOK_COLUMNS, [booking_id, customer_name, room_id, check_in, check_out]))
+        append_record(BOOKING_FILE, record, BOOK_COLUMNS)
+        add_to_availability_index(room_id, start, end)
+        AVAILABILITY_STATE["stamp"] = table_stamp(BOOKING_FILE)
+
+        # Status only describes tonight now; future stays live in the index.
+        if start <= day_number(date.today()) < end:
+            update_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id, {"Status": "Booked"})
+        # Revenue is priced from the rate table, so it can only be updated in
+        # place if this booking did not move the rates of stays already booked.
+        rates_kept = rates_current and rooms.add_booking_rates(room.iloc[0], start, end)
+        if rollups_current and rates_kept:
+            analytics.add_booking_revenue(room.iloc[0], start, end)
+    return record
+
+
+def list_bookings():
+    return load_csv(BOOKING_FILE, BOOK_COLUMNS)
+
+
+def make_booking():
+    if rooms.list_rooms().empty:
+        print("❌ No rooms available.")
+        return
+    check_in = input("Enter Check-in (dd-mm-yyyy): ").strip()
+    check_out = input("Enter Check-out (dd-mm-yyyy): ").strip()
+    try:
+        available = rooms.list_available_rooms(check_in, check_out)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+
+    if available.empty:
+        print("❌ No rooms available for these dates.")
+        return
+    print(rooms.quote_rooms(available, check_in, check_out).to_string(index=False))
+    room_id = input("Enter Room ID: ").strip()
+    if room_id not in available["RoomID"].values:
+        print("❌ Invalid Room ID.")
+        return
+    name = input("Enter Customer Name: ").strip()
+
+    # Another terminal may have taken the room while we were typing;
+    # create_booking re-checks against the index.
+    try:
+        record = create_booking(room_id, name, check_in, check_out)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ Booking Confirmed! ID: {record['BookingID']}")
+
+
+def view_all_bookings():
+    page_table(BOOKING_FILE, "ALL BOOKINGS", "No bookings yet.")
+
+
+# ---------------------- BATCH ROOM ASSIGNMENT ----------------------
+def free_gaps(room_ids, lo, hi):
+    """
+    Free windows (gap_start, gap_end, RoomID) of the given rooms that overlap
+    the nights [lo, hi), read from AVAILABILITY_INDEX and sorted by gap_start.
+    """
+    gaps = []
+    for room_id in room_ids:
+        starts, ends = AVAILABILITY_INDEX.get(room_id, ([], []))
+        i = bisect.bisect_right(ends, lo)
+        j = bisect.bisect_left(starts, hi)
+        free_from = ends[i - 1] if i else -OPEN_END
+        for k in range(i, j):
+            if starts[k] > free_from:
+                gaps.append((free_from, starts[k], room_id))
+            free_from = max(free_from, ends[k])
+        gaps.append((free_from, starts[j] if j < len(starts) else OPEN_END, room_id))
+    gaps.sort()
+    return gaps
+
+
+def assign_rooms(requests, rooms):
+    """
+    Picks a concrete room for every request (RoomType, CheckIn, CheckOut as
+    dd-mm-yyyy) without booking anything. Requests of a type are taken in
+    order of check-out, each going to the free window that opened most
+    recently before its check-in (best fit): that leaves the fewest idle
+    nights between stays and accepts as many requests as the rooms allow.
+    A window that closes before the current check-out can never be used by
+    a later request either, so it is dropped the first time it is passed.
+    Out-of-service rooms are never chosen, as in free_rooms.
+    Expects AVAILABILITY_INDEX to be current. Returns the requests with
+    start/end day numbers, the chosen RoomID and a Reason for the rest.
+    """
+    result = requests.reset_index(drop=True).copy()
+    starts = parse_dates(result["CheckIn"], [BOOKING_DATE_FORMAT])
+    ends = parse_dates(result["CheckOut"], [BOOKING_DATE_FORMAT])
+    result["start"] = to_day_ordinals(starts)
+    result["end"] = to_day_ordinals(ends)
+    result["RoomType"] = wanted = canonical_categories(result["RoomType"], "RoomType")
+
+    rooms = rooms.assign(RoomID=rooms["RoomID"].astype(str).str.strip()).drop_duplicates("RoomID")
+    room_types = canonical_categories(rooms["RoomType"], "RoomType")
+    usable = in_service(rooms).to_numpy()
+    by_type = rooms[usable].groupby(room_types[usable].to_numpy())["RoomID"].apply(list).to_dict()
+
+    valid = (result["start"] != NO_DAY) & (result["end"] != NO_DAY) & (result["end"] > result["start"])
+    known = wanted.isin(room_types.dropna().unique()).fillna(False).astype(bool)
+    reason = np.where(~valid, "Invalid dates", np.where(~known, "Unknown room type", "No room free"))
+    chosen = np.full(len(result), None, dtype=object)
+
+    todo = result[valid & known].sort_values(["end", "start"], kind="mergesort")
+    for room_type, grp in todo.groupby("RoomType", sort=False):
+        gaps = free_gaps(by_type.get(room_type, []), int(grp["start"].min()), int(grp["end"].max()))
+        for row, start, end in zip(grp.index, grp["start"].astype(int), grp["end"].astype(int)):
+            pos = bisect.bisect_right(gaps, (start, OPEN_END + 1))
+            while pos:
+                pos -= 1
+                gap_start, gap_end, room_id = gaps[pos]
+                if gap_end < end:
+                    del gaps[pos]
+                    continue
+                del gaps[pos]
+                if end < gap_end:
+                    bisect.insort(gaps, (end, gap_end, room_id))
+                chosen[row] = room_id
+                break
+
+    result["RoomID"] = chosen
+    result["Reason"] = np.where(pd.notna(chosen), "", reason)
+    return result
+
+
+def book_assignments(requests):
+    """
+    Assigns rooms to a batch of requests and books all the assigned ones in
+    a single append, holding the bookings lock throughout so no terminal can
+    take a chosen room in between. Returns (booked, rejected) DataFrames.
+    """
+    room_list = rooms.list_rooms()
+    with table_lock(BOOKING_FILE):
+        ensure_availability_index()
+        result = assign_rooms(requests, room_list)
+        booked = result[result["RoomID"].notna()].copy()
+        rejected = result[result["RoomID"].isna()].drop(columns=["start", "end", "RoomID"])
+        if booked.empty:
+            return booked, rejected
+
+        booked.insert(0, "BookingID", reserve_ids("booking", len(booked)))
+        booked["CheckIn"] = pd.to_datetime(booked["start"], unit="D").dt.strftime(BOOKING_DATE_FORMAT)
+        booked["CheckOut"] = pd.to_datetime(booked["end"], unit="D").dt.strftime(BOOKING_DATE_FORMAT)
+        append_records(BOOKING_FILE, booked[BOOK_COLUMNS].to_dict("records"), BOOK_COLUMNS)
+        for room_id, start, end in zip(booked["RoomID"], booked["start"], booked["end"]):
+            add_to_availability_index(room_id, int(start), int(end))
+        AVAILABILITY_STATE["stamp"] = table_stamp(BOOKING_FILE)
+        # Revenue rollups and the rate table see the new stamp and rebuild
+        # once on next use, which beats folding in thousands of stays.
+
+        today = day_number(date.today())
+        tonight = booked.loc[(booked["start"] <= today) & (booked["end"] > today), "RoomID"]
+        for room_id in tonight.unique():
+            update_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id, {"Status": "Booked"})
+    return booked.drop(columns=["start", "end", "Reason"]), rejected
+
+
+def load_assignment_requests(path):
+    """Reads a booking import (CSV with ASSIGN_REQUEST_COLUMNS) as text."""
+    requests = pd.read_csv(path, dtype=str, skipinitialspace=True)
+    missing = [col for col in ASSIGN_REQUEST_COLUMNS if col not in requests.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    if "RequestID" not in requests.columns:
+        requests.insert(0, "RequestID", [str(n) for n in range(1, len(requests) + 1)])
+    return requests[["RequestID"] + ASSIGN_REQUEST_COLUMNS]
+
+
+def batch_assign_rooms():
+    print("\n--- Batch Room Assignment ---")
+    print(f"CSV columns: RequestID (optional), {', '.join(ASSIGN_REQUEST_COLUMNS)} (dd-mm-yyyy)")
+    path = input("Enter import file path: ").strip()
+    try:
+        requests = load_assignment_requests(path)
+    except (OSError, ValueError, pd.errors.ParserError) as e:
+        print(f"❌ Could not read requests: {e}")
+        return
+    if requests.empty:
+        print("❌ No requests in file.")
+        return
+
+    booked, rejected = book_assignments(requests)
+    print(f"\n✅ Booked {len(booked)} of {len(requests)} requests.")
+    if not booked.empty:
+        print(booked[["RequestID", "BookingID", "CustomerName", "RoomType", "RoomID",
+                      "CheckIn", "CheckOut"]].head(PAGE_ROWS).to_string(index=False))
+        if len(booked) > PAGE_ROWS:
+            print(f"... and {len(booked) - PAGE_ROWS} more")
+    if not rejected.empty:
+        print(f"\n⚠️ {len(rejected)} request(s) could not be booked:")
+        print(rejected.head(PAGE_ROWS).to_string(index=False))
+
+    out = os.path.splitext(path)[0] + "_assigned.csv"
+    atomic_write_csv(out, pd.concat([booked, rejected], ignore_index=True))
+    print(f"📄 Full results written to {out}")
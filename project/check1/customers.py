@@ -0,0 +1,718 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+import os
+import bisect
+import re
+
+from storage import (
+    CSV_FILE, CUSTOMER_COLUMNS, CUSTOMER_FILE, REG_DATE_FORMATS, append_record,
+    append_records, apply_schema, ConflictError, delete_rows, load_columns,
+    load_csv, next_id, page_table, parse_dates, reserve_ids, row_version,
+    save_csv, table_lock, table_stamp, update_rows,
+)
+
+# Customer search index: hash maps on ID / phone / email, a sorted list of
+# (name token, ID) for prefix search and trigram posting sets for substring
+# and fuzzy name search. Rebuilt when customers.csv changes behind our back,
+# otherwise kept current by create/edit/remove_customer.
+CUSTOMER_INDEX = {
+    "stamp": None, "rows": {}, "by_phone": {}, "by_email": {}, "tokens": [], "trigrams": {},
+}
+
+
+# ==========================================================
+# 🧾 CUSTOMER MANAGEMENT (from customer.py)
+#======================TANVI================================
+# ==========================================================
+def load_data():
+    """Loads the customer data safely, creating the CSV if missing."""
+    df = load_csv(CUSTOMER_FILE, CUSTOMER_COLUMNS)
+    for col in CUSTOMER_COLUMNS:
+        if col not in df.columns:
+            df[col] = pd.NA
+
+    return apply_schema(df, CUSTOMER_FILE)
+
+
+def save_data(df):
+    """Saves customer data safely to CSV."""
+    out = df.copy()
+    save_csv(CSV_FILE, out)
+
+
+# ==========================================================
+# VALIDATION FUNCTIONS
+# ==========================================================
+# Shared by the single-record validators and the vectorized bulk versions.
+PHONE_PATTERN = r"[0-9]{10}"
+EMAIL_PATTERN = r".*@[^@]*\.[^@]*"   # an "@" with a "." somewhere after the last one
+
+
+def validate_phone(phone):
+    """Ensures phone number is exactly 10 digits."""
+    return isinstance(phone, str) and re.fullmatch(PHONE_PATTERN, phone) is not None
+
+
+def validate_email(email):
+    """Checks basic email pattern."""
+    return isinstance(email, str) and re.fullmatch(EMAIL_PATTERN, email) is not None
+
+
+def valid_phones(phones):
+    """validate_phone over a whole column at once. Returns a boolean Series."""
+    return phones.astype("string").str.fullmatch(PHONE_PATTERN).fillna(False).astype(bool)
+
+
+def valid_emails(emails):
+    """validate_email over a whole column at once. Returns a boolean Series."""
+    return emails.astype("string").str.fullmatch(EMAIL_PATTERN).fillna(False).astype(bool)
+
+
+def parse_reg_dates(values):
+    """Parses a RegDate column in any of REG_DATE_FORMATS; unparseable values become NaT."""
+    return parse_dates(values, REG_DATE_FORMATS)
+
+
+def validate_reg_date(reg_date):
+    """Checks a RegDate is in YYYY-MM-DD HH:MM:SS form."""
+    try:
+        datetime.strptime(reg_date, "%Y-%m-%d %H:%M:%S")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+# ==========================================================
+# ID GENERATION
+# ==========================================================
+def generate_customer_id(df=None):
+    #Auto-generates unique Customer ID from the persistent sequence (no table scan).
+    return next_id("customer")
+
+'''
+import numpy as np
+import pandas as pd
+
+df = load_csv(CUSTOMER_FILE,COLUMNS)
+def generate_customer_id(df, column="CustomerID", start=1001):
+    if df is None or df.empty or column not in df.columns:
+        return start
+    
+    # Convert to numeric safely, ignoring missing/non-numeric values
+    ids = pd.to_numeric(df[column], errors='coerce').dropna().astype(int)
+    if ids.empty:
+        return start
+    else:
+        return ids.max() + 1'''
+
+
+# ==========================================================
+# CUSTOMER SEARCH INDEX
+# ==========================================================
+def customer_key(cid):
+    """Normalises a CustomerID ("1001", "1001.0", 1001) to an int, or None."""
+    try:
+        return int(float(cid))
+    except (TypeError, ValueError):
+        return None
+
+
+def name_trigrams(name):
+    text = str(name).lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _stored_text(value):
+    # What a value looks like once written to and read back from the CSV.
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return np.nan
+    return str(value)
+
+
+def _index_add(record):
+    _index_add_many([record])
+
+
+def _index_add_many(records):
+    """Adds new/changed customer records (dicts) to CUSTOMER_INDEX."""
+    index = CUSTOMER_INDEX
+    new_tokens = []
+    for record in records:
+        cid = customer_key(record.get("CustomerID"))
+        if cid is None:
+            continue
+        record = {col: _stored_text(record.get(col)) for col in CUSTOMER_COLUMNS}
+        index["rows"][cid] = record
+        if isinstance(record["Phone"], str):
+            index["by_phone"].setdefault(record["Phone"], set()).add(cid)
+        if isinstance(record["Email"], str):
+            index["by_email"].setdefault(record["Email"].lower(), set()).add(cid)
+        if isinstance(record["Name"], str):
+            new_tokens.extend((token, cid) for token in set(record["Name"].lower().split()))
+            for gram in name_trigrams(record["Name"]):
+                index["trigrams"].setdefault(gram, set()).add(cid)
+
+    # One insort per token for single records; for batches a merge of the
+    # two sorted runs (timsort) is far cheaper than thousands of insorts.
+    if len(new_tokens) <= 4:
+        for token in new_tokens:
+            bisect.insort(index["tokens"], token)
+    else:
+        index["tokens"].extend(new_tokens)
+        index["tokens"].sort()
+
+
+def _index_remove(cid):
+    index = CUSTOMER_INDEX
+    record = index["rows"].pop(cid, None)
+    if record is None:
+        return
+    for table, value in ((index["by_phone"], record["Phone"]), (index["by_email"], record["Email"])):
+        if not isinstance(value, str):
+            continue
+        key = value.lower() if table is index["by_email"] else value
+        ids = table.get(key, set())
+        ids.discard(cid)
+        if not ids:
+            table.pop(key, None)
+    if isinstance(record["Name"], str):
+        for token in set(record["Name"].lower().split()):
+            i = bisect.bisect_left(index["tokens"], (token, cid))
+            if i < len(index["tokens"]) and index["tokens"][i] == (token, cid):
+                index["tokens"].pop(i)
+        for gram in name_trigrams(record["Name"]):
+            index["trigrams"].get(gram, set()).discard(cid)
+
+
+def build_customer_index():
+    """Rebuilds CUSTOMER_INDEX from the whole customers table."""
+    with table_lock(CUSTOMER_FILE, shared=True):
+        stamp = table_stamp(CUSTOMER_FILE)
+        df = load_csv(CUSTOMER_FILE, CUSTOMER_COLUMNS)
+    rows, by_phone, by_email, tokens, trigrams = {}, {}, {}, [], {}
+    for record in df.to_dict("records"):
+        cid = customer_key(record.get("CustomerID"))
+        if cid is None:
+            continue
+        rows[cid] = record
+        phone, email, name = record.get("Phone"), record.get("Email"), record.get("Name")
+        if isinstance(phone, str):
+            by_phone.setdefault(phone, set()).add(cid)
+        if isinstance(email, str):
+            by_email.setdefault(email.lower(), set()).add(cid)
+        if isinstance(name, str):
+            tokens.extend((token, cid) for token in set(name.lower().split()))
+            for gram in name_trigrams(name):
+                trigrams.setdefault(gram, set()).add(cid)
+    tokens.sort()  # one sort instead of an insort per row
+    CUSTOMER_INDEX.update(rows=rows, by_phone=by_phone, by_email=by_email,
+                          tokens=tokens, trigrams=trigrams, stamp=stamp)
+
+
+def ensure_customer_index():
+    if CUSTOMER_INDEX["stamp"] is None or CUSTOMER_INDEX["stamp"] != table_stamp(CUSTOMER_FILE):
+        build_customer_index()
+    return CUSTOMER_INDEX
+
+
+def customer_ids_by_prefix(prefix):
+    """IDs of customers with a name word starting with prefix (case-insensitive)."""
+    tokens = ensure_customer_index()["tokens"]
+    prefix = prefix.lower()
+    ids = set()
+    for token, cid in tokens[bisect.bisect_left(tokens, (prefix,)):]:
+        if not token.startswith(prefix):
+            break
+        ids.add(cid)
+    return ids
+
+
+def customer_ids_by_substring(fragment):
+    """IDs of customers whose name contains fragment (case-insensitive)."""
+    index = ensure_customer_index()
+    fragment = fragment.lower()
+    if len(fragment) < 3:
+        return customer_ids_by_prefix(fragment)
+    # Intersect the rarest posting sets first, then confirm the candidates.
+    postings = sorted((index["trigrams"].get(g, set()) for g in name_trigrams(fragment)), key=len)
+    candidates = set(postings[0]).intersection(*postings[1:])
+    rows = index["rows"]
+    return {cid for cid in candidates if fragment in str(rows[cid]["Name"]).lower()}
+
+
+def fuzzy_customer_ids(text, limit=10, min_score=0.3):
+    """
+    IDs of the customers whose names share the most trigrams with text
+    (Jaccard similarity), best first. Catches typos like "Sharam".
+    """
+    index = ensure_customer_index()
+    grams = name_trigrams(text)
+    if not grams:
+        return []
+    shared = {}
+    for gram in grams:
+        for cid in index["trigrams"].get(gram, ()):
+            shared[cid] = shared.get(cid, 0) + 1
+    scored = []
+    for cid, common in shared.items():
+        score = common / (len(grams) + len(name_trigrams(index["rows"][cid]["Name"])) - common)
+        if score >= min_score:
+            scored.append((-score, cid))
+    return [cid for _, cid in sorted(scored)[:limit]]
+
+
+def customers_frame(ids):
+    """The indexed customers with the given IDs as a typed DataFrame, ordered by ID."""
+    rows = CUSTOMER_INDEX["rows"]
+    records = [rows[cid] for cid in sorted(ids) if cid in rows]
+    return apply_schema(pd.DataFrame(records, columns=CUSTOMER_COLUMNS), CUSTOMER_FILE)
+
+
+# ==========================================================
+# CUSTOMER API (no input/print — the menus below wrap these)
+# ==========================================================
+def create_customer(name, phone, email, room_id=None, days_of_stay=None):
+    """Registers a new customer and returns the saved record. Raises ValueError on bad input."""
+    name = (name or "").strip()
+    if not name:
+        raise ValueError("Name cannot be empty.")
+    if not validate_phone(phone):
+        raise ValueError("Invalid phone!")
+    if not validate_email(email):
+        raise ValueError("Invalid email!")
+
+    if days_of_stay is None:
+        days_of_stay = int(np.random.randint(1, 31))
+
+    # Duplicate check and append happen under one lock so two terminals
+    # cannot register the same phone twice.
+    with table_lock(CUSTOMER_FILE):
+        if ensure_customer_index()["by_phone"].get(phone):
+            raise ValueError("Phone already exists! Not adding.")
+
+        record = {
+            "CustomerID": generate_customer_id(),
+            "Name": name,
+            "Phone": phone,
+            "Email": email,
+            "RoomID": room_id if room_id else pd.NA,
+            "DaysOfStay": int(days_of_stay),
+            "RegDate": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        append_record(CUSTOMER_FILE, record, CUSTOMER_COLUMNS)
+        _index_add(record)
+        CUSTOMER_INDEX["stamp"] = table_stamp(CUSTOMER_FILE)
+    return record
+
+
+def find_customers(key, df=None):
+    """
+    Customers matching an ID / phone / email (exact) or a name fragment
+    (case-insensitive; fragments under 3 letters match the start of a name word).
+    Answered from the search index; pass df to search a given frame instead.
+    """
+    key = str(key).strip()
+    if df is not None:
+        if key.isdigit():
+            return df[(df["CustomerID"] == int(key)) | (df["Phone"] == key)]
+        return df[df["Name"].str.contains(key, case=False, na=False, regex=False)]
+
+    index = ensure_customer_index()
+    if key.isdigit():
+        ids = set(index["by_phone"].get(key, set()))
+        if int(key) in index["rows"]:
+            ids.add(int(key))
+    elif "@" in key:
+        ids = index["by_email"].get(key.lower(), set())
+    else:
+        ids = customer_ids_by_substring(key) if key else set(index["rows"])
+    return customers_frame(ids)
+
+
+def suggest_customers(key, limit=5):
+    """Closest name matches for a search that found nothing."""
+    ensure_customer_index()
+    return customers_frame(fuzzy_customer_ids(key, limit=limit))
+
+
+def get_customer(cid):
+    """Returns one customer as a dict, or None."""
+    record = ensure_customer_index()["rows"].get(customer_key(cid))
+    return None if record is None else dict(record)
+
+
+def edit_customer(cid, phone=None, email=None, room_id=None, days_of_stay=None, reg_date=None,
+                  expected_version=None):
+    """
+    Updates the given fields of a customer. Returns the applied changes.
+    Pass the row_version read with the customer to refuse (ConflictError)
+    an edit based on stale data.
+    """
+    if get_customer(cid) is None:
+        raise ValueError("Customer not found.")
+
+    changes = {}
+    if phone:
+        if not validate_phone(phone):
+            raise ValueError("Invalid phone, not updated.")
+        changes["Phone"] = phone
+    if email:
+        if not validate_email(email):
+            raise ValueError("Invalid email, not updated.")
+        changes["Email"] = email
+    if room_id:
+        changes["RoomID"] = room_id
+    if days_of_stay is not None:
+        if int(days_of_stay) < 0:
+            raise ValueError("Invalid stay days, not updated.")
+        changes["DaysOfStay"] = int(days_of_stay)
+    if reg_date:
+        if not validate_reg_date(reg_date):
+            raise ValueError("Invalid datetime format! Use YYYY-MM-DD HH:MM:SS")
+        changes["RegDate"] = reg_date
+
+    if changes:
+        with table_lock(CUSTOMER_FILE):
+            ensure_customer_index()
+            update_rows(CUSTOMER_FILE, CUSTOMER_COLUMNS, "CustomerID", cid, changes, expected_version)
+            record = dict(CUSTOMER_INDEX["rows"][customer_key(cid)], **changes)
+            _index_remove(customer_key(cid))
+            _index_add(record)
+            CUSTOMER_INDEX["stamp"] = table_stamp(CUSTOMER_FILE)
+    return changes
+
+
+def remove_customer(cid):
+    """Deletes a customer. Returns True if a row was removed."""
+    with table_lock(CUSTOMER_FILE):
+        ensure_customer_index()
+        removed = delete_rows(CUSTOMER_FILE, CUSTOMER_COLUMNS, "CustomerID", cid) > 0
+        _index_remove(customer_key(cid))
+        CUSTOMER_INDEX["stamp"] = table_stamp(CUSTOMER_FILE)
+    return removed
+
+
+def customer_stay_stats():
+    """Stay-duration statistics as a dict, or None when there is no data."""
+    arr = load_columns(CUSTOMER_FILE, ["DaysOfStay"])["DaysOfStay"].dropna().to_numpy(dtype=float)
+    if arr.size == 0:
+        return None
+    return {
+        "guests": int(len(arr)),
+        "avg": float(np.mean(arr)),
+        "max": float(np.max(arr)),
+        "min": float(np.min(arr)),
+    }
+
+
+# ==========================================================
+# BULK IMPORT
+# ==========================================================
+IMPORT_CHUNK_ROWS = 10_000
+
+
+def read_import_chunks(path, chunk_size=IMPORT_CHUNK_ROWS):
+    """Streams a .csv or .jsonl/.json (one object per line) file as text DataFrames."""
+    if path.lower().endswith((".jsonl", ".json", ".ndjson")):
+        reader = pd.read_json(path, lines=True, chunksize=chunk_size, dtype=False)
+    else:
+        reader = pd.read_csv(path, dtype=str, chunksize=chunk_size, skipinitialspace=True)
+    for chunk in reader:
+        yield chunk.astype("string")
+
+
+def validate_import_chunk(chunk, known_phones):
+    """
+    Returns (accepted, rejected) for one chunk. Columns are matched to
+    CUSTOMER_COLUMNS case-insensitively; every check is a column operation.
+    known_phones is the set of phones already registered (or accepted
+    earlier in this import) and is extended with the accepted ones.
+    """
+    names = {col.lower(): col for col in CUSTOMER_COLUMNS}
+    chunk = chunk.rename(columns=lambda c: names.get(str(c).strip().lower(), c))
+    given = list(chunk.columns)
+    for col in CUSTOMER_COLUMNS:
+        if col not in chunk.columns:
+            chunk[col] = pd.NA
+    for col in ["Name", "Phone", "Email", "RoomID"]:
+        chunk[col] = chunk[col].str.strip()
+
+    reg = parse_reg_dates(chunk["RegDate"])
+    days = pd.to_numeric(chunk["DaysOfStay"], errors="coerce")
+
+    # Checks run in order; each row keeps the first reason it failed.
+    checks = [
+        ("missing name", chunk["Name"].fillna("") == ""),
+        ("invalid phone", ~valid_phones(chunk["Phone"])),
+        ("invalid email", ~valid_emails(chunk["Email"])),
+        ("invalid RegDate", chunk["RegDate"].notna() & reg.isna()),
+        ("invalid DaysOfStay", chunk["DaysOfStay"].notna() & ~((days >= 0) & (days % 1 == 0))),
+        ("phone already exists", chunk["Phone"].isin(known_phones).fillna(False)),
+    ]
+    reason = pd.Series(pd.NA, index=chunk.index, dtype="string")
+    for label, failed in checks:
+        reason = reason.mask(reason.isna() & failed.astype(bool), label)
+    # Only the first otherwise-valid row of a repeated phone is kept.
+    repeated = chunk["Phone"].where(reason.isna()).duplicated(keep="first") & reason.isna()
+    reason = reason.mask(repeated, "duplicate phone in file")
+
+    ok = reason.isna()
+    accepted = chunk.loc[ok, CUSTOMER_COLUMNS].copy()
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    accepted["RegDate"] = reg[ok].dt.strftime("%Y-%m-%d %H:%M:%S").fillna(now)
+    accepted["DaysOfStay"] = days[ok].astype("Int64")
+    known_phones.update(accepted["Phone"].tolist())
+
+    rejected = chunk.loc[~ok, given].copy()
+    rejected["Reason"] = reason[~ok]
+    return accepted, rejected
+
+
+def import_customers(path, reject_path=None, chunk_size=IMPORT_CHUNK_ROWS):
+    """
+    Bulk-imports guests from a CSV/JSONL file in one streaming pass.
+    Each chunk is validated column-wise, deduplicated against the phone
+    index, given a block of IDs and appended in one write; rejected rows go to
+    reject_path (default <path>.rejects.csv) with their line number and reason.
+    Returns a summary dict.
+    """
+    if not os.path.exists(path):
+        raise ValueError(f"File not found: {path}")
+    reject_path = reject_path or path + ".rejects.csv"
+    if os.path.exists(reject_path):
+        os.remove(reject_path)
+
+    summary = {"read": 0, "imported": 0, "rejected": 0, "reject_file": None}
+    known_phones = None
+    line = 2 if not path.lower().endswith((".jsonl", ".json", ".ndjson")) else 1
+    for chunk in read_import_chunks(path, chunk_size):
+        chunk.index = pd.RangeIndex(line, line + len(chunk), name="Line")
+        line += len(chunk)
+        summary["read"] += len(chunk)
+
+        with table_lock(CUSTOMER_FILE):
+            index = ensure_customer_index()
+            if known_phones is None:
+                known_phones = set(index["by_phone"])
+            accepted, rejected = validate_import_chunk(chunk, known_phones)
+            if not accepted.empty:
+                accepted["CustomerID"] = reserve_ids("customer", len(accepted))
+                records = accepted.astype(object).where(accepted.notna(), None).to_dict("records")
+                append_records(CUSTOMER_FILE, records, CUSTOMER_COLUMNS)
+                _index_add_many(records)
+                CUSTOMER_INDEX["stamp"] = table_stamp(CUSTOMER_FILE)
+        summary["imported"] += len(accepted)
+
+        if not rejected.empty:
+            rejected.to_csv(reject_path, mode="a", header=summary["rejected"] == 0)
+            summary["rejected"] += len(rejected)
+            summary["reject_file"] = reject_path
+    return summary
+
+
+# ==========================================================
+# CRUD OPERATIONS
+# ==========================================================
+def add_customer(df):
+    """Adds a new customer entry."""
+    name = input("Enter Name: ").strip()
+    while not name:
+        name = input("Name cannot be empty. Enter Name: ").strip()
+
+    while True:
+        phone = input("Enter Phone (10 digits): ").strip()
+        if validate_phone(phone):
+            break
+        print("Invalid phone!")
+
+    while True:
+        email = input("Enter Email: ").strip()
+        if validate_email(email):
+            break
+        print("Invalid email!")
+
+    room = input("Enter Room ID (if any): ").strip() or None
+
+    stay = input("Stay Duration (days) — leave blank for auto: ").strip()
+    staydays = int(stay) if stay.isdigit() else None
+
+    try:
+        record = create_customer(name, phone, email, room, staydays)
+    except ValueError as e:
+        print(e)
+        return df
+
+    if not stay.isdigit():
+        print(f"Auto-assigned Stay Days: {record['DaysOfStay']}")
+    print(f"\nAssigned Customer ID: {record['CustomerID']}")
+    print("✅ Customer added.\n")
+    return load_data()
+
+
+def view_customers(df=None):
+    """Displays all customers, one page at a time."""
+    page_table(CUSTOMER_FILE, "CUSTOMER LIST", "\nNo customers found.\n")
+
+
+def search_customer(df):
+    """Search for a customer by ID, name, or phone."""
+    key = input("Search by ID / Phone / Email / Name: ").strip()
+    result = find_customers(key)
+
+    if result.empty:
+        print("No record found.\n")
+        suggestions = suggest_customers(key) if not key.isdigit() else pd.DataFrame()
+        if not suggestions.empty:
+            print("Did you mean:")
+            print(suggestions[["CustomerID", "Name", "Phone"]].to_string(index=False), "\n")
+    else:
+        print(result.to_string(index=False), "\n")
+
+
+def update_customer(df):
+    """Update customer details including stay duration and reg date."""
+    cid = input("Enter Customer ID to update: ").strip()
+    if not cid.isdigit():
+        print("Invalid ID.")
+        return df
+    cid = int(cid)
+
+    current = get_customer(cid)
+    if current is None:
+        print("Customer not found.\n")
+        return df
+    version = row_version(current, CUSTOMER_COLUMNS)
+
+    changes = {}
+    print("Leave blank to keep same value.")
+
+    new_phone = input(f"New Phone [{current['Phone']}]: ").strip()
+    if new_phone:
+        if validate_phone(new_phone):
+            changes["phone"] = new_phone
+        else:
+            print("Invalid phone, not updated.")
+
+    new_email = input(f"New Email [{current['Email']}]: ").strip()
+    if new_email:
+        if validate_email(new_email):
+            changes["email"] = new_email
+        else:
+            print("Invalid email, not updated.")
+
+    new_room = input(f"New Room ID [{current['RoomID']}]: ").strip()
+    if new_room:
+        changes["room_id"] = new_room
+
+    new_stay = input(f"New Stay Days [{current['DaysOfStay']}]: ").strip()
+    if new_stay:
+        if new_stay.isdigit():
+            changes["days_of_stay"] = int(new_stay)
+        else:
+            print("Invalid stay days, not updated.")
+
+    new_reg = input(f"New RegDate (YYYY-MM-DD HH:MM:SS) [{current['RegDate']}]: ").strip()
+    if new_reg:
+        if validate_reg_date(new_reg):
+            changes["reg_date"] = new_reg
+        else:
+            print("Invalid datetime format! Use YYYY-MM-DD HH:MM:SS")
+            print("Not updated.")
+
+    try:
+        edit_customer(cid, expected_version=version, **changes)
+    except ConflictError as e:
+        print(f"❌ {e}\n")
+        return load_data()
+    print("✅ Customer updated successfully.\n")
+    return load_data()
+
+
+def delete_customer(df):
+    """Deletes a customer by ID."""
+    cid = input("Enter Customer ID to delete: ").strip()
+    if not cid.isdigit():
+        return df
+    cid = int(cid)
+
+    if get_customer(cid) is None:
+        print("Customer not found.\n")
+        return df
+
+    if input("Type YES to confirm delete: ") == "YES":
+        remove_customer(cid)
+        print("🗑️ Deleted.\n")
+        return load_data()
+    return df
+
+
+# ==========================================================
+# ANALYTICS
+# ==========================================================
+def bulk_import_customers():
+    """Imports guests from a CSV/JSONL file and reports what was rejected."""
+    path = input("Path to CSV/JSONL file: ").strip()
+    try:
+        result = import_customers(path)
+    except ValueError as e:
+        print(f"❌ {e}\n")
+        return
+    print(f"✅ Imported {result['imported']} of {result['read']} rows.")
+    if result["rejected"]:
+        print(f"⚠️ {result['rejected']} rows rejected, see {result['reject_file']}\n")
+
+
+def stay_duration_stats():
+    """Show statistical analytics of stay durations."""
+    stats = customer_stay_stats()
+    if stats is None:
+        print("No stay data yet.\n")
+        return
+
+    print("\n📊 Stay Duration Stats 📊")
+    print(f"- Total Guests: {stats['guests']}")
+    print(f"- Avg Stay: {stats['avg']:.2f} days")
+    print(f"- Max Stay: {stats['max']:g} days")
+    print(f"- Min Stay: {stats['min']:g} days\n")
+
+
+# ==========================================================
+# MENU DRIVER
+# ==========================================================
+def customer_menu():
+    """Interactive customer management menu."""
+    df = load_data()
+    while True:
+        print("""
+⋆꙳•❅‧*₊⋆☃︎‧*❆₊⋆⋆꙳•❅‧*₊⋆☃︎‧*❆₊⋆˚₊𖥧 CUSTOMER MANAGEMENT ⋆꙳•❅‧*₊⋆☃︎‧*❆₊⋆˚₊𖥧
+1. Add Customer
+2. View Customers
+3. Search Customer
+4. Update Customer
+5. Delete Customer
+6. Customer Analytics (Stay Stats)
+7. Bulk Import (CSV/JSONL)
+8. Exit
+""")
+        ch = input("Enter choice: ")
+        if ch == "1":
+            df = add_customer(df)
+        elif ch == "2":
+            view_customers(df)
+        elif ch == "3":
+            search_customer(df)
+        elif ch == "4":
+            df = update_customer(df)
+        elif ch == "5":
+            df = delete_customer(df)
+        elif ch == "6":
+            stay_duration_stats()
+        elif ch == "7":
+            bulk_import_customers()
+            df = load_data()
+        elif ch == "8":
+            print("Returning to main menu...\n")
+            break
+        else:
+            print("Invalid.\n")
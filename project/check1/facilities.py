@@ -0,0 +1,322 @@
+from datetime import datetime
+
+from storage import (
+    ADVENTURE_FILE, BANQUET_FILE, JOURNALED_TABLES, POOL_FILE, ROOM_SERVICE_FILE,
+    append_record, delete_last_row, ensure_sql_schema, get_db, load_csv, table_lock,
+    table_stamp, use_sqlite,
+)
+
+import billing
+import customers
+
+# Bookable facilities: title, log file, places per slot, (time, Free/Paid)
+# slots and the price of a paid slot. Adventure activities share one log
+# file and are listed together by book_adventure_activities().
+ADVENTURE_TIMES = ["08:00 AM", "09:30 AM", "11:00 AM", "02:00 PM", "04:00 PM"]
+FACILITIES = {
+    "room_service": {
+        "title": "Room Service", "file": ROOM_SERVICE_FILE, "capacity": 4, "price": 200,
+        "slots": [("08:00 AM", "Free"), ("10:00 AM", "Free"), ("12:00 PM", "Free"),
+                  ("03:00 PM", "Paid"), ("06:00 PM", "Paid")],
+    },
+    "swimming_pool": {
+        "title": "Swimming Pool", "file": POOL_FILE, "capacity": 10, "price": 300,
+        "slots": [("06:00 AM", "Free"), ("07:30 AM", "Free"), ("09:00 AM", "Free"), ("10:30 AM", "Free"),
+                  ("12:00 PM", "Free"), ("02:00 PM", "Paid"), ("04:00 PM", "Paid"), ("06:00 PM", "Paid")],
+    },
+    "banquet_hall": {
+        "title": "Banquet Hall", "file": BANQUET_FILE, "capacity": 1, "price": 1000,
+        "slots": [("10:00 AM - 01:00 PM", "Free"), ("02:00 PM - 05:00 PM", "Paid"),
+                  ("06:00 PM - 09:00 PM", "Paid")],
+    },
+}
+for _title in ["Rock Climbing / Rappelling", "Zip Lining", "Mountain Biking / ATV Ride",
+               "Trekking / Nature Trail", "Obstacle / Rope Course"]:
+    FACILITIES[_title.split(" /")[0].lower().replace(" ", "_")] = {
+        "title": _title, "file": ADVENTURE_FILE, "capacity": 5, "price": 500, "group": "adventure",
+        "confirm": True, "slots": [(time, "Paid") for time in ADVENTURE_TIMES],
+    }
+# With the sqlite backend, places are taken from slot counters in SQLITE_FILE:
+# one row per (facility, date, slot) holding the places booked so far. With
+# csv they come from FACILITY_INDEX: per log file, its table stamp and the
+# places booked per (facility, date, slot), counted once and then updated in
+# place under the log's table lock, so no database file is created.
+FACILITY_SLOT_TABLE = "facility_slots"
+FACILITY_DAYS = set()
+FACILITY_INDEX = {}
+
+
+# ---------------------- FACILITIES -----------------------
+def facility_slot_list(facility):
+    return FACILITIES[facility]["slots"]
+
+
+def ensure_facility_table():
+    ensure_sql_schema(
+        FACILITY_SLOT_TABLE,
+        f'CREATE TABLE IF NOT EXISTS "{FACILITY_SLOT_TABLE}" ('
+        '"facility" TEXT, "date" TEXT, "slot" TEXT, "booked" INTEGER NOT NULL DEFAULT 0, '
+        'PRIMARY KEY ("facility", "date", "slot"))',
+    )
+
+
+def build_facility_counts(filename):
+    """Counts the booked places per (facility, date, slot) in one facility log."""
+    columns = JOURNALED_TABLES[filename]
+    stamp = table_stamp(filename)
+    log = load_csv(filename, columns)
+    log = log[log["status"].fillna("Booked") == "Booked"]
+    counts = {}
+    for facility, config in FACILITIES.items():
+        if config["file"] != filename:
+            continue
+        rows = log[log["activity"] == config["title"]] if "activity" in columns else log
+        for (day, slot), booked in rows.groupby(["date", "time_slot"]).size().items():
+            counts[(facility, day, slot)] = int(booked)
+    FACILITY_INDEX[filename] = {"stamp": stamp, "counts": counts}
+    return counts
+
+
+def ensure_facility_counts(filename):
+    """Returns the place counts of a facility log, recounting only if the log changed."""
+    entry = FACILITY_INDEX.get(filename)
+    if entry is None or entry["stamp"] != table_stamp(filename):
+        return build_facility_counts(filename)
+    return entry["counts"]
+
+
+def facility_log_counts(facility, day):
+    """Bookings per slot already in the facility's log file for one date."""
+    counts = ensure_facility_counts(FACILITIES[facility]["file"])
+    booked = {time: counts.get((facility, day, time), 0) for time, _ in facility_slot_list(facility)}
+    return {time: n for time, n in booked.items() if n}
+
+
+def ensure_facility_day(facility, day):
+    """
+    Creates the slot counters for one facility and date, seeded from the
+    facility's log so bookings made before the counters existed still count.
+    Done once per (facility, date); afterwards every query is a key lookup.
+    """
+    if (facility, day) in FACILITY_DAYS:
+        return
+    ensure_facility_table()
+    db = get_db()
+    have = db.execute(
+        f'SELECT COUNT(*) FROM "{FACILITY_SLOT_TABLE}" WHERE "facility" = ? AND "date" = ?', (facility, day)
+    ).fetchone()[0]
+    slots = facility_slot_list(facility)
+    if have < len(slots):
+        counts = facility_log_counts(facility, day)
+        with db:
+            db.executemany(
+                f'INSERT OR IGNORE INTO "{FACILITY_SLOT_TABLE}" VALUES (?, ?, ?, ?)',
+                [(facility, day, time, int(counts.get(time, 0))) for time, _ in slots],
+            )
+    FACILITY_DAYS.add((facility, day))
+
+
+def facility_booked(facility, day):
+    """Places booked per slot of a facility on a date, from the counters or the log."""
+    if not use_sqlite(FACILITIES[facility]["file"]):
+        return facility_log_counts(facility, day)
+    ensure_facility_day(facility, day)
+    return dict(get_db().execute(
+        f'SELECT "slot", "booked" FROM "{FACILITY_SLOT_TABLE}" WHERE "facility" = ? AND "date" = ?',
+        (facility, day),
+    ).fetchall())
+
+
+def facility_availability(facility, day):
+    """
+    Slots of a facility on a date (YYYY-MM-DD) as a list of dicts with
+    slot, type, price, capacity, booked and remaining.
+    """
+    config = FACILITIES[facility]
+    booked = facility_booked(facility, day)
+    result = []
+    for time, slot_type in config["slots"]:
+        taken = booked.get(time, 0)
+        result.append({
+            "slot": time,
+            "type": slot_type,
+            "price": config["price"] if slot_type == "Paid" else 0,
+            "capacity": config["capacity"],
+            "booked": taken,
+            "remaining": max(config["capacity"] - taken, 0),
+        })
+    return result
+
+
+def take_facility_slot(facility, day, slot):
+    """Takes one place from a slot counter with a single conditional UPDATE. Returns False if full."""
+    ensure_facility_day(facility, day)
+    db = get_db()
+    with db:
+        cur = db.execute(
+            f'UPDATE "{FACILITY_SLOT_TABLE}" SET "booked" = "booked" + 1 '
+            'WHERE "facility" = ? AND "date" = ? AND "slot" = ? AND "booked" < ?',
+            (facility, day, slot, FACILITIES[facility]["capacity"]),
+        )
+    return cur.rowcount > 0
+
+
+def release_facility_slot(facility, day, slot):
+    """Gives a place back to a slot counter (never below zero)."""
+    ensure_facility_day(facility, day)
+    db = get_db()
+    with db:
+        db.execute(
+            f'UPDATE "{FACILITY_SLOT_TABLE}" SET "booked" = "booked" - 1 '
+            'WHERE "facility" = ? AND "date" = ? AND "slot" = ? AND "booked" > 0',
+            (facility, day, slot),
+        )
+
+
+def reserve_facility_slot(facility, day, slot, cust_id):
+    """
+    Books one place in a facility slot, logs it and posts its charge. The
+    place is taken from the slot counter (sqlite) or checked against the
+    log's place counts while its table lock is held (csv), so two terminals
+    can never both get the last place. If logging or the charge fails the place is given back
+    and the log row removed.
+    Returns the logged record; raises ValueError when the slot is unknown
+    or full or the customer does not exist.
+    """
+    config = FACILITIES[facility]
+    slot_types = dict(config["slots"])
+    if slot not in slot_types:
+        raise ValueError(f"Unknown slot '{slot}' for {config['title']}.")
+    if customers.get_customer(int(cust_id)) is None:
+        raise ValueError("Invalid Customer ID.")
+
+    charge = config["price"] if slot_types[slot] == "Paid" else 0
+    record = {
+        "date": day,
+        "activity": config["title"],
+        "time_slot": slot,
+        "slot_type": slot_types[slot],
+        "customer_id": cust_id,
+        "charge": charge,
+        "status": "Booked",
+    }
+    columns = JOURNALED_TABLES[config["file"]]
+    counted = use_sqlite(config["file"])
+    with table_lock(config["file"]):
+        if counted:
+            taken = take_facility_slot(facility, day, slot)
+        else:
+            taken = facility_log_counts(facility, day).get(slot, 0) < config["capacity"]
+        if not taken:
+            raise ValueError(f"{config['title']} is full at {slot} on {day}.")
+
+        try:
+            append_record(config["file"], record, columns)
+        except BaseException:
+            if counted:
+                release_facility_slot(facility, day, slot)
+            raise
+        try:
+            if charge:
+                billing.update_customer_bill(cust_id, charge, config["title"], f"{slot} on {day}")
+        except BaseException:
+            delete_last_row(config["file"], columns, {col: record[col] for col in columns})
+            if counted:
+                release_facility_slot(facility, day, slot)
+            raise
+        if not counted:
+            # The counts were current when the place was checked and we still
+            # hold the lock, so only our own row has been added since.
+            entry = FACILITY_INDEX[config["file"]]
+            key = (facility, day, slot)
+            entry["counts"][key] = entry["counts"].get(key, 0) + 1
+            entry["stamp"] = table_stamp(config["file"])
+    return record
+
+
+def book_facility(facility):
+    """Interactive booking for any facility in FACILITIES."""
+    config = FACILITIES[facility]
+    print(f"\n=== {config['title'].upper()} BOOKING ===")
+
+    date_str = input(f"Enter the date for {config['title'].lower()} (YYYY-MM-DD): ")
+    try:
+        day = str(datetime.strptime(date_str.strip(), "%Y-%m-%d").date())
+    except ValueError:
+        print("❌ Invalid date format. Please use YYYY-MM-DD.")
+        return
+
+    slots = facility_availability(facility, day)
+    print(f"\nAvailable {config['title']} Slots for", day)
+    print("------------------------------------------------")
+    for i, slot in enumerate(slots, 1):
+        price = f"₹{slot['price']}" if slot["price"] else "Free"
+        print(f"{i}. {slot['slot']} - {price}  (Slots available: {slot['remaining']}/{slot['capacity']})")
+    print("------------------------------------------------")
+
+    choice = input("Would you like to book a slot? (yes/no): ").lower()
+    if choice != "yes":
+        print("No booking made.")
+        return
+
+    try:
+        slot_choice = int(input(f"Enter the slot number (1-{len(slots)}): "))
+        if slot_choice not in range(1, len(slots) + 1):
+            print("Invalid slot number.")
+            return
+    except ValueError:
+        print("Invalid input.")
+        return
+
+    selected = slots[slot_choice - 1]
+    if selected["remaining"] == 0:
+        print("❌ That slot is full. Please pick another one.")
+        return
+    cust_id = input("Enter your Customer ID: ").strip()
+    if not cust_id.isdigit() or customers.get_customer(int(cust_id)) is None:
+        print("❌ Invalid Customer ID.")
+        return
+
+    if selected["price"]:
+        if config.get("confirm"):
+            print(f"Note: This booking costs ₹{selected['price']}.")
+            if input("Confirm booking? (yes/no): ").lower() != "yes":
+                print("Booking cancelled.")
+                return
+        print(f"₹{selected['price']} will be added to your bill.")
+
+    try:
+        reserve_facility_slot(facility, day, selected["slot"], cust_id)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"\n✅ {config['title']} booked successfully for {selected['slot']} on {day}!")
+    print(f"Record saved in {config['file']}\n")
+
+
+def room_service():
+    book_facility("room_service")
+
+
+def book_swimming_pool():
+    book_facility("swimming_pool")
+
+
+def book_banquet_hall():
+    book_facility("banquet_hall")
+
+
+def book_adventure_activities():
+    print("\n=== ADVENTURE ACTIVITIES BOOKING ===")
+    activities = [key for key, config in FACILITIES.items() if config.get("group") == "adventure"]
+    for i, key in enumerate(activities, 1):
+        print(f"{i}. {FACILITIES[key]['title']}")
+    try:
+        act_choice = int(input(f"Select the activity number (1-{len(activities)}): "))
+        if act_choice not in range(1, len(activities) + 1):
+            print("Invalid choice.")
+            return
+    except ValueError:
+        print("Invalid input.")
+        return
+    book_facility(activities[act_choice - 1])
@@ -0,0 +1,537 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+from storage import (
+    INVENTORY_COLUMNS, INVENTORY_FILE, MOVEMENT_COLUMNS, MOVEMENTS_FILE,
+    PAGE_ROWS, STOCK_SNAPSHOT_COLUMNS, STOCK_SNAPSHOT_FILE, append_record,
+    append_records, delete_rows, find_rows, load_columns, load_csv, load_table,
+    next_id, page_table, save_csv, table_lock, table_stamp,
+)
+
+STOCK_SNAPSHOT_EVERY = 1000
+# Forecast: daily use is averaged over the last FORECAST_WINDOW_DAYS; an item
+# is flagged when its stock will not last REORDER_LEAD_DAYS (the time a
+# delivery takes) and is reordered to cover REORDER_COVER_DAYS beyond that.
+FORECAST_WINDOW_DAYS = 30
+REORDER_LEAD_DAYS = 7
+REORDER_COVER_DAYS = 14
+# ItemID -> current stock (latest stock snapshot + later movements), kept
+# current by record_movement. since_snapshot counts movements not yet in a snapshot.
+STOCK_INDEX = {"stamp": None, "qty": {}, "since_snapshot": 0}
+
+
+# ==========================================================
+# 🧺 INVENTORY MANAGEMENT DEPARTMENT
+# ==========================================================
+def load_inventory():
+    return with_current_stock(load_table(INVENTORY_FILE))
+
+def save_inventory(df):
+    save_csv(INVENTORY_FILE, df)
+
+def generate_item_id(df=None):
+    return next_id("item")
+
+# INVENTORY API
+# ==========================================================
+def get_inventory_item(item_id):
+    rows = find_rows(INVENTORY_FILE, INVENTORY_COLUMNS, "ItemID", item_id)
+    if rows.empty:
+        return None
+    item = rows.iloc[0].to_dict()
+    item["Quantity"] = current_stock(item_id, item["Quantity"])
+    return item
+
+
+# STOCK LEDGER
+# ==========================================================
+def stock_stamp():
+    return (table_stamp(MOVEMENTS_FILE), table_stamp(STOCK_SNAPSHOT_FILE))
+
+
+def latest_stock_snapshot(snapshots, before=None):
+    """(LastMoveID, Series ItemID -> Quantity) of the newest snapshot taken at or before `before`."""
+    if before is not None:
+        snapshots = snapshots[snapshots["Timestamp"] <= before]
+    if snapshots.empty:
+        return 0, pd.Series(dtype="int64")
+    latest = snapshots[snapshots["SnapshotID"] == snapshots["SnapshotID"].max()]
+    quantities = latest["Quantity"].astype("int64").set_axis(latest["ItemID"].astype(str))
+    return int(latest["LastMoveID"].iloc[0]), quantities
+
+
+def per_item(values, items, how="sum"):
+    """Aggregates values per ItemID, keyed by plain strings. The movement log's
+    ItemID is categorical, so groups are formed on its codes, not its text."""
+    result = values.groupby(items, observed=True).agg(how)
+    return result.set_axis(result.index.astype(str))
+
+
+def movements_after(moves, last_move):
+    """Movements with MoveID > last_move; MoveIDs are appended in order, so this is a binary search."""
+    ids = moves["MoveID"].to_numpy(dtype="int64", na_value=0)
+    return moves.iloc[np.searchsorted(ids, last_move, side="right"):]
+
+
+def build_stock_index():
+    """Rebuilds STOCK_INDEX from the latest stock snapshot plus the movements after it."""
+    with table_lock(MOVEMENTS_FILE, shared=True), table_lock(STOCK_SNAPSHOT_FILE, shared=True):
+        stamp = stock_stamp()
+        snapshots = load_columns(STOCK_SNAPSHOT_FILE, ["SnapshotID", "LastMoveID", "ItemID", "Quantity"])
+        moves = load_columns(MOVEMENTS_FILE, ["MoveID", "ItemID", "Change"])
+    if snapshots.empty:
+        # First run on an existing inventory: inventory.csv already holds the
+        # stock after every movement so far, so start from it.
+        seed_stock_snapshot()
+        return build_stock_index()
+
+    last_move, stock = latest_stock_snapshot(snapshots)
+    later = movements_after(moves, last_move)
+    delta = per_item(later["Change"].astype("int64"), later["ItemID"])
+    stock = stock.add(delta, fill_value=0).astype("int64")
+    STOCK_INDEX["qty"] = stock.to_dict()
+    STOCK_INDEX["since_snapshot"] = len(later)
+    STOCK_INDEX["stamp"] = stamp
+
+
+def ensure_stock_index():
+    if STOCK_INDEX["stamp"] is None or STOCK_INDEX["stamp"] != stock_stamp():
+        build_stock_index()
+    return STOCK_INDEX["qty"]
+
+
+def current_stock(item_id, default=0):
+    qty = ensure_stock_index().get(str(item_id).strip())
+    return default if qty is None else int(qty)
+
+
+def with_current_stock(df):
+    """Replaces the Quantity column of an inventory frame (typed or text) with current stock."""
+    if df.empty or "Quantity" not in df.columns or "ItemID" not in df.columns:
+        return df
+    current = df["ItemID"].astype(str).str.strip().map(ensure_stock_index())
+    if pd.api.types.is_numeric_dtype(df["Quantity"]):
+        quantity = current.astype("float64").fillna(df["Quantity"].astype("float64")).astype(df["Quantity"].dtype)
+    else:
+        quantity = current.map(lambda q: str(int(q)), na_action="ignore").fillna(df["Quantity"])
+    return df.assign(Quantity=quantity)
+
+
+def inventory_columns(columns):
+    """Typed inventory columns (see load_columns) with current stock as Quantity."""
+    wanted = list(columns)
+    extra = [] if "ItemID" in wanted or "Quantity" not in wanted else ["ItemID"]
+    df = with_current_stock(load_columns(INVENTORY_FILE, wanted + extra))
+    return df[wanted]
+
+
+def write_stock_snapshot(stock, last_move):
+    """Appends one snapshot of all items and writes the same stock into inventory.csv."""
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    snapshot_id = next_id("stock_snapshot")
+    append_records(STOCK_SNAPSHOT_FILE, [
+        {"SnapshotID": snapshot_id, "Timestamp": now, "LastMoveID": last_move, "ItemID": item_id,
+         "Quantity": int(qty)}
+        for item_id, qty in stock.items()
+    ], STOCK_SNAPSHOT_COLUMNS)
+
+    with table_lock(INVENTORY_FILE):
+        items = load_csv(INVENTORY_FILE, INVENTORY_COLUMNS)
+        current = items["ItemID"].astype(str).str.strip().map(stock)
+        items["Quantity"] = current.map(lambda q: str(int(q)), na_action="ignore").fillna(items["Quantity"])
+        save_csv(INVENTORY_FILE, items)
+    return snapshot_id
+
+
+def seed_stock_snapshot():
+    """Takes the very first snapshot from inventory.csv's Quantity column."""
+    with table_lock(MOVEMENTS_FILE), table_lock(STOCK_SNAPSHOT_FILE):
+        if not load_csv(STOCK_SNAPSHOT_FILE, STOCK_SNAPSHOT_COLUMNS).empty:
+            return
+        items = load_table(INVENTORY_FILE)
+        moves = load_columns(MOVEMENTS_FILE, ["MoveID"])
+        last_move = int(moves["MoveID"].max()) if moves["MoveID"].notna().any() else 0
+        stock = items["Quantity"].fillna(0).astype("int64").set_axis(items["ItemID"].astype(str))
+        write_stock_snapshot(stock.to_dict(), last_move)
+
+
+def take_stock_snapshot():
+    """Snapshots current stock; the next reads replay only movements after it."""
+    with table_lock(MOVEMENTS_FILE), table_lock(STOCK_SNAPSHOT_FILE):
+        stock = dict(ensure_stock_index())
+        moves = load_columns(MOVEMENTS_FILE, ["MoveID"])
+        last_move = int(moves["MoveID"].max()) if moves["MoveID"].notna().any() else 0
+        snapshot_id = write_stock_snapshot(stock, last_move)
+        STOCK_INDEX["since_snapshot"] = 0
+        STOCK_INDEX["stamp"] = stock_stamp()
+    return snapshot_id
+
+
+def stock_at(when, item_id=None):
+    """
+    Stock as it was at `when` (anything pd.Timestamp accepts): the newest
+    snapshot taken by then plus the movements after it up to `when`.
+    Returns one item's quantity, or a Series ItemID -> quantity for all items.
+    """
+    when = pd.Timestamp(when)
+    snapshots = load_columns(STOCK_SNAPSHOT_FILE, ["SnapshotID", "Timestamp", "LastMoveID", "ItemID", "Quantity"])
+    moves = load_columns(MOVEMENTS_FILE, ["MoveID", "Timestamp", "ItemID", "Change"])
+    last_move, stock = latest_stock_snapshot(snapshots, when)
+    later = movements_after(moves, last_move)
+    later = later[later["Timestamp"] <= when]
+    if item_id is not None:
+        item_id = str(item_id).strip()
+        replay = later.loc[later["ItemID"] == item_id, "Change"].astype("int64").sum()
+        return int(stock.get(item_id, 0) + replay)
+    delta = per_item(later["Change"].astype("int64"), later["ItemID"])
+    return stock.add(delta, fill_value=0).astype("int64").rename("Quantity")
+
+
+def create_inventory_item(name, category, quantity, min_threshold, unit_price):
+    """Adds an item and returns its record."""
+    name = (name or "").strip().capitalize()
+    if not name:
+        raise ValueError("Item name cannot be empty.")
+    record = {
+        "ItemID": generate_item_id(),
+        "ItemName": name,
+        "Category": str(category).capitalize(),
+        # Stock lives in the movement log; inventory.csv catches up at the
+        # next stock snapshot.
+        "Quantity": 0,
+        "MinThreshold": int(min_threshold),
+        "UnitPrice": float(unit_price),
+        "LastUpdated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+    append_record(INVENTORY_FILE, record, INVENTORY_COLUMNS)
+    record["Quantity"] = record_movement(record["ItemID"], int(quantity), "Initial")
+    return record
+
+
+def record_movement(item_id, change, move_type=None, note=""):
+    """
+    Appends one stock change to the movement log and returns the quantity
+    it leaves. The type defaults to Restock / Use by the sign of change.
+    Takes a stock snapshot every STOCK_SNAPSHOT_EVERY movements.
+    """
+    if move_type is None:
+        move_type = "Restock" if change > 0 else "Use"
+    key = str(item_id).strip()
+    with table_lock(MOVEMENTS_FILE):
+        stock = ensure_stock_index()
+        quantity = int(stock.get(key, 0)) + int(change)
+        append_record(MOVEMENTS_FILE, {
+            "MoveID": next_id("movement"),
+            "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "ItemID": key,
+            "Type": move_type,
+            "Change": int(change),
+            "QuantityAfter": quantity,
+            "Note": note,
+        }, MOVEMENT_COLUMNS)
+        stock[key] = quantity
+        STOCK_INDEX["since_snapshot"] += 1
+        STOCK_INDEX["stamp"] = stock_stamp()
+        if STOCK_INDEX["since_snapshot"] >= STOCK_SNAPSHOT_EVERY:
+            take_stock_snapshot()
+    return quantity
+
+
+def adjust_inventory_quantity(item_id, change, note=""):
+    """
+    Adds (or, if negative, removes) stock, never going below zero. Returns
+    the new quantity. The change is a single append to the movement log,
+    made under its lock so terminals moving the same item are serialized.
+    """
+    with table_lock(MOVEMENTS_FILE):
+        item = get_inventory_item(item_id)
+        if item is None:
+            raise ValueError("Item not found.")
+        old_qty = int(float(item["Quantity"])) if pd.notna(item["Quantity"]) else 0
+        new_qty = max(0, old_qty + int(change))
+        if new_qty != old_qty:
+            record_movement(item_id, new_qty - old_qty, note=note)
+        return new_qty
+
+
+def delete_inventory_item(item_id):
+    """Removes an item. Returns True if a row was removed."""
+    item = get_inventory_item(item_id)
+    removed = delete_rows(INVENTORY_FILE, INVENTORY_COLUMNS, "ItemID", item_id) > 0
+    if removed and item is not None:
+        qty = int(float(item["Quantity"])) if pd.notna(item["Quantity"]) else 0
+        record_movement(item_id, -qty, "Remove")
+    return removed
+
+
+def list_inventory():
+    return load_inventory()
+
+
+def list_low_stock():
+    df = load_inventory()
+    return df[(df["Quantity"] <= df["MinThreshold"]).fillna(False)]
+
+
+def consumption_rates(window_days=None, now=None):
+    """
+    Average daily use per ItemID over the last window_days, from the
+    movement log in one groupby. An item first seen inside the window is
+    averaged over the days since then, so new items are not diluted.
+    Returns a Series indexed by ItemID.
+    """
+    window_days = window_days or FORECAST_WINDOW_DAYS
+    now = pd.Timestamp.now() if now is None else pd.Timestamp(now)
+    moves = load_columns(MOVEMENTS_FILE, ["Timestamp", "ItemID", "Type", "Change"])
+    moves = moves[moves["Timestamp"].notna() & (moves["Timestamp"] <= now)]
+    if moves.empty:
+        return pd.Series(dtype="float64", name="DailyUse")
+    item = moves["ItemID"]
+
+    start = now - pd.Timedelta(days=window_days)
+    first_seen = per_item(moves["Timestamp"], item, "min").clip(lower=start)
+    days = ((now - first_seen) / pd.Timedelta(days=1)).clip(lower=1.0)
+
+    used = (moves["Type"] == "Use") & (moves["Timestamp"] >= start)
+    consumed = per_item(-moves.loc[used, "Change"].astype("float64"), item[used])
+    consumed = consumed.reindex(days.index, fill_value=0.0)
+    return (consumed / days).rename("DailyUse")
+
+
+def forecast_inventory(window_days=None, lead_days=None, cover_days=None, now=None):
+    """
+    Stock forecast for every item in one vectorized pass: DailyUse (items
+    with no history take their category's average), DaysLeft until stockout,
+    ReorderPoint = lead-time use + MinThreshold, ReorderQty to cover the lead
+    time plus cover_days, and NeedsReorder when stock is at or below the
+    reorder point. Returns a DataFrame sorted by DaysLeft.
+    """
+    lead_days = REORDER_LEAD_DAYS if lead_days is None else lead_days
+    cover_days = REORDER_COVER_DAYS if cover_days is None else cover_days
+    items = inventory_columns(["ItemID", "ItemName", "Category", "Quantity", "MinThreshold"])
+    rates = consumption_rates(window_days, now)
+
+    df = items.assign(ItemID=items["ItemID"].astype(str))
+    df["Quantity"] = df["Quantity"].astype("float64").fillna(0.0)
+    df["MinThreshold"] = df["MinThreshold"].astype("float64").fillna(0.0)
+    df["DailyUse"] = df["ItemID"].map(rates).astype("float64")
+    category_use = df.groupby("Category", observed=True)["DailyUse"].mean()
+    fallback = df["Category"].map(category_use).astype("float64")
+    df["DailyUse"] = df["DailyUse"].fillna(fallback).fillna(0.0).round(3)
+
+    use = df["DailyUse"].to_numpy()
+    qty = df["Quantity"].to_numpy()
+    with np.errstate(divide="ignore"):
+        df["DaysLeft"] = np.where(use > 0, qty / use, np.inf).round(1)
+    df["ReorderPoint"] = np.ceil(use * lead_days + df["MinThreshold"].to_numpy())
+    target = use * (lead_days + cover_days) + df["MinThreshold"].to_numpy()
+    df["ReorderQty"] = np.ceil(np.maximum(target - qty, 0)).astype(int)
+    df["NeedsReorder"] = qty <= df["ReorderPoint"].to_numpy()
+    return df.sort_values(["DaysLeft", "ItemID"], kind="mergesort", ignore_index=True)
+
+
+def category_consumption(forecast=None):
+    """Daily use, stock and days of cover per category."""
+    df = forecast_inventory() if forecast is None else forecast
+    out = df.groupby("Category", observed=True).agg(
+        Items=("ItemID", "size"), Quantity=("Quantity", "sum"), DailyUse=("DailyUse", "sum"),
+        ToReorder=("NeedsReorder", "sum"),
+    )
+    with np.errstate(divide="ignore"):
+        out["DaysLeft"] = np.where(out["DailyUse"] > 0, out["Quantity"] / out["DailyUse"], np.inf).round(1)
+    return out.reset_index()
+
+
+def inventory_value():
+    """Returns (total value, DataFrame of value per category)."""
+    df = inventory_columns(["Category", "Quantity", "UnitPrice"])
+    df["Value"] = df["Quantity"] * df["UnitPrice"]
+    return df["Value"].sum(), df.groupby("Category")["Value"].sum().reset_index()
+
+
+# ADD / UPDATE ITEMS
+# ==========================================================
+def add_inventory_item():
+    name = input("Enter Item Name: ").strip().capitalize()
+    if not name:
+        print("❌ Item name cannot be empty.")
+        return
+
+    category = input("Enter Category (e.g. Linen, Cleaning, Toiletries, Food): ").capitalize()
+    try:
+        qty = int(input("Enter Initial Quantity: "))
+        min_thr = int(input("Enter Minimum Threshold for Reorder: "))
+        price = float(input("Enter Unit Price: "))
+    except ValueError:
+        print("❌ Invalid number entered.")
+        return
+
+    try:
+        record = create_inventory_item(name, category, qty, min_thr, price)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ Added {name} to inventory with ID {record['ItemID']}.")
+
+def update_inventory():
+    item_id = input("Enter Item ID to update (e.g., IT1001): ").strip()
+    item = get_inventory_item(item_id)
+    if item is None:
+        print("❌ Item not found.")
+        return
+
+    print(f"Current quantity: {item['Quantity']}")
+    try:
+        change = int(input("Enter quantity change (positive for add, negative for reduce): "))
+    except ValueError:
+        print("❌ Invalid number.")
+        return
+
+    adjust_inventory_quantity(item_id, change)
+    print("✅ Quantity updated successfully.")
+
+def remove_inventory_item():
+    item_id = input("Enter Item ID to remove: ").strip()
+    if get_inventory_item(item_id) is None:
+        print("❌ Item not found.")
+        return
+
+    if input("Type YES to confirm deletion: ") == "YES":
+        delete_inventory_item(item_id)
+        print("🗑️ Item removed successfully.")
+
+
+def view_all_inventory():
+    page_table(INVENTORY_FILE, "ALL INVENTORY ITEMS", "No items in inventory.", prepare=with_current_stock)
+
+def low_stock_alerts():
+    forecast = forecast_inventory()
+    low = forecast[forecast["NeedsReorder"]]
+    if low.empty:
+        print("🎉 All items are sufficiently stocked!")
+        return
+    print("\n⚠️ LOW STOCK ALERT ⚠️")
+    print(f"(at or below minimum, or running out within {REORDER_LEAD_DAYS} days)")
+    print(low[["ItemID", "ItemName", "Quantity", "MinThreshold", "DailyUse", "DaysLeft", "ReorderQty"]]
+          .head(PAGE_ROWS).to_string(index=False))
+    if len(low) > PAGE_ROWS:
+        print(f"... and {len(low) - PAGE_ROWS} more.")
+
+    choice = input("Do you want to restock any item? (yes/no): ").strip().lower()
+    if choice != "yes":
+        return
+
+    item_id = input("Enter the ItemID to restock: ").strip()
+    item = get_inventory_item(item_id)
+    if item is None:
+        print("ItemID not found.")
+        return
+
+    print(f"Current quantity of '{item['ItemName']}': {item['Quantity']}")
+
+    try:
+        add_qty = int(input("Enter quantity to add: "))
+        if add_qty < 0:
+            print("Quantity cannot be negative.")
+            return
+    except ValueError:
+        print("Invalid input! Must be an integer.")
+        return
+
+    new_qty = adjust_inventory_quantity(item_id, add_qty)
+    print(f"✅ '{item['ItemName']}' updated. New quantity: {new_qty}\n")
+
+
+def consumption_forecast_report():
+    forecast = forecast_inventory()
+    if forecast.empty:
+        print("Inventory empty.")
+        return
+    print(f"\n📉 CONSUMPTION FORECAST (last {FORECAST_WINDOW_DAYS} days) 📉")
+    print(category_consumption(forecast).to_string(index=False))
+    soonest = forecast[np.isfinite(forecast["DaysLeft"])].head(PAGE_ROWS)
+    if not soonest.empty:
+        print("\nSoonest to run out:")
+        print(soonest[["ItemID", "ItemName", "Category", "Quantity", "DailyUse", "DaysLeft",
+                       "ReorderQty"]].to_string(index=False))
+
+
+def stock_history_report():
+    text = input("Date/time (YYYY-MM-DD [HH:MM], blank for now): ").strip()
+    try:
+        when = pd.Timestamp(text) if text else pd.Timestamp.now()
+    except ValueError:
+        print("❌ Invalid date.")
+        return
+    if text and len(text) <= 10:
+        when += pd.Timedelta(days=1) - pd.Timedelta(seconds=1)  # a bare date means end of that day
+
+    item_id = input("Item ID (blank for all items): ").strip()
+    if item_id:
+        if get_inventory_item(item_id) is None:
+            print("❌ Item not found.")
+            return
+        print(f"Stock of {item_id} at {when:%Y-%m-%d %H:%M}: {stock_at(when, item_id)}")
+        return
+    stock = stock_at(when)
+    if stock.empty:
+        print("No stock recorded by then.")
+        return
+    print(f"\n📦 STOCK AT {when:%Y-%m-%d %H:%M}")
+    print(stock.rename_axis("ItemID").reset_index().head(PAGE_ROWS).to_string(index=False))
+    if len(stock) > PAGE_ROWS:
+        print(f"... and {len(stock) - PAGE_ROWS} more items.")
+
+
+def inventory_value_report():
+    if list_inventory().empty:
+        print("Inventory empty.")
+        return
+
+    total_value, category_wise = inventory_value()
+
+    print("\n📦 INVENTORY VALUE REPORT 📦")
+    print(f"Total Inventory Value: ₹{total_value:,.2f}\n")
+    print("Category-wise Breakdown:")
+    print(category_wise.to_string(index=False))
+
+
+### MENU DRIVER
+
+def inventory():
+    while True:
+        print("""
+⛟ ☒ ⋆✴︎˚｡⋆ ✉︎ INVENTORY MANAGEMENT MENU ✉︎ ⋆✴︎˚｡⋆ ☒ ⛟ 
+1. Add Item
+2. Update Quantity
+3. Remove Item
+4. View All Items
+5. Low Stock Alerts
+6. Inventory Value Report
+7. Consumption Forecast
+8. Stock at a Past Date
+9. Back to Main Menu
+""")
+        ch = input("Enter choice: ").strip()
+        if ch == "1":
+            add_inventory_item()
+        elif ch == "2":
+            update_inventory()
+        elif ch == "3":
+            remove_inventory_item()
+        elif ch == "4":
+            view_all_inventory()
+        elif ch == "5":
+            low_stock_alerts()
+        elif ch == "6":
+            inventory_value_report()
+        elif ch == "7":
+            consumption_forecast_report()
+        elif ch == "8":
+            stock_history_report()
+        elif ch == "9":
+            print("Returning to main menu...")
+            break
+        else:
+            print("❌ Invalid input.")
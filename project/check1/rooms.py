@@ -0,0 +1,351 @@
+import pandas as pd
+import numpy as np
+from datetime import date, timedelta
+
+from storage import (
+    BOOKING_DATE_FORMAT, BOOKING_FILE, ROOM_COLUMNS, ROOM_FILE, append_record,
+    clean_price, ConflictError, day_number, DuplicateKeyError, find_rows, load_columns,
+    load_csv, page_table, parse_booking_date, row_version, table_lock, update_rows,
+)
+
+import analytics
+import bookings
+import customers
+
+# Dynamic room rates: a room's nightly price is its Price x a multiplier per
+# (room type, night) = day of week x season x occupancy band, where occupancy
+# is what is already on the books for that type and night. RATE_TABLE holds
+# the multipliers for a whole calendar plus running totals per type, so any
+# stay is priced with two lookups. Kept current by create_booking, rebuilt
+# when rooms.csv or bookings.csv change behind our back.
+RATE_WEEKDAY = [1.0, 1.0, 1.0, 1.0, 1.10, 1.20, 1.05]  # Monday .. Sunday
+RATE_SEASON = {1: 1.15, 4: 1.05, 5: 1.10, 6: 1.10, 7: 0.90, 8: 0.90, 10: 1.05, 11: 1.10, 12: 1.25}
+RATE_OCCUPANCY = [(0, 0.90), (40, 1.0), (70, 1.15), (90, 1.30)]  # (occupancy % from, multiplier)
+RATE_LIMITS = (0.75, 2.0)
+RATE_HORIZON_DAYS = 365
+RATE_TABLE = {
+    "stamp": None, "start": 0, "types": {}, "base": None, "capacity": None,
+    "static": None, "occupied": None, "mult": None, "cum": None,
+}
+
+
+# ==========================================================
+# 🏨 ROOM MANAGEMENT
+# ==========================================================
+# ---------------------- ROOM API ---------------------------
+def create_room(room_id, room_type, price):
+    """Adds a room (initially Available) and returns its record."""
+    room_id = str(room_id).strip()
+    if not room_id:
+        raise ValueError("Room ID cannot be empty.")
+    record = {
+        "RoomID": room_id,
+        "RoomType": str(room_type).capitalize(),
+        "Price": float(price),
+        "Status": "Available",
+    }
+    with table_lock(ROOM_FILE):
+        if not find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id).empty:
+            raise ValueError("Room already exists.")
+        try:
+            append_record(ROOM_FILE, record, ROOM_COLUMNS)
+        except DuplicateKeyError:
+            raise ValueError("Room already exists.") from None
+    return record
+
+
+def edit_room(room_id, price=None, status=None, expected_version=None):
+    """Changes a room's price and/or status. Returns the applied changes."""
+    if find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id).empty:
+        raise ValueError("Room not found.")
+    changes = {}
+    if price is not None:
+        changes["Price"] = float(price)
+    if status:
+        changes["Status"] = str(status).capitalize()
+    if changes:
+        update_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id, changes, expected_version)
+    return changes
+
+
+def list_rooms():
+    return load_csv(ROOM_FILE, ROOM_COLUMNS)
+
+
+def list_available_rooms(check_in, check_out):
+    """Rooms free for the whole stay; dates are dd-mm-yyyy strings."""
+    start, end = parse_booking_date(check_in), parse_booking_date(check_out)
+    if start is None or end is None or end <= start:
+        raise ValueError("Invalid dates. Use dd-mm-yyyy with check-out after check-in.")
+    return bookings.free_rooms(list_rooms(), start, end)
+
+
+# ---------------------- ROOM MENUS -------------------------
+def add_room():
+    room_id = input("Enter Room ID: ").strip()
+    if not find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id).empty:
+        print("❌ Room already exists.")
+        return
+    room_type = input("Enter Room Type (Single/Double/Suite): ").capitalize()
+    price = float(input("Enter Price: "))
+    try:
+        create_room(room_id, room_type, price)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print("✅ Room added successfully.")
+
+
+def update_room():
+    room_id = input("Enter Room ID to update: ").strip()
+    while True:
+        rows = find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", room_id)
+        if rows.empty:
+            print("❌ Room not found.")
+            return
+        current = rows.iloc[0].to_dict()
+        version = row_version(current, ROOM_COLUMNS)
+
+        new_price = float(input(f"Enter new Price [{current['Price']}]: "))
+        new_status = input(f"Enter new Status (Available/Booked) [{current['Status']}]: ").capitalize()
+        try:
+            edit_room(room_id, new_price, new_status, expected_version=version)
+        except ConflictError as e:
+            # Someone else saved this room after we read it: show their
+            # values and ask again rather than overwrite them.
+            print(f"❌ {e}")
+            print("🔄 Reloaded the current values, please enter the changes again.")
+            continue
+        break
+    print("✅ Room updated successfully.")
+
+
+def view_all_rooms():
+    page_table(ROOM_FILE, "ALL ROOMS", "No rooms available yet.")
+
+
+def show_available_rooms():
+    check_in = input("Enter Check-in (dd-mm-yyyy) — leave blank for tonight: ").strip()
+    if check_in:
+        check_out = input("Enter Check-out (dd-mm-yyyy): ").strip()
+    else:
+        check_in = date.today().strftime(BOOKING_DATE_FORMAT)
+        check_out = (date.today() + timedelta(days=1)).strftime(BOOKING_DATE_FORMAT)
+
+    try:
+        available = list_available_rooms(check_in, check_out)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    if available.empty:
+        print("❌ No available rooms.")
+    else:
+        print("\n--- AVAILABLE ROOMS ---")
+        print(quote_rooms(available, check_in, check_out).to_string(index=False))
+
+
+# ---------------------- ROOM RATES -----------------------
+def rate_multipliers(static, occupied, capacity):
+    """
+    Nightly multipliers for an occupied-rooms array (types x nights), given
+    the weekday x season factor of each night and the room count per type.
+    """
+    occupancy = occupied / np.maximum(capacity, 1)[:, None] * 100
+    bands = np.array([band for band, _ in RATE_OCCUPANCY], dtype=float)
+    factors = np.array([factor for _, factor in RATE_OCCUPANCY])
+    demand = factors[np.searchsorted(bands, occupancy, side="right") - 1]
+    return np.clip(static * demand, *RATE_LIMITS).round(4)
+
+
+def running_totals(mult):
+    """Per-type running sums with a leading 0, so nights [a, b) sum to cum[b] - cum[a]."""
+    return np.concatenate([np.zeros((len(mult), 1)), mult.cumsum(axis=1)], axis=1)
+
+
+def build_rate_table(start_day, end_day):
+    """Evaluates the rate rules for every room type over [start_day, end_day) at once."""
+    with table_lock(BOOKING_FILE, shared=True):
+        stamp = analytics.revenue_stamp()
+        rooms = load_columns(ROOM_FILE, ["RoomID", "RoomType", "Price"])
+        occupied, _ = analytics.occupancy_series(start_day, end_day, room_df=rooms)
+
+    types = [col for col in occupied.columns if col != "Total"]
+    rooms = rooms.assign(RoomID=rooms["RoomID"].astype(str).str.strip()).drop_duplicates("RoomID")
+    room_types = rooms["RoomType"].astype("string").fillna("Unknown")
+    capacity = room_types.value_counts().reindex(types, fill_value=0).to_numpy(dtype=float)
+    base = clean_price(rooms["Price"]).groupby(room_types.to_numpy()).median().reindex(types)
+
+    dates = occupied.index
+    static = np.array(RATE_WEEKDAY)[dates.dayofweek]
+    static = static * pd.Series(dates.month).map(RATE_SEASON).fillna(1.0).to_numpy()
+    counts = occupied[types].to_numpy(dtype=float).T.copy()
+    mult = rate_multipliers(static, counts, capacity)
+
+    RATE_TABLE.update({
+        "start": start_day, "types": {t: i for i, t in enumerate(types)},
+        "base": base.to_numpy(dtype=float), "capacity": capacity, "static": static,
+        "occupied": counts, "mult": mult, "cum": running_totals(mult), "stamp": stamp,
+    })
+
+
+def ensure_rate_table(start_day=None, end_day=None):
+    """
+    Makes sure RATE_TABLE is current and covers [start_day, end_day).
+    Rebuilds reach RATE_HORIZON_DAYS past the later of today and end_day and
+    keep the range already built, so quotes and bills rarely trigger another.
+    """
+    today = day_number(date.today())
+    start_day = today if start_day is None else start_day
+    end_day = start_day + 1 if end_day is None else end_day
+    first = RATE_TABLE["start"]
+    built = RATE_TABLE["mult"] is not None
+    covered = built and first <= start_day and end_day <= first + RATE_TABLE["mult"].shape[1]
+    if covered and RATE_TABLE["stamp"] == analytics.revenue_stamp():
+        return RATE_TABLE
+    lo, hi = min(start_day, today), max(end_day, today) + RATE_HORIZON_DAYS
+    if built:
+        lo, hi = min(lo, first), max(hi, first + RATE_TABLE["mult"].shape[1])
+    build_rate_table(lo, hi)
+    return RATE_TABLE
+
+
+def add_booking_rates(room, start, end):
+    """
+    Folds one new booking into the occupancy behind RATE_TABLE and re-prices
+    only those nights. Returns True if that left the nightly rates of stays
+    already on the books unchanged (no occupancy band was crossed).
+    """
+    table = RATE_TABLE
+    room_type = "Unknown" if pd.isna(room["RoomType"]) else str(room["RoomType"])
+    row = table["types"].get(room_type)
+    first = table["start"]
+    if table["mult"] is None or row is None or start < first or end > first + table["mult"].shape[1]:
+        return False
+    a, b = start - first, end - first
+    before = table["mult"][row, a:b].copy()
+    table["occupied"][row, a:b] += 1
+    table["mult"][row, a:b] = rate_multipliers(
+        table["static"][a:b], table["occupied"][row:row + 1, a:b], table["capacity"][row:row + 1]
+    )[0]
+    table["cum"][row, 1:] = table["mult"][row].cumsum()
+    table["stamp"] = analytics.revenue_stamp()
+    return bool(np.array_equal(before, table["mult"][row, a:b]))
+
+
+def rate_rows(table, room_types):
+    """
+    Row of each room type in the rate table (-1 for types it does not know).
+    Pass a Categorical for long inputs: only its categories are looked up.
+    """
+    types = pd.Categorical(room_types)
+    rows = pd.Series(types.categories.astype(str)).map(table["types"]).fillna(-1).to_numpy(dtype=np.int64)
+    missing = table["types"].get("Unknown", -1)
+    return np.where(types.codes >= 0, rows[np.maximum(types.codes, 0)], missing)
+
+
+def night_multipliers(room_types, days):
+    """
+    Rate multiplier of each night for aligned room types and day numbers,
+    the same ones stay_charges bills (1.0 for unknown types).
+    """
+    days = np.asarray(days, dtype=np.int64)
+    if not len(days):
+        return np.ones(0)
+    table = ensure_rate_table(int(days.min()), int(days.max()) + 1)
+    if not table["types"]:
+        return np.ones(len(days))
+    rows = rate_rows(table, room_types)
+    return np.where(rows >= 0, table["mult"][np.maximum(rows, 0), days - table["start"]], 1.0)
+
+
+def stay_charges(prices, room_types, starts, ends):
+    """
+    Room charges for aligned arrays of base prices, room types and stays
+    [start, end) in day numbers: price x the sum of the nightly multipliers,
+    read from the running totals. Unknown types are charged the flat price.
+    """
+    prices = np.asarray(prices, dtype=float)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.maximum(np.asarray(ends, dtype=np.int64), starts)
+    nights = (ends - starts).astype(float)
+    if not len(prices):
+        return nights
+    table = ensure_rate_table(int(starts.min()), int(ends.max()))
+    if not table["types"]:
+        return (prices * nights).round(2)
+
+    rows = rate_rows(table, room_types)
+    known, safe = rows >= 0, np.maximum(rows, 0)
+    summed = table["cum"][safe, ends - table["start"]] - table["cum"][safe, starts - table["start"]]
+    return (prices * np.where(known, summed, nights)).round(2)
+
+
+def stay_charge(price, room_type, start, end):
+    return float(stay_charges([price], [room_type], [start], [end])[0])
+
+
+def quote_rooms(rooms, check_in, check_out):
+    """RoomID/RoomType/Price of the given rooms plus the dynamic price of the stay."""
+    start, end = parse_booking_date(check_in), parse_booking_date(check_out)
+    quote = rooms[["RoomID", "RoomType", "Price"]].copy()
+    total = stay_charges(clean_price(quote["Price"]), quote["RoomType"],
+                         np.full(len(quote), start), np.full(len(quote), end))
+    quote["Per Night"] = (total / (end - start)).round(2)
+    quote["Stay Total"] = total
+    return quote
+
+
+def rate_calendar(start_day, days):
+    """Nightly price per room type (rows: dates) for the next days nights."""
+    table = ensure_rate_table(start_day, start_day + days)
+    a = start_day - table["start"]
+    prices = table["base"][:, None] * table["mult"][:, a:a + days]
+    dates = pd.to_datetime(np.arange(start_day, start_day + days), unit="D")
+    calendar = pd.DataFrame(prices.T.round(2), index=dates.strftime("%a %d-%m-%Y"), columns=list(table["types"]))
+    calendar.index.name = "Night"
+    return calendar
+
+
+def show_rate_calendar():
+    text = input("Start date (dd-mm-yyyy) — leave blank for today: ").strip()
+    start = day_number(date.today()) if not text else parse_booking_date(text)
+    if start is None:
+        print("❌ Invalid date. Use dd-mm-yyyy.")
+        return
+    days = input("Number of nights [14]: ").strip()
+    days = int(days) if days.isdigit() and int(days) > 0 else 14
+    calendar = rate_calendar(start, days)
+    if calendar.empty or not len(calendar.columns):
+        print("❌ No rooms to price.")
+        return
+    print("\n--- RATE CALENDAR (₹ per night) ---")
+    print(calendar.to_string())
+
+
+def room_tasks():
+    while True:
+        print("\n--- ROOM MANAGEMENT MENU ---")
+        print("1. Add Room")
+        print("2. Update Room")
+        print("3. View All Rooms")
+        print("4. Manage Customers")
+        print("5. Rate Calendar")
+        print("6. Batch Assign Rooms")
+        print("7. Back to Main Menu")
+        ch = input("Enter choice: ")
+        if ch == "1":
+            add_room()
+        elif ch == "2":
+            update_room()
+        elif ch == "3":
+            view_all_rooms()
+        elif ch == "4":
+            customers.customer_menu()
+        elif ch == "5":
+            show_rate_calendar()
+        elif ch == "6":
+            bookings.batch_assign_rooms()
+        elif ch == "7":
+            break
+        else:
+            print("❌ Invalid input.")
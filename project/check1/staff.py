@@ -0,0 +1,157 @@
+from datetime import datetime
+
+from storage import (
+    STAFF_COLUMNS, STAFF_FILE, append_record, ConflictError, delete_rows, find_rows,
+    load_table, next_id, page_table, row_version, update_rows,
+)
+
+# ==========================================================
+# 👨‍🍳 STAFF MANAGEMENT MODULE
+# ==========================================================
+def staff_management():
+    print("\n📋 STAFF MANAGEMENT MENU 📋")
+    while True:
+        print("\n1. Add Staff Member")
+        print("2. View All Staff")
+        print("3. Update Staff Details")
+        print("4. Remove Staff")
+        print("5. Search Staff by Role")
+        print("6. Back to Manager Menu")
+
+        choice = input("Enter your choice: ")
+
+        if choice == "1":
+            add_staff()
+        elif choice == "2":
+            view_staff()
+        elif choice == "3":
+            update_staff()
+        elif choice == "4":
+            remove_staff()
+        elif choice == "5":
+            search_staff()
+        elif choice == "6":
+            break
+        else:
+            print("❌ Invalid choice, please try again.")
+
+
+# ---------------------- STAFF API --------------------------
+def load_staff():
+    return load_table(STAFF_FILE)
+
+
+def create_staff(name, role, contact, salary):
+    """Adds a staff member and returns the saved record."""
+    record = {
+        "StaffID": next_id("staff"),
+        "Name": name,
+        "Role": role,
+        "Contact": contact,
+        "Salary": float(salary),
+        "JoinDate": datetime.today().strftime('%Y-%m-%d')
+    }
+    append_record(STAFF_FILE, record, STAFF_COLUMNS)
+    return record
+
+
+def edit_staff(sid, salary=None, role=None, expected_version=None):
+    """Updates salary and/or role. Returns the applied changes."""
+    if find_rows(STAFF_FILE, STAFF_COLUMNS, "StaffID", sid).empty:
+        raise ValueError("No staff found with that ID.")
+    changes = {}
+    if salary is not None:
+        changes["Salary"] = float(salary)
+    if role:
+        changes["Role"] = role
+    if changes:
+        update_rows(STAFF_FILE, STAFF_COLUMNS, "StaffID", sid, changes, expected_version)
+    return changes
+
+
+def delete_staff(sid):
+    """Removes a staff member. Returns True if a row was removed."""
+    return delete_rows(STAFF_FILE, STAFF_COLUMNS, "StaffID", sid) > 0
+
+
+def list_staff():
+    return load_staff()
+
+
+def find_staff_by_role(role):
+    df = load_staff()
+    return df[df["Role"].astype(str).str.lower() == role.lower()]
+
+
+# ---------------------- STAFF MENUS ------------------------
+def add_staff():
+    name = input("Enter staff name: ")
+    role = input("Enter role (Manager/Receptionist/Chef/etc.): ")
+    contact = input("Enter contact number: ")
+
+    try:
+        salary = float(input("Enter salary: "))
+    except ValueError:
+        print("❌ Invalid salary amount.")
+        return
+
+    try:
+        record = create_staff(name, role, contact, salary)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ Staff member {name} added successfully with ID {record['StaffID']}.")
+
+
+def view_staff():
+    page_table(STAFF_FILE, "📋 Current Staff List", "No staff records found.")
+
+
+def update_staff():
+    sid = input("Enter Staff ID to update: ")
+    while True:
+        rows = find_rows(STAFF_FILE, STAFF_COLUMNS, "StaffID", sid)
+        if rows.empty:
+            print("❌ No staff found with that ID.")
+            return
+        current = rows.iloc[0].to_dict()
+        version = row_version(current, STAFF_COLUMNS)
+
+        print("Leave blank if no change.")
+        new_salary = input(f"Enter new salary [{current['Salary']}]: ")
+        new_role = input(f"Enter new role [{current['Role']}]: ")
+
+        salary = None
+        if new_salary:
+            try:
+                salary = float(new_salary)
+            except ValueError:
+                print("Invalid salary input — change ignored.")
+
+        try:
+            edit_staff(sid, salary, new_role or None, expected_version=version)
+        except ConflictError as e:
+            print(f"❌ {e}")
+            print("🔄 Reloaded the current values, please enter the changes again.")
+            continue
+        break
+    print("✅ Staff details updated successfully.")
+
+
+def remove_staff():
+    sid = input("Enter Staff ID to remove: ")
+    if not delete_staff(sid):
+        print("❌ No such staff found.")
+        return
+    print(f"✅ Staff {sid} removed successfully.")
+
+
+def search_staff():
+    role = input("Enter role to search (e.g., Receptionist, Chef): ")
+    results = find_staff_by_role(role)
+
+    if results.empty:
+        print("No staff found for this role.")
+    else:
+        print("\n👩‍🍳 Matching Staff:\n")
+        print(results.to_string(index=False))
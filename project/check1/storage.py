@@ -0,0 +1,1412 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime, date, timedelta
+import os
+import csv
+import sqlite3
+import tempfile
+import zlib
+import json
+from contextlib import contextmanager
+
+try:
+    # Optional: compact Arrow-backed text columns and columnar snapshots.
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    pa = feather = None
+    TEXT_DTYPE = "string"
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# ==========================================================
+# GLOBAL FILES
+ROOM_FILE = "rooms.csv"
+BOOKING_FILE = "bookings.csv"
+CUSTOMER_FILE = "customers.csv"
+
+
+ROOM_COLUMNS = ["RoomID", "RoomType", "Price", "Status"]
+BOOK_COLUMNS = ["BookingID", "CustomerName", "RoomID", "CheckIn", "CheckOut"]
+CUSTOMER_COLUMNS = ["CustomerID", "Name", "Phone", "Email", "RoomID", "DaysOfStay", "RegDate"]
+CSV_FILE = "customers.csv"
+
+ROOM_SERVICE_FILE = "room_services.csv"
+POOL_FILE = "swimming_pool_bookings.csv"
+BANQUET_FILE = "banquet_hall_bookings.csv"
+ADVENTURE_FILE = "adventure_activities.csv"
+
+FACILITY_COLUMNS = ["date", "time_slot", "slot_type", "customer_id", "status"]
+ADVENTURE_COLUMNS = ["date", "activity", "time_slot", "customer_id", "charge", "status"]
+
+# Append-only journals: new records go to "<file>.journal" as one line each and
+# are folded back into the base CSV by compact_journal().
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_COMPACT_BYTES = 64 * 1024
+JOURNALED_TABLES = {
+    ROOM_FILE: ROOM_COLUMNS,
+    CUSTOMER_FILE: CUSTOMER_COLUMNS,
+    BOOKING_FILE: BOOK_COLUMNS,
+    ROOM_SERVICE_FILE: FACILITY_COLUMNS,
+    POOL_FILE: FACILITY_COLUMNS,
+    BANQUET_FILE: FACILITY_COLUMNS,
+    ADVENTURE_FILE: ADVENTURE_COLUMNS,
+}
+
+STAFF_FILE = "staff.csv"
+STAFF_COLUMNS = ["StaffID", "Name", "Role", "Contact", "Salary", "JoinDate"]
+
+INVENTORY_FILE = "inventory.csv"
+INVENTORY_COLUMNS = ["ItemID", "ItemName", "Category", "Quantity", "MinThreshold", "UnitPrice", "LastUpdated"]
+
+# Stock is event-sourced: every change is one row appended here (Initial /
+# Restock / Use / Remove) with the quantity it left. Every STOCK_SNAPSHOT_EVERY
+# movements the stock of all items is written to STOCK_SNAPSHOT_FILE (and to
+# inventory.csv's Quantity column), so current stock, and stock at any past
+# moment, is the nearest snapshot plus a short replay of later movements.
+MOVEMENTS_FILE = "inventory_movements.csv"
+MOVEMENT_COLUMNS = ["MoveID", "Timestamp", "ItemID", "Type", "Change", "QuantityAfter", "Note"]
+STOCK_SNAPSHOT_FILE = "inventory_snapshots.csv"
+STOCK_SNAPSHOT_COLUMNS = ["SnapshotID", "Timestamp", "LastMoveID", "ItemID", "Quantity"]
+
+BILLING_FILE = "billings.csv"
+PAYMENT_FILE = "payments.csv"
+
+BILL_COLS = ["BillingID", "CustomerID", "RoomID", "RoomCharge", "ServiceCharge", "Tax", "Discount", "Total", "Date"]
+PAY_COLS = ["PaymentID", "BillingID", "PaymentMethod", "AmountPaid", "PaymentDate", "Status"]
+
+# Guest folio: append-only ledger of extra charges (paid facility slots...).
+# Balance is the guest's running total after the entry; billing posts a
+# negative "Bill" entry, so the balance is always what is still unbilled.
+CHARGES_FILE = "guest_charges.csv"
+CHARGE_COLUMNS = ["ChargeID", "CustomerID", "Date", "Source", "Description", "Amount", "Balance", "BillingID"]
+
+JOURNALED_TABLES[STAFF_FILE] = STAFF_COLUMNS
+JOURNALED_TABLES[INVENTORY_FILE] = INVENTORY_COLUMNS
+JOURNALED_TABLES[MOVEMENTS_FILE] = MOVEMENT_COLUMNS
+JOURNALED_TABLES[STOCK_SNAPSHOT_FILE] = STOCK_SNAPSHOT_COLUMNS
+JOURNALED_TABLES[BILLING_FILE] = BILL_COLS
+JOURNALED_TABLES[PAYMENT_FILE] = PAY_COLS
+JOURNALED_TABLES[CHARGES_FILE] = CHARGE_COLUMNS
+
+# Storage backend, chosen at startup: "csv" (default) or "sqlite".
+# With "sqlite" every table below lives in SQLITE_FILE with a primary key and
+# secondary indexes, so point lookups and single-row updates do not scan.
+STORAGE_BACKEND = os.environ.get("HOTEL_STORAGE", "csv")
+SQLITE_FILE = "hotel.db"
+
+SQL_TABLES = {
+    ROOM_FILE: ROOM_COLUMNS,
+    BOOKING_FILE: BOOK_COLUMNS,
+    CUSTOMER_FILE: CUSTOMER_COLUMNS,
+    BILLING_FILE: BILL_COLS,
+    PAYMENT_FILE: PAY_COLS,
+    INVENTORY_FILE: INVENTORY_COLUMNS,
+    MOVEMENTS_FILE: MOVEMENT_COLUMNS,
+    STOCK_SNAPSHOT_FILE: STOCK_SNAPSHOT_COLUMNS,
+    STAFF_FILE: STAFF_COLUMNS,
+    ROOM_SERVICE_FILE: FACILITY_COLUMNS,
+    POOL_FILE: FACILITY_COLUMNS,
+    BANQUET_FILE: FACILITY_COLUMNS,
+    ADVENTURE_FILE: ADVENTURE_COLUMNS,
+    CHARGES_FILE: CHARGE_COLUMNS,
+}
+TABLE_KEYS = {
+    ROOM_FILE: "RoomID",
+    BOOKING_FILE: "BookingID",
+    CUSTOMER_FILE: "CustomerID",
+    BILLING_FILE: "BillingID",
+    PAYMENT_FILE: "PaymentID",
+    INVENTORY_FILE: "ItemID",
+    STAFF_FILE: "StaffID",
+    CHARGES_FILE: "ChargeID",
+    MOVEMENTS_FILE: "MoveID",
+}
+TABLE_INDEXES = {
+    ROOM_FILE: ["RoomType", "Status"],
+    BOOKING_FILE: ["RoomID", "CheckIn", "CheckOut"],
+    CUSTOMER_FILE: ["Phone", "RoomID", "RegDate"],
+    BILLING_FILE: ["CustomerID", "RoomID", "Date"],
+    PAYMENT_FILE: ["BillingID", "PaymentDate"],
+    INVENTORY_FILE: ["Category"],
+    MOVEMENTS_FILE: ["ItemID", "Timestamp"],
+    STOCK_SNAPSHOT_FILE: ["SnapshotID", "ItemID"],
+    STAFF_FILE: ["Role"],
+    ROOM_SERVICE_FILE: ["date", "customer_id"],
+    POOL_FILE: ["date", "customer_id"],
+    BANQUET_FILE: ["date", "customer_id"],
+    ADVENTURE_FILE: ["date", "customer_id"],
+    CHARGES_FILE: ["CustomerID", "BillingID"],
+}
+_DB = None
+_SQL_READY = set()
+_SQL_WRITES = {}
+
+# Persistent ID sequences: entity -> last ID handed out, kept in SEQUENCE_FILE.
+# Each entity is seeded once from its table's highest existing ID; after that
+# new IDs never require reading the table.
+SEQUENCE_FILE = "id_sequences.json"
+ID_SEQUENCES = {
+    # entity: (table, ID column, prefix, first number, zero-padded width)
+    "customer": (CUSTOMER_FILE, "CustomerID", "", 1001, 0),
+    "booking": (BOOKING_FILE, "BookingID", "B", 1001, 0),
+    "bill": (BILLING_FILE, "BillingID", "", 1, 0),
+    "payment": (PAYMENT_FILE, "PaymentID", "", 1, 0),
+    "item": (INVENTORY_FILE, "ItemID", "IT", 1001, 0),
+    "staff": (STAFF_FILE, "StaffID", "S", 1, 3),
+    "charge": (CHARGES_FILE, "ChargeID", "", 1, 0),
+    "movement": (MOVEMENTS_FILE, "MoveID", "", 1, 0),
+    "stock_snapshot": (STOCK_SNAPSHOT_FILE, "SnapshotID", "", 1, 0),
+}
+
+BOOKING_DATE_FORMAT = "%d-%m-%Y"
+STAY_COLUMNS = ["RoomID", "CheckIn", "CheckOut"]
+REG_DATE_FORMATS = ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"]
+EPOCH = date(1970, 1, 1)
+
+# Column types per table, applied once when a table is loaded (load_table)
+# and, for incoming records, once when they are written (normalize_record).
+#   id/text  -> pandas string (Arrow-backed when pyarrow is installed)
+#   category -> categorical (canonical spelling);
+#   RoomID / ItemID outside their own tables are categorical too, as they
+#   repeat a few hundred values
+#   int/count -> Int32 (nullable); values outside its range load as missing
+#   money    -> float64, currency symbols and commas stripped
+#   date     -> datetime64 from BOOKING_DATE_FORMAT, datetime -> from REG_DATE_FORMATS
+TABLE_SCHEMAS = {
+    ROOM_FILE: {"RoomID": "id", "RoomType": "category", "Price": "money", "Status": "category"},
+    BOOKING_FILE: {"BookingID": "id", "CustomerName": "text", "RoomID": "category",
+                   "CheckIn": "date", "CheckOut": "date"},
+    CUSTOMER_FILE: {"CustomerID": "int", "Name": "text", "Phone": "id", "Email": "text",
+                    "RoomID": "category", "DaysOfStay": "count", "RegDate": "datetime"},
+    BILLING_FILE: {"BillingID": "id", "CustomerID": "int", "RoomID": "category", "RoomCharge": "money",
+                   "ServiceCharge": "money", "Tax": "money", "Discount": "money", "Total": "money",
+                   "Date": "datetime"},
+    PAYMENT_FILE: {"PaymentID": "id", "BillingID": "id", "PaymentMethod": "category",
+                   "AmountPaid": "money", "PaymentDate": "datetime", "Status": "category"},
+    INVENTORY_FILE: {"ItemID": "id", "ItemName": "text", "Category": "category", "Quantity": "count",
+                     "MinThreshold": "count", "UnitPrice": "money", "LastUpdated": "datetime"},
+    STAFF_FILE: {"StaffID": "id", "Name": "text", "Role": "category", "Contact": "id",
+                 "Salary": "money", "JoinDate": "datetime"},
+    MOVEMENTS_FILE: {"MoveID": "int", "Timestamp": "datetime", "ItemID": "category", "Type": "category",
+                     "Change": "int", "QuantityAfter": "count", "Note": "text"},
+    STOCK_SNAPSHOT_FILE: {"SnapshotID": "int", "Timestamp": "datetime", "LastMoveID": "int",
+                          "ItemID": "category", "Quantity": "count"},
+    CHARGES_FILE: {"ChargeID": "int", "CustomerID": "int", "Date": "datetime", "Source": "category",
+                   "Description": "text", "Amount": "money", "Balance": "money", "BillingID": "id"},
+}
+KIND_DTYPES = {"id": TEXT_DTYPE, "text": TEXT_DTYPE, "category": "category", "int": "Int32",
+               "count": "Int32", "money": "float64"}
+DATE_FORMATS = {"date": [BOOKING_DATE_FORMAT], "datetime": REG_DATE_FORMATS}
+# Explicit formats per date column. The first is canonical: records are
+# written in it (normalize_record) and it is tried first when parsing; the
+# others are only accepted for older rows. Unlisted columns use DATE_FORMATS.
+DATE_COLUMN_FORMATS = {
+    (BOOKING_FILE, "CheckIn"): [BOOKING_DATE_FORMAT],
+    (BOOKING_FILE, "CheckOut"): [BOOKING_DATE_FORMAT],
+    (CUSTOMER_FILE, "RegDate"): ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"],
+    (BILLING_FILE, "Date"): ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"],
+    (PAYMENT_FILE, "PaymentDate"): ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"],
+    (INVENTORY_FILE, "LastUpdated"): ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d"],
+    (STAFF_FILE, "JoinDate"): ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S"],
+    (MOVEMENTS_FILE, "Timestamp"): ["%Y-%m-%d %H:%M:%S"],
+    (STOCK_SNAPSHOT_FILE, "Timestamp"): ["%Y-%m-%d %H:%M:%S"],
+    (CHARGES_FILE, "Date"): ["%Y-%m-%d %H:%M:%S"],
+}
+
+# Canonical spellings for categorical columns ("upi" -> "UPI"); other values
+# are kept as typed, just trimmed.
+CATEGORY_VALUES = {
+    "RoomType": ["Single", "Double", "Suite", "Deluxe"],
+    "Status": ["Available", "Booked", "Maintenance", "Paid", "Partial", "Pending"],
+    "PaymentMethod": ["Cash", "UPI", "Card", "Credit Card", "Debit Card"],
+    "Category": ["Linen", "Cleaning", "Toiletries", "Food", "Minibar"],
+    "Type": ["Initial", "Restock", "Use", "Remove"],
+    "Role": ["Manager", "Receptionist", "Chef", "Housekeeping", "Security", "Waiter"],
+}
+TYPED_CACHE = {}
+# (table, date column) -> (stamp, int64 day numbers), see day_ordinals.
+DAY_CACHE = {}
+# Day number standing for a missing or unparseable date (what NaT converts to).
+NO_DAY = np.iinfo(np.int64).min
+
+# Columnar snapshots: "<table>.arrow" (Arrow IPC / Feather v2, uncompressed)
+# written next to each CSV from its typed frame, tagged with the table stamp
+# it was built from. Analytics read them memory-mapped and only the columns
+# they need; a snapshot whose stamp no longer matches its CSV is rebuilt on
+# the next read. Needs pyarrow and the CSV backend.
+SNAPSHOT_SUFFIX = ".arrow"
+SNAPSHOT_STAMP_KEY = b"hotel_stamp"
+SNAPSHOT_SCHEMA_KEY = b"hotel_schema"
+SNAPSHOT_STATS = {"reads": 0, "builds": 0}
+
+# Several front-desk terminals may share one data directory. Every table has
+# its own advisory lock file (<table>.lock): readers take it shared, writers
+# exclusive, so clerks working on different tables never wait on each other.
+# Table views show PAGE_ROWS rows at a time and stream the file in chunks
+# of PAGER_CHUNK_ROWS rows to find them.
+PAGE_ROWS = 20
+PAGER_CHUNK_ROWS = 50_000
+
+LOCK_SUFFIX = ".lock"
+LOCK_TIMEOUT = 30
+_LOCKS = {}
+
+# Parsed tables shared across the whole session, keyed by (path, dtype) and
+# validated against the file's (mtime, size) on every read.
+TABLE_CACHE = {}
+CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+# ==========================================================
+# -------------------- LOCKS & VERSIONS ---------------------
+class ConflictError(ValueError):
+    """Raised when a row was changed by another terminal after we read it."""
+
+
+class DuplicatePaymentError(ValueError):
+    """Raised when a payment is recorded against a bill that is already settled."""
+
+
+class DuplicateKeyError(ValueError):
+    """Raised when an insert would repeat an existing primary key; nothing is written."""
+
+
+def _lock_file(fh, shared):
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+    elif msvcrt is not None:
+        # msvcrt has no shared locks; LK_LOCK itself retries for ~10 seconds.
+        fh.seek(0)
+        for _ in range(max(1, LOCK_TIMEOUT // 10)):
+            try:
+                msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+        raise TimeoutError(f"Could not lock {fh.name}")
+
+
+def _unlock_file(fh):
+    if fcntl is not None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def table_lock(filename, shared=False):
+    """
+    Advisory lock on one table, held for the duration of the with-block.
+    Re-entrant within a process: nested calls on the same table reuse the
+    outer lock (upgrading it to exclusive if needed). SQLite tables rely on
+    the database's own locking instead.
+    """
+    if use_sqlite(filename):
+        yield
+        return
+
+    path = os.path.abspath(filename) + LOCK_SUFFIX
+    held = _LOCKS.get(path)
+    if held is not None:
+        if held["shared"] and not shared:
+            _lock_file(held["fh"], shared=False)
+            held["shared"] = False
+        held["depth"] += 1
+        try:
+            yield
+        finally:
+            held["depth"] -= 1
+        return
+
+    fh = open(path, "a+")
+    try:
+        _lock_file(fh, shared)
+        _LOCKS[path] = {"fh": fh, "shared": shared, "depth": 1}
+        try:
+            yield
+        finally:
+            del _LOCKS[path]
+            _unlock_file(fh)
+    finally:
+        fh.close()
+
+
+def atomic_write_csv(filename, df):
+    atomic_write(filename, lambda f: df.to_csv(f, index=False))
+
+
+def atomic_write(filename, write, binary=False):
+    """
+    Calls write(f) on a temporary file next to filename and renames it into
+    place, so readers only ever see the old file or the complete new one.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(filename) + ".", suffix=".tmp", dir=directory)
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", newline="", encoding="utf-8")) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, os.stat(filename).st_mode if os.path.exists(filename) else 0o644)
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _version_text(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    return str(value)
+
+
+def row_version(record, columns):
+    """
+    Version stamp of one row: a checksum of its stored values. Read it along
+    with the row and pass it back as expected_version when updating; if
+    another terminal changed that row meanwhile, the update is refused.
+    """
+    text = "\x1f".join(_version_text(record.get(col)) for col in columns)
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def row_versions(df, columns):
+    """row_version for every row of df, as a Series aligned with df."""
+    return pd.Series([row_version(rec, columns) for rec in df.to_dict("records")],
+                     index=df.index, dtype="int64")
+
+
+# ==========================================================
+# ---------------------- CSV HELPERS ------------------------
+def file_stamp(path):
+    """
+    Returns (mtime_ns, size, inode) for a file, or None if it does not exist.
+    Atomic rewrites give the file a new inode, so even two writes within one
+    mtime tick get different stamps.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def read_cached(path, dtype=str):
+    """
+    pd.read_csv through the session cache.
+    The file is only re-parsed when its mtime or size changed; callers
+    always get their own copy so they can modify it freely.
+    """
+    key = (os.path.abspath(path), dtype)
+    sql = use_sqlite(path)
+    stamp = sql_stamp(path) if sql else file_stamp(path)
+    entry = TABLE_CACHE.get(key)
+    if stamp is not None and entry is not None and entry[0] == stamp:
+        CACHE_STATS["hits"] += 1
+        return entry[1].copy()
+
+    CACHE_STATS["misses"] += 1
+    df = sql_read(path, dtype) if sql else pd.read_csv(path, dtype=dtype)
+    TABLE_CACHE[key] = (stamp, df)
+    return df.copy()
+
+
+def invalidate_cache(path):
+    """Drops every cached parse of a file (and of its journal)."""
+    targets = {os.path.abspath(path), os.path.abspath(journal_path(path))}
+    for key in [k for k in TABLE_CACHE if k[0] in targets]:
+        del TABLE_CACHE[key]
+
+
+def cache_stats():
+    """Returns hit/miss counters for the table cache."""
+    total = CACHE_STATS["hits"] + CACHE_STATS["misses"]
+    return {
+        "hits": CACHE_STATS["hits"],
+        "misses": CACHE_STATS["misses"],
+        "hit_rate": (CACHE_STATS["hits"] / total * 100) if total else 0.0,
+        "tables": len(TABLE_CACHE),
+    }
+
+
+def show_cache_stats():
+    stats = cache_stats()
+    print("\n--- TABLE CACHE ---")
+    print(f"Hits: {stats['hits']}")
+    print(f"Misses: {stats['misses']}")
+    print(f"Hit Rate: {stats['hit_rate']:.2f}%")
+    print(f"Cached Tables: {stats['tables']}")
+    if feather is not None:
+        print(f"Snapshot Reads: {SNAPSHOT_STATS['reads']}")
+        print(f"Snapshot Builds: {SNAPSHOT_STATS['builds']}")
+
+
+def table_stamp(filename):
+    """Change stamp for a whole table (base file + journal, or its SQL table)."""
+    if use_sqlite(filename):
+        return sql_stamp(filename)
+    return (file_stamp(filename), file_stamp(journal_path(filename)))
+
+
+def journal_path(filename):
+    return filename + JOURNAL_SUFFIX
+
+
+def read_journal(filename, dtype=str):
+    """Returns the rows appended to a table's journal, or None if there are none."""
+    path = journal_path(filename)
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    try:
+        return read_cached(path, dtype=dtype)
+    except pd.errors.EmptyDataError:
+        return None
+
+
+def load_csv(filename, columns, dtype=str):
+    """
+    Loads a CSV file safely. 
+    If file is missing or empty, creates a new one with the given columns.
+    Rows still sitting in the file's journal are appended to the result.
+    """
+    if use_sqlite(filename):
+        return read_cached(filename, dtype=dtype)
+
+    # Shared lock: a writer cannot swap the base file or fold the journal
+    # in between our two reads.
+    with table_lock(filename, shared=True):
+        try:
+            # Check if the file exists and is not empty
+            if os.path.exists(filename) and os.path.getsize(filename) > 0:
+                df = read_cached(filename, dtype=dtype)
+            else:
+                print(f"⚠️ File '{filename}' is empty or missing headers. Creating a new one.")
+                df = pd.DataFrame(columns=columns)
+                atomic_write_csv(filename, df)
+
+        except pd.errors.EmptyDataError:
+            # Handle the specific "no columns" error
+            print(f"⚠️ '{filename}' was empty. Creating a new blank file.")
+            df = pd.DataFrame(columns=columns)
+            atomic_write_csv(filename, df)
+
+        except FileNotFoundError:
+            print(f"⚠️ '{filename}' not found. Creating a new file.")
+            df = pd.DataFrame(columns=columns)
+            atomic_write_csv(filename, df)
+
+        except Exception as e:
+            print(f"❌ Error loading {filename}: {e}")
+            return pd.DataFrame(columns=columns)
+
+        journal = read_journal(filename, dtype)
+    if journal is not None and not journal.empty:
+        df = pd.concat([df, journal], ignore_index=True)
+    return df
+
+
+def save_csv(filename, df):
+    """Rewrites the whole table. Any journal rows are assumed to be part of df."""
+    if use_sqlite(filename):
+        sql_replace(filename, df)
+        return
+
+    with table_lock(filename):
+        atomic_write_csv(filename, df)
+        if os.path.exists(journal_path(filename)):
+            os.remove(journal_path(filename))
+
+        # Write-through: keep the text view of what we just wrote so the next
+        # load_csv does not have to parse it again. The stamp must be taken
+        # before the lock is released, or it could describe another
+        # terminal's write.
+        invalidate_cache(filename)
+        text = df.astype(str).where(df.notna(), np.nan).replace("", np.nan)
+        TABLE_CACHE[(os.path.abspath(filename), str)] = (file_stamp(filename), text)
+
+
+def append_record(filename, record, columns):
+    """
+    Appends a single record to the table's journal as one CSV line,
+    so adding a row costs O(1) instead of rewriting the whole file.
+    """
+    append_records(filename, [record], columns)
+
+
+def append_records(filename, records, columns):
+    """
+    Appends several records (dicts) to the table's journal in one write.
+    Under sqlite a repeated primary key raises DuplicateKeyError.
+    """
+    records = [normalize_record(filename, rec) for rec in records]
+    if use_sqlite(filename):
+        sql_insert(filename, records)
+        return
+
+    path = journal_path(filename)
+    with table_lock(filename):
+        new_journal = not os.path.exists(path) or os.path.getsize(path) == 0
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            if new_journal:
+                writer.writerow(columns)
+            writer.writerows(
+                ["" if pd.isna(rec.get(col)) else rec.get(col) for col in columns] for rec in records
+            )
+
+        # Fold the journal back in once it outgrows the base file, which keeps
+        # the amortised cost of an append constant.
+        base_size = os.path.getsize(filename) if os.path.exists(filename) else 0
+        if os.path.getsize(path) > max(JOURNAL_COMPACT_BYTES, base_size):
+            compact_journal(filename, columns)
+
+
+def compact_journal(filename, columns):
+    """Folds a table's journal into its base CSV file."""
+    with table_lock(filename):
+        if read_journal(filename) is None:
+            return
+        save_csv(filename, load_csv(filename, columns))
+
+
+def compact_all_journals():
+    """Compacts every journaled table; run at shutdown or from maintenance scripts."""
+    if STORAGE_BACKEND == "sqlite":
+        return
+    for filename, columns in JOURNALED_TABLES.items():
+        compact_journal(filename, columns)
+
+
+def find_rows(filename, columns, key_col, value):
+    """Returns the rows whose key_col equals value (an indexed lookup under SQLite)."""
+    if use_sqlite(filename):
+        return sql_select(filename, key_col, value)
+    df = load_csv(filename, columns)
+    return df[df[key_col] == str(value)]
+
+
+def update_rows(filename, columns, key_col, value, changes, expected_version=None):
+    """
+    Sets the given column values on rows matching key_col == value. Returns the row count.
+    With expected_version (see row_version) the update is refused with
+    ConflictError if the row no longer matches what the caller read.
+    """
+    changes = normalize_record(filename, changes)
+    if use_sqlite(filename):
+        return sql_update(filename, key_col, value, changes, expected_version)
+    with table_lock(filename):
+        df = load_csv(filename, columns)
+        mask = df[key_col] == str(value)
+        if expected_version is not None and mask.any():
+            if (row_versions(df[mask], columns) != expected_version).any():
+                raise ConflictError("This record was changed on another terminal. Reload and try again.")
+        if mask.any():
+            for col, val in changes.items():
+                df.loc[mask, col] = np.nan if pd.isna(val) else str(val)
+            save_csv(filename, df)
+    return int(mask.sum())
+
+
+def delete_rows(filename, columns, key_col, value):
+    """Deletes rows matching key_col == value. Returns the row count."""
+    if use_sqlite(filename):
+        return sql_delete(filename, key_col, value)
+    with table_lock(filename):
+        df = load_csv(filename, columns)
+        mask = df[key_col] == str(value)
+        if mask.any():
+            save_csv(filename, df[~mask])
+    return int(mask.sum())
+
+
+def delete_last_row(filename, columns, match):
+    """
+    Deletes the most recently added row whose columns equal the values in
+    match (a dict), e.g. to take back a log row that could not be completed.
+    Returns the row count (0 or 1).
+    """
+    match = normalize_record(filename, match)
+    if use_sqlite(filename):
+        return sql_delete_last(filename, match)
+    with table_lock(filename):
+        df = load_csv(filename, columns)
+        mask = pd.Series(True, index=df.index)
+        for col, val in match.items():
+            mask &= df[col] == str(val)
+        if not mask.any():
+            return 0
+        save_csv(filename, df.drop(index=df.index[mask][-1]))
+    return 1
+
+
+# ==========================================================
+# --------------------- ID SEQUENCES ------------------------
+def format_id(entity, number):
+    _, _, prefix, _, width = ID_SEQUENCES[entity]
+    if not prefix and not width:
+        return int(number)
+    return f"{prefix}{int(number):0{width}}"
+
+
+def highest_existing_id(entity):
+    """Largest numeric part of the entity's existing IDs (used once, to seed its sequence)."""
+    filename, column, _, start, _ = ID_SEQUENCES[entity]
+    columns = SQL_TABLES.get(filename) or JOURNALED_TABLES.get(filename) or [column]
+    if not use_sqlite(filename) and not os.path.exists(filename):
+        return start - 1
+    ids = load_csv(filename, columns)[column].dropna().astype(str)
+    numbers = pd.to_numeric(ids.str.extract(r"(\d+)(?:\.0)?$")[0], errors="coerce").dropna()
+    return max(start - 1, int(numbers.max())) if not numbers.empty else start - 1
+
+
+def read_sequences():
+    try:
+        with open(SEQUENCE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def reserve_ids(entity, count=1):
+    """
+    Hands out `count` consecutive, never-reused IDs for an entity and returns
+    them as a list. The new high-water mark is written atomically before the
+    IDs are returned, so a crash can leave a gap but never a duplicate.
+    Reserving a block for a bulk import costs the same as reserving one ID.
+    """
+    if entity not in ID_SEQUENCES:
+        raise ValueError(f"Unknown ID sequence '{entity}'")
+    if count < 1:
+        return []
+    # Seeding reads the table, so do it before taking the sequence lock:
+    # callers may already hold that table's lock.
+    seed = highest_existing_id(entity) if entity not in read_sequences() else None
+    with table_lock(SEQUENCE_FILE):
+        sequences = read_sequences()
+        if entity not in sequences:
+            sequences[entity] = seed if seed is not None else highest_existing_id(entity)
+        first = int(sequences[entity]) + 1
+        sequences[entity] = first + count - 1
+        atomic_write(SEQUENCE_FILE, lambda f: json.dump(sequences, f, indent=2, sort_keys=True))
+    return [format_id(entity, n) for n in range(first, first + count)]
+
+
+def next_id(entity):
+    return reserve_ids(entity, 1)[0]
+
+
+# ==========================================================
+# ---------------------- TABLE SCHEMAS ----------------------
+def parse_dates(values, formats):
+    """Parses text dates trying each format in turn; anything else becomes NaT."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    values = values.astype("string").str.strip()
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    for fmt in formats:
+        missing = parsed.isna() & values.notna()
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(values[missing], format=fmt, errors="coerce")
+    return parsed
+
+
+def date_formats(filename, column, kind="datetime"):
+    """The formats a table's date column is parsed with, canonical one first."""
+    return DATE_COLUMN_FORMATS.get((filename, column), DATE_FORMATS.get(kind))
+
+
+def to_day_ordinals(values):
+    """datetime64 values as int64 day numbers (see day_number); NaT becomes NO_DAY."""
+    return np.asarray(values, dtype="datetime64[ns]").astype("datetime64[D]").astype(np.int64)
+
+
+def clean_money(values):
+    """Converts a money column to float, stripping currency symbols/commas where present."""
+    numbers = pd.to_numeric(values, errors="coerce")
+    messy = numbers.isna() & values.notna()
+    if messy.any():
+        text = values[messy].astype(str).str.replace(r"[^\d.]", "", regex=True)
+        numbers[messy] = pd.to_numeric(text, errors="coerce")
+    return numbers.astype("float64")
+
+
+def clean_price(series):
+    """Strips currency symbols/commas from a Price column and converts it to float."""
+    return clean_money(series)
+
+
+def canonical_categories(values, column):
+    text = values.astype("string").str.strip()
+    canon = {v.lower(): v for v in CATEGORY_VALUES.get(column, [])}
+    if canon:
+        text = text.str.lower().map(canon).astype("string").fillna(text)
+    return text
+
+
+def normalize_column(values, kind, column, filename=None):
+    """Converts one text column to the dtype of its schema kind."""
+    if kind in DATE_FORMATS:
+        return parse_dates(values, date_formats(filename, column, kind))
+    if kind == "money":
+        return clean_money(values)
+    if kind in ("int", "count"):
+        numbers = pd.to_numeric(values, errors="coerce")
+        limit = np.iinfo(KIND_DTYPES[kind].lower()).max
+        return numbers.where((numbers == numbers.round()) & (numbers.abs() <= limit)).astype(KIND_DTYPES[kind])
+    if kind == "category":
+        return canonical_categories(values, column).astype("category")
+    return values.astype("string").str.strip().astype(KIND_DTYPES[kind])
+
+
+def apply_schema(df, filename):
+    """Returns df with every column of the table's schema converted to its dtype."""
+    schema = TABLE_SCHEMAS[filename]
+    df = df.copy()
+    for col, kind in schema.items():
+        if col not in df.columns:
+            df[col] = pd.NA
+        df[col] = normalize_column(df[col], kind, col, filename)
+    return df
+
+
+def load_table(filename):
+    """
+    Loads a table with the dtypes from TABLE_SCHEMAS. The typed frame is
+    cached per table and only rebuilt when the table's stamp changes, so the
+    parsing/cleaning cost is paid once per change rather than once per report.
+    """
+    columns = list(TABLE_SCHEMAS[filename])
+    with table_lock(filename, shared=True):
+        stamp = table_stamp(filename)
+        entry = TYPED_CACHE.get(filename)
+        if entry is not None and entry[0] == stamp:
+            return entry[1].copy()
+        df = apply_schema(load_csv(filename, columns), filename)
+    TYPED_CACHE[filename] = (stamp, df)
+    return df.copy()
+
+
+def normalize_record(filename, record):
+    """
+    Cleans one incoming record (or a dict of changes) before it is written:
+    trims text, spells categories canonically, strips currency from money,
+    makes counts integral and rewrites dates in their column's canonical
+    format (unparseable dates are left as given).
+    """
+    schema = TABLE_SCHEMAS.get(filename)
+    if not schema:
+        return record
+    clean = dict(record)
+    for col, value in record.items():
+        kind = schema.get(col)
+        if kind is None or value is None or (not isinstance(value, str) and pd.isna(value)):
+            continue
+        if kind in ("id", "text"):
+            clean[col] = str(value).strip()
+        elif kind == "category":
+            clean[col] = canonical_categories(pd.Series([str(value)]), col).iloc[0]
+        elif kind == "money":
+            number = clean_money(pd.Series([value], dtype=object)).iloc[0]
+            clean[col] = value if pd.isna(number) else float(number)
+        elif kind in ("int", "count"):
+            try:
+                clean[col] = int(float(value))
+            except (TypeError, ValueError):
+                pass
+        elif kind in DATE_FORMATS:
+            formats = date_formats(filename, col, kind)
+            if isinstance(value, (datetime, date)):
+                parsed = pd.Timestamp(value)
+            else:
+                parsed = parse_dates(pd.Series([str(value)], dtype=object), formats).iloc[0]
+            if pd.notna(parsed):
+                clean[col] = parsed.strftime(formats[0])
+    return clean
+
+
+def memory_report():
+    """
+    Memory of every table loaded as plain text (dtype=str) versus with its
+    schema dtypes. Returns a DataFrame with one row per table plus a total.
+    """
+    rows = []
+    for filename, schema in TABLE_SCHEMAS.items():
+        if not use_sqlite(filename) and not os.path.exists(filename):
+            continue
+        text = load_csv(filename, list(schema))
+        typed = load_table(filename)
+        rows.append({
+            "Table": filename,
+            "Rows": len(typed),
+            "Text MB": text.memory_usage(deep=True).sum() / 1e6,
+            "Typed MB": typed.memory_usage(deep=True).sum() / 1e6,
+        })
+    report = pd.DataFrame(rows, columns=["Table", "Rows", "Text MB", "Typed MB"])
+    if not report.empty:
+        total = report[["Rows", "Text MB", "Typed MB"]].sum()
+        report.loc[len(report)] = ["TOTAL", total["Rows"], total["Text MB"], total["Typed MB"]]
+        report["Rows"] = report["Rows"].astype(int)
+        report["Saving x"] = (report["Text MB"] / report["Typed MB"]).round(2)
+    return report
+
+
+def show_memory_report():
+    report = memory_report()
+    if report.empty:
+        print("No tables found.")
+        return
+    print("\n--- TABLE MEMORY (text vs typed) ---")
+    print(report.round(3).to_string(index=False))
+
+
+# ==========================================================
+# ---------------- COLUMNAR SNAPSHOTS ----------------------
+def snapshots_enabled(filename):
+    return feather is not None and filename in TABLE_SCHEMAS and not use_sqlite(filename)
+
+
+def snapshot_path(filename):
+    return filename + SNAPSHOT_SUFFIX
+
+
+def snapshot_schema(filename):
+    return json.dumps(TABLE_SCHEMAS[filename], sort_keys=True).encode()
+
+
+def snapshot_stamp(filename):
+    """The table stamp a snapshot was built from (as JSON text), or None if absent or of an older schema."""
+    path = snapshot_path(filename)
+    if not os.path.exists(path):
+        return None
+    try:
+        with pa.memory_map(path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    stamp = metadata.get(SNAPSHOT_STAMP_KEY)
+    if stamp is None or metadata.get(SNAPSHOT_SCHEMA_KEY) != snapshot_schema(filename):
+        return None
+    return stamp.decode()
+
+
+def write_snapshot(filename, df, stamp):
+    """Writes df as the table's snapshot, tagged with the stamp it reflects."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[SNAPSHOT_STAMP_KEY] = json.dumps(stamp).encode()
+    metadata[SNAPSHOT_SCHEMA_KEY] = snapshot_schema(filename)
+    table = table.replace_schema_metadata(metadata)
+    # Uncompressed so the columns can be used straight from the mapped file.
+    atomic_write(snapshot_path(filename),
+                 lambda f: feather.write_feather(table, f, compression="uncompressed"), binary=True)
+    SNAPSHOT_STATS["builds"] += 1
+
+
+def refresh_snapshot(filename):
+    """
+    Makes sure the table's snapshot matches the table, rebuilding it from
+    the typed frame if not. Returns the stamp it reflects.
+    """
+    df = load_table(filename)
+    stamp = TYPED_CACHE[filename][0]
+    if snapshot_stamp(filename) != json.dumps(stamp):
+        write_snapshot(filename, df, stamp)
+    return stamp
+
+
+def load_columns(filename, columns):
+    """
+    Typed columns of a table for read-only analytics. Served from the
+    in-memory typed frame when it is current, else from the memory-mapped
+    snapshot (only the requested columns are read), else the snapshot is
+    rebuilt from the CSV. Without pyarrow this is load_table()[columns].
+    """
+    columns = list(columns)
+    if not snapshots_enabled(filename):
+        return load_table(filename)[columns]
+    with table_lock(filename, shared=True):
+        stamp = table_stamp(filename)
+        entry = TYPED_CACHE.get(filename)
+        if entry is not None and entry[0] == stamp:
+            return entry[1][columns].copy()
+        if snapshot_stamp(filename) == json.dumps(stamp):
+            try:
+                table = feather.read_table(snapshot_path(filename), columns=columns, memory_map=True)
+            except (OSError, pa.ArrowInvalid):
+                table = None
+            if table is not None:
+                SNAPSHOT_STATS["reads"] += 1
+                return table.to_pandas()
+    df = load_table(filename)
+    write_snapshot(filename, df, TYPED_CACHE[filename][0])
+    return df[columns]
+
+
+def refresh_snapshots():
+    """Brings every table's snapshot up to date. Returns how many were rebuilt."""
+    before = SNAPSHOT_STATS["builds"]
+    for filename in TABLE_SCHEMAS:
+        if snapshots_enabled(filename) and os.path.exists(filename):
+            refresh_snapshot(filename)
+    return SNAPSHOT_STATS["builds"] - before
+
+
+# ==========================================================
+# ----------------------- DATE LAYER ------------------------
+# Date columns are parsed once per table change with their explicit formats
+# (DATE_COLUMN_FORMATS) and kept as int64 day numbers, so date filters are
+# integer comparisons and stay arithmetic is integer subtraction.
+def day_ordinals(filename, column):
+    """A table's date column as a read-only array of day numbers (NO_DAY where missing), cached."""
+    cached = DAY_CACHE.get((filename, column))
+    if cached is not None and cached[0] == table_stamp(filename):
+        return cached[1]
+    with table_lock(filename, shared=True):
+        stamp = table_stamp(filename)
+        days = to_day_ordinals(load_columns(filename, [column])[column])
+    days.flags.writeable = False
+    DAY_CACHE[(filename, column)] = (stamp, days)
+    return days
+
+
+def day_range_mask(days, first=None, last=None):
+    """True where a day number lies in [first, last); either bound may be None."""
+    mask = days != NO_DAY
+    if first is not None:
+        mask &= days >= first
+    if last is not None:
+        mask &= days < last
+    return mask
+
+
+def rows_between(filename, column, first=None, last=None, columns=None):
+    """Rows of a table whose date column falls on the days [first, last)."""
+    with table_lock(filename, shared=True):
+        mask = day_range_mask(day_ordinals(filename, column), first, last)
+        frame = load_columns(filename, columns or list(TABLE_SCHEMAS[filename]))
+    return frame[mask]
+
+
+def day_number(d):
+    """Days since 1970-01-01 for a date."""
+    return (d - EPOCH).days
+
+
+def parse_booking_date(text):
+    """Parses a dd-mm-yyyy booking date into a day number, or None if invalid."""
+    try:
+        return day_number(datetime.strptime(text, BOOKING_DATE_FORMAT).date())
+    except (TypeError, ValueError):
+        return None
+
+
+def booking_stays(bookings=None):
+    """
+    CheckIn/CheckOut of a bookings frame as day numbers; without a frame,
+    the cached day numbers of bookings.csv (day_ordinals) are used.
+    Returns (RoomIDs, starts, ends) for the bookings with valid dates only.
+    """
+    if bookings is None:
+        with table_lock(BOOKING_FILE, shared=True):
+            starts = day_ordinals(BOOKING_FILE, "CheckIn")
+            ends = day_ordinals(BOOKING_FILE, "CheckOut")
+            room_ids = load_columns(BOOKING_FILE, ["RoomID"])["RoomID"]
+    else:
+        formats = date_formats(BOOKING_FILE, "CheckIn")
+        starts = to_day_ordinals(parse_dates(bookings["CheckIn"], formats))
+        ends = to_day_ordinals(parse_dates(bookings["CheckOut"], formats))
+        room_ids = bookings["RoomID"]
+    valid = (starts != NO_DAY) & (ends != NO_DAY) & (ends > starts)
+    return room_ids[valid].astype(str).str.strip().to_numpy(), starts[valid], ends[valid]
+
+
+# ==========================================================
+# ------------------- SQLITE BACKEND ------------------------
+def use_sqlite(filename):
+    return STORAGE_BACKEND == "sqlite" and filename in SQL_TABLES
+
+
+def get_db():
+    global _DB
+    if _DB is None:
+        _DB = sqlite3.connect(SQLITE_FILE, timeout=30)
+        _DB.execute("PRAGMA journal_mode=WAL")
+    return _DB
+
+
+def sql_table(filename):
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def ensure_sql_table(filename):
+    """Creates the table, its primary key and its secondary indexes if missing."""
+    if filename in _SQL_READY:
+        return
+    db = get_db()
+    table = sql_table(filename)
+    key = TABLE_KEYS.get(filename)
+    cols = ", ".join(
+        f'"{col}" TEXT' + (" PRIMARY KEY" if col == key else "") for col in SQL_TABLES[filename]
+    )
+    db.execute(f'CREATE TABLE IF NOT EXISTS "{table}" ({cols})')
+    for col in TABLE_INDEXES.get(filename, []):
+        db.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table}_{col}" ON "{table}" ("{col}")')
+    db.commit()
+    _SQL_READY.add(filename)
+
+
+def ensure_sql_schema(name, create_sql):
+    """Runs the CREATE statement of a table the backend does not manage itself, once per session."""
+    if name in _SQL_READY:
+        return
+    db = get_db()
+    db.execute(create_sql)
+    db.commit()
+    _SQL_READY.add(name)
+
+
+def sql_stamp(filename):
+    """Cache stamp for a SQL table: other connections' commits plus our own writes."""
+    version = get_db().execute("PRAGMA data_version").fetchone()[0]
+    return (version, _SQL_WRITES.get(filename, 0))
+
+
+def _sql_changed(filename):
+    _SQL_WRITES[filename] = _SQL_WRITES.get(filename, 0) + 1
+
+
+def _sql_value(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    return str(value)
+
+
+def _sql_column(filename, col):
+    if col not in SQL_TABLES[filename]:
+        raise ValueError(f"Unknown column '{col}' for {filename}")
+    return f'"{col}"'
+
+
+def infer_dtypes(df):
+    """Mimics read_csv type inference for tables that are stored as text."""
+    for col in df.columns:
+        converted = pd.to_numeric(df[col], errors="coerce")
+        if converted.notna().sum() == df[col].notna().sum():
+            df[col] = converted
+    return df
+
+
+def sql_read(filename, dtype=str):
+    ensure_sql_table(filename)
+    df = pd.read_sql_query(f'SELECT * FROM "{sql_table(filename)}"', get_db())
+    df = df.where(df.notna(), np.nan)
+    return df if dtype is str else infer_dtypes(df)
+
+
+def sql_select(filename, key_col, value):
+    ensure_sql_table(filename)
+    query = f'SELECT * FROM "{sql_table(filename)}" WHERE {_sql_column(filename, key_col)} = ?'
+    df = pd.read_sql_query(query, get_db(), params=(_sql_value(value),))
+    return df.where(df.notna(), np.nan)
+
+
+def sql_insert(filename, records):
+    """
+    Inserts records (dicts) in one transaction. On a duplicate key the whole
+    transaction is rolled back and DuplicateKeyError is raised.
+    """
+    ensure_sql_table(filename)
+    columns = SQL_TABLES[filename]
+    placeholders = ", ".join("?" for _ in columns)
+    rows = [tuple(_sql_value(rec.get(col)) for col in columns) for rec in records]
+    db = get_db()
+    try:
+        with db:
+            db.executemany(f'INSERT INTO "{sql_table(filename)}" VALUES ({placeholders})', rows)
+    except sqlite3.IntegrityError as e:
+        key = TABLE_KEYS.get(filename, "Key")
+        raise DuplicateKeyError(f"{key} already exists; nothing was saved to {filename}.") from e
+    finally:
+        _sql_changed(filename)
+
+
+def sql_replace(filename, df):
+    """Replaces the whole table with df in one transaction."""
+    ensure_sql_table(filename)
+    columns = SQL_TABLES[filename]
+    placeholders = ", ".join("?" for _ in columns)
+    present = [col for col in columns if col in df.columns]
+    rows = [
+        tuple(_sql_value(rec.get(col)) for col in columns)
+        for rec in df[present].to_dict("records")
+    ]
+    db = get_db()
+    with db:
+        db.execute(f'DELETE FROM "{sql_table(filename)}"')
+        db.executemany(f'INSERT OR REPLACE INTO "{sql_table(filename)}" VALUES ({placeholders})', rows)
+    _sql_changed(filename)
+
+
+def sql_update(filename, key_col, value, changes, expected_version=None):
+    ensure_sql_table(filename)
+    sets = ", ".join(f"{_sql_column(filename, col)} = ?" for col in changes)
+    params = [_sql_value(v) for v in changes.values()] + [_sql_value(value)]
+    db = get_db()
+    with db:
+        if expected_version is not None:
+            # Take the write lock before checking, so the check and the
+            # update are one atomic step.
+            db.execute("BEGIN IMMEDIATE")
+            columns = SQL_TABLES[filename]
+            current = db.execute(
+                f'SELECT * FROM "{sql_table(filename)}" WHERE {_sql_column(filename, key_col)} = ?',
+                (_sql_value(value),),
+            ).fetchall()
+            if any(row_version(dict(zip(columns, row)), columns) != expected_version for row in current):
+                raise ConflictError("This record was changed on another terminal. Reload and try again.")
+        cur = db.execute(
+            f'UPDATE "{sql_table(filename)}" SET {sets} WHERE {_sql_column(filename, key_col)} = ?',
+            params,
+        )
+    _sql_changed(filename)
+    return cur.rowcount
+
+
+def sql_delete(filename, key_col, value):
+    ensure_sql_table(filename)
+    db = get_db()
+    with db:
+        cur = db.execute(
+            f'DELETE FROM "{sql_table(filename)}" WHERE {_sql_column(filename, key_col)} = ?',
+            (_sql_value(value),),
+        )
+    _sql_changed(filename)
+    return cur.rowcount
+
+
+def sql_delete_last(filename, match):
+    ensure_sql_table(filename)
+    table = sql_table(filename)
+    where = " AND ".join(f"{_sql_column(filename, col)} = ?" for col in match)
+    db = get_db()
+    with db:
+        cur = db.execute(
+            f'DELETE FROM "{table}" WHERE rowid = (SELECT MAX(rowid) FROM "{table}" WHERE {where})',
+            [_sql_value(v) for v in match.values()],
+        )
+    _sql_changed(filename)
+    return cur.rowcount
+
+
+def sql_chunks(filename, contains=None, limit=-1, offset=0, chunksize=None):
+    """
+    Streams a table in row order, chunksize rows at a time. contains=(col, text)
+    keeps rows whose col contains text (case-insensitive); limit/offset page
+    through the result inside SQLite.
+    """
+    ensure_sql_table(filename)
+    query, params = f'SELECT * FROM "{sql_table(filename)}"', []
+    if contains:
+        query += f" WHERE instr(lower({_sql_column(filename, contains[0])}), lower(?)) > 0"
+        params.append(contains[1])
+    query += " ORDER BY rowid LIMIT ? OFFSET ?"
+    params += [limit, offset]
+    for chunk in pd.read_sql_query(query, get_db(), params=params, chunksize=chunksize or PAGER_CHUNK_ROWS):
+        yield chunk.where(chunk.notna(), np.nan)
+
+
+def import_csvs_to_sqlite():
+    """One-shot import of every existing CSV table (and its journal) into SQLITE_FILE."""
+    for filename, columns in SQL_TABLES.items():
+        if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+            continue
+        df = pd.read_csv(filename, dtype=str)
+        journal = read_journal(filename)
+        if journal is not None and not journal.empty:
+            df = pd.concat([df, journal], ignore_index=True)
+        for col in columns:
+            if col not in df.columns:
+                df[col] = np.nan
+        sql_replace(filename, df)
+        print(f"✅ Imported {len(df)} rows from {filename} into {SQLITE_FILE}:{sql_table(filename)}")
+
+
+# ==========================================================
+# ---------------------- TABLE PAGER ------------------------
+# The view_* screens show one page at a time. Pages are read by streaming
+# the table in chunks, so memory stays bounded by the chunk size (plus the
+# rows up to the current page when sorting) however large the table is.
+def table_chunks(filename, contains=None, limit=-1, offset=0):
+    """Yields a table as text DataFrames of at most PAGER_CHUNK_ROWS rows, journal rows last."""
+    if use_sqlite(filename):
+        yield from sql_chunks(filename, contains, limit, offset)
+        return
+    # The journal is streamed like the base file rather than read whole, so
+    # a long journal does not break the memory bound.
+    paths = [filename] + ([journal_path(filename)] if filename in JOURNALED_TABLES else [])
+    with table_lock(filename, shared=True):
+        for path in paths:
+            if os.path.exists(path) and os.path.getsize(path) > 0:
+                try:
+                    yield from pd.read_csv(path, dtype=str, chunksize=PAGER_CHUNK_ROWS)
+                except pd.errors.EmptyDataError:
+                    pass
+
+
+def filter_rows(chunk, contains):
+    if not contains:
+        return chunk
+    col, text = contains
+    if col not in chunk.columns:
+        raise ValueError(f"Unknown column '{col}'")
+    return chunk[chunk[col].astype(str).str.contains(text, case=False, regex=False, na=False)]
+
+
+def filter_days(chunk, filename, between):
+    """Keeps the rows whose date column falls on the days [first, last) of between."""
+    if not between:
+        return chunk
+    col, first, last = between
+    kind = TABLE_SCHEMAS.get(filename, {}).get(col)
+    if col not in chunk.columns or kind not in DATE_FORMATS:
+        raise ValueError(f"'{col}' is not a date column")
+    days = to_day_ordinals(parse_dates(chunk[col], date_formats(filename, col, kind)))
+    return chunk[day_range_mask(days, first, last)]
+
+
+def sort_key(series, kind, formats=None):
+    """Orders a text column by what it holds: numbers, dates or case-folded text."""
+    if kind == "money":
+        return clean_money(series)
+    if kind in ("int", "count"):
+        return pd.to_numeric(series, errors="coerce")
+    if kind in DATE_FORMATS:
+        return to_day_ordinals(parse_dates(series, formats or DATE_FORMATS[kind]))
+    return series.astype(str).str.lower()
+
+
+def read_page(filename, page=0, page_rows=None, sort_by=None, descending=False, contains=None,
+              prepare=None, between=None):
+    """
+    One page of a table as (DataFrame, has_more). Unsorted pages stop reading
+    as soon as the page is full. Sorted pages keep only the best
+    (page + 1) * page_rows rows while streaming, never the whole table.
+    prepare(chunk), if given, rewrites each chunk before it is filtered;
+    between=(column, first, last) keeps rows dated on the days [first, last).
+    """
+    page_rows = page_rows or PAGE_ROWS
+    start = page * page_rows
+    need = start + page_rows + 1  # one extra row tells us whether there is a next page
+    sql = use_sqlite(filename)
+
+    if sort_by is None:
+        if sql and not between:
+            chunks, skip = table_chunks(filename, contains, limit=page_rows + 1, offset=start), 0
+        else:
+            chunks, skip = table_chunks(filename), start
+        rows = []
+        taken = 0
+        for chunk in chunks:
+            chunk = filter_rows(prepare(chunk) if prepare else chunk, contains)
+            chunk = filter_days(chunk, filename, between)
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            chunk = chunk.iloc[skip:skip + page_rows + 1 - taken]
+            skip = 0
+            rows.append(chunk)
+            taken += len(chunk)
+            if taken > page_rows:
+                break
+        chunks.close()
+    else:
+        kind = TABLE_SCHEMAS.get(filename, {}).get(sort_by, "text")
+        best = None
+        for chunk in table_chunks(filename, contains if sql else None):
+            chunk = filter_days(filter_rows(prepare(chunk) if prepare else chunk, contains), filename, between)
+            if sort_by not in chunk.columns:
+                raise ValueError(f"Unknown column '{sort_by}'")
+            chunk = chunk.assign(_key=sort_key(chunk[sort_by], kind, date_formats(filename, sort_by, kind)))
+            best = chunk if best is None else pd.concat([best, chunk], ignore_index=True)
+            best = best.sort_values("_key", ascending=not descending, kind="mergesort",
+                                    na_position="last").head(need)
+        rows = [] if best is None else [best.iloc[start:].drop(columns="_key")]
+
+    if not rows:
+        return pd.DataFrame(), False
+    result = pd.concat(rows, ignore_index=True)
+    return result.iloc[:page_rows], len(result) > page_rows
+
+
+def page_table(filename, title, empty_message, prepare=None):
+    """
+    Interactive pager: n / p move between pages, "s COL [desc]" sorts,
+    "f COL=TEXT" filters, "d COL FROM [TO]" keeps rows dated FROM..TO
+    (dd-mm-yyyy, inclusive), "f" / "d" alone clear them, Enter leaves.
+    """
+    page, sort_by, descending, contains, between = 0, None, False, None, None
+    while True:
+        try:
+            df, has_more = read_page(filename, page, PAGE_ROWS, sort_by, descending, contains, prepare,
+                                     between)
+        except ValueError as e:
+            print(f"❌ {e}")
+            if sort_by is None and contains is None and between is None:
+                return
+            page, sort_by, descending, contains, between = 0, None, False, None, None
+            continue
+        if df.empty and page == 0 and contains is None and between is None:
+            print(empty_message)
+            return
+        print(f"\n--- {title} (page {page + 1}) ---")
+        if df.empty:
+            print("No matching rows.")
+        else:
+            print(df.to_string(index=False))
+        if contains:
+            print(f"Filter: {contains[0]} contains '{contains[1]}'")
+        if between:
+            col, first, last = between
+            shown = [first] if last is None else [first, last - 1]
+            shown = " to ".join((EPOCH + timedelta(days=d)).strftime(BOOKING_DATE_FORMAT) for d in shown)
+            print(f"Dates: {col} from {shown}")
+
+        cmd = input("[n]ext [p]rev | s COL [desc] | f COL=TEXT | d COL FROM [TO] | Enter to go back: ").strip()
+        if not cmd:
+            return
+        word, _, rest = cmd.partition(" ")
+        word = word.lower()
+        if word == "n":
+            page += 1 if has_more else 0
+        elif word == "p":
+            page = max(page - 1, 0)
+        elif word == "s" and rest:
+            parts = rest.split()
+            sort_by, descending, page = parts[0], parts[-1].lower() == "desc", 0
+        elif word == "f":
+            col, _, text = rest.partition("=")
+            contains = (col.strip(), text.strip()) if col.strip() and text.strip() else None
+            page = 0
+        elif word == "d":
+            parts = rest.split()
+            first = parse_booking_date(parts[1]) if len(parts) > 1 else None
+            last = parse_booking_date(parts[2]) if len(parts) > 2 else None
+            if parts and (first is None or (len(parts) > 2 and last is None)):
+                print("❌ Use: d COL FROM [TO] with dates as dd-mm-yyyy.")
+                continue
+            between = (parts[0], first, None if last is None else last + 1) if parts else None
+            page = 0
+        else:
+            print("❌ Invalid choice.")
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics  # noqa: E402
+import billing  # noqa: E402
+import bookings  # noqa: E402
+import customers  # noqa: E402
+import facilities  # noqa: E402
+import inventory  # noqa: E402
+import rooms  # noqa: E402
+import storage  # noqa: E402
+
+
+@pytest.fixture
+def hotel(tmp_path, monkeypatch):
+    """An empty data directory as the working directory, with every cache and index reset."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "csv")
+    for cache in (storage.TABLE_CACHE, storage.TYPED_CACHE, storage.DAY_CACHE,
+                  bookings.AVAILABILITY_INDEX, facilities.FACILITY_DAYS,
+                  facilities.FACILITY_INDEX):
+        cache.clear()
+    for index in (customers.CUSTOMER_INDEX, bookings.AVAILABILITY_STATE, rooms.RATE_TABLE,
+                  analytics.REVENUE_ROLLUPS, inventory.STOCK_INDEX, billing.PAYMENT_INDEX,
+                  billing.CHARGE_INDEX):
+        index["stamp"] = None
+    rooms.RATE_TABLE["mult"] = None
+    return tmp_path
+
+
+@pytest.fixture
+def write_table(hotel):
+    """Writes rows (lists in column order) as a table's CSV in the data directory."""
+    def write(filename, columns, rows):
+        pd.DataFrame(rows, columns=columns).to_csv(filename, index=False)
+    return write
+
+
+@pytest.fixture
+def backend(request, hotel, monkeypatch):
+    """The storage backend: csv unless a test asks for another with indirect parametrization."""
+    name = getattr(request, "param", "csv")
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", name)
+    monkeypatch.setattr(storage, "_DB", None)
+    monkeypatch.setattr(storage, "_SQL_READY", set())
+    yield name
+    if storage._DB is not None:
+        storage._DB.close()
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+import analytics
+import bookings
+import rooms
+from storage import BOOK_COLUMNS, BOOKING_FILE, ROOM_COLUMNS, ROOM_FILE, load_table, to_day_ordinals
+
+
+@pytest.fixture
+def hotel_rooms(write_table):
+    write_table(ROOM_FILE, ROOM_COLUMNS, [
+        ["101", "Double", 2000, "Available"],
+        ["102", "Double", 2000, "Available"],
+        ["201", "Suite", 5000, "Available"],
+    ])
+    write_table(BOOKING_FILE, BOOK_COLUMNS, [
+        ["B001", "Existing Guest", "101", "01-03-2031", "05-03-2031"],
+    ])
+
+
+def requests(*rows):
+    return pd.DataFrame(rows, columns=["RequestID", "CustomerName", "RoomType", "CheckIn", "CheckOut"])
+
+
+def test_best_fit_takes_the_window_that_opened_last(hotel_rooms):
+    bookings.ensure_availability_index()
+    result = bookings.assign_rooms(requests(["1", "A", "double", "05-03-2031", "06-03-2031"]),
+                                   rooms.list_rooms())
+    # 101 frees up on the 5th; 102 has been free all along and stays whole.
+    assert result["RoomID"].tolist() == ["101"]
+    assert result["RoomType"].tolist() == ["Double"]
+
+
+def test_rooms_out_of_service_are_never_assigned(write_table, hotel_rooms):
+    write_table(ROOM_FILE, ROOM_COLUMNS, [
+        ["101", "Double", 2000, "Maintenance"],
+        ["102", "Double", 2000, "Available"],
+        ["201", "Suite", 5000, "Maintenance"],
+    ])
+    bookings.ensure_availability_index()
+    result = bookings.assign_rooms(requests(
+        ["1", "A", "Double", "05-03-2031", "06-03-2031"],
+        ["2", "B", "Double", "05-03-2031", "06-03-2031"],
+        ["3", "C", "Suite", "05-03-2031", "06-03-2031"],
+    ), rooms.list_rooms())
+    assert result["RoomID"].iloc[0] == "102"
+    assert result["RoomID"].iloc[1:].isna().all()
+    assert result["Reason"].iloc[1:].tolist() == ["No room free", "No room free"]
+
+
+def test_batch_books_what_fits_and_explains_the_rest(hotel_rooms):
+    booked, rejected = bookings.book_assignments(requests(
+        ["1", "A", "Double", "02-03-2031", "04-03-2031"],
+        ["2", "B", "Double", "03-03-2031", "06-03-2031"],
+        ["3", "C", "Double", "05-03-2031", "07-03-2031"],
+        ["4", "D", "Suite", "01-03-2031", "08-03-2031"],
+        ["5", "E", "Deluxe", "01-03-2031", "02-03-2031"],
+        ["6", "F", "Suite", "09-03-2031", "08-03-2031"],
+    ))
+
+    assert sorted(booked["RequestID"]) == ["1", "3", "4"]
+    assert dict(zip(rejected["RequestID"], rejected["Reason"])) == {
+        "2": "No room free", "5": "Unknown room type", "6": "Invalid dates",
+    }
+    assert booked["BookingID"].is_unique
+
+    table = load_table(BOOKING_FILE)
+    assert len(table) == 4
+    days = table.assign(start=to_day_ordinals(table["CheckIn"]), end=to_day_ordinals(table["CheckOut"]))
+    for _, stays in days.sort_values("start").groupby("RoomID", observed=True):
+        assert (stays["start"].to_numpy()[1:] >= stays["end"].to_numpy()[:-1]).all()
+
+    with pytest.raises(ValueError):
+        bookings.create_booking("201", "G", "02-03-2031", "03-03-2031")
+
+
+def test_revenue_after_a_batch_and_a_single_booking_matches_a_rebuild(hotel_rooms):
+    analytics.ensure_revenue_rollups()
+    bookings.book_assignments(requests(
+        ["1", "A", "Suite", "01-03-2031", "04-03-2031"],
+        ["2", "B", "Suite", "05-03-2031", "07-03-2031"],
+    ))
+    bookings.create_booking("102", "C", "10-03-2031", "11-03-2031")
+
+    kept = {key: dict(analytics.ensure_revenue_rollups()[key]) for key in ("daily", "monthly", "room_type")}
+    analytics.build_revenue_rollups()
+    for key, rollup in kept.items():
+        assert rollup == pytest.approx(analytics.REVENUE_ROLLUPS[key])
+
+    table = load_table(BOOKING_FILE).merge(load_table(ROOM_FILE), on="RoomID")
+    billed = rooms.stay_charges(table["Price"], table["RoomType"].astype(object),
+                                to_day_ordinals(table["CheckIn"]), to_day_ordinals(table["CheckOut"]))
+    assert sum(kept["daily"].values()) == pytest.approx(billed.sum())
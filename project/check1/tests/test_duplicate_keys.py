@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+import billing
+import customers
+from storage import CUSTOMER_FILE, SEQUENCE_FILE, DuplicateKeyError, load_table, read_sequences
+
+
+def rewind_sequence(entity, last):
+    """Puts an ID sequence back, as if id_sequences.json had been restored from an old copy."""
+    sequences = read_sequences()
+    sequences[entity] = last
+    with open(SEQUENCE_FILE, "w") as f:
+        json.dump(sequences, f)
+
+
+@pytest.mark.parametrize("backend", ["sqlite"], indirect=True)
+def test_repeated_customer_id_saves_nothing(backend):
+    first = customers.create_customer("Aarav", "9000000001", "aarav@example.com", days_of_stay=1)
+    rewind_sequence("customer", first["CustomerID"] - 1)
+
+    with pytest.raises(ValueError, match="already exists"):
+        customers.create_customer("Divya", "9000000002", "divya@example.com", days_of_stay=1)
+
+    assert load_table(CUSTOMER_FILE)["Name"].tolist() == ["Aarav"]
+    assert customers.find_customers("9000000002").empty
+
+
+@pytest.mark.parametrize("backend", ["sqlite"], indirect=True)
+def test_repeated_charge_id_leaves_the_folio_alone(backend):
+    billing.post_charges([{"CustomerID": 1, "Amount": 300}])
+    rewind_sequence("charge", 0)
+
+    with pytest.raises(DuplicateKeyError):
+        billing.post_charges([{"CustomerID": 1, "Amount": 500}])
+    assert billing.folio_balance(1) == 300
@@ -0,0 +1,70 @@
+import pytest
+
+import billing
+import facilities
+from storage import (
+    BANQUET_FILE, CUSTOMER_COLUMNS, CUSTOMER_FILE, FACILITY_COLUMNS, POOL_FILE, append_record, load_csv,
+)
+
+DAY = "2031-01-01"
+SLOT = "02:00 PM - 05:00 PM"
+
+
+@pytest.fixture
+def guest(backend):
+    append_record(CUSTOMER_FILE, dict(zip(CUSTOMER_COLUMNS, [
+        1, "Tanvi", "9000000001", "tanvi@example.com", "101", 2, "2025-01-01 10:00:00",
+    ])), CUSTOMER_COLUMNS)
+    return "1"
+
+
+def banquet_booked():
+    return facilities.facility_availability("banquet_hall", DAY)[1]["booked"]
+
+
+def test_last_place_goes_once(guest, hotel):
+    facilities.reserve_facility_slot("banquet_hall", DAY, SLOT, guest)
+    with pytest.raises(ValueError, match="full"):
+        facilities.reserve_facility_slot("banquet_hall", DAY, SLOT, guest)
+    assert banquet_booked() == 1
+    assert load_csv(BANQUET_FILE, FACILITY_COLUMNS)["status"].tolist() == ["Booked"]
+    assert not (hotel / "hotel.db").exists()
+
+
+def test_unknown_customer_takes_no_place(guest):
+    with pytest.raises(ValueError, match="Customer ID"):
+        facilities.reserve_facility_slot("banquet_hall", DAY, SLOT, "99999")
+    assert banquet_booked() == 0
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"], indirect=True)
+def test_failed_charge_gives_the_place_back(guest, monkeypatch):
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(billing, "update_customer_bill", fail)
+        with pytest.raises(OSError):
+            facilities.reserve_facility_slot("banquet_hall", DAY, SLOT, guest)
+    assert banquet_booked() == 0
+    assert load_csv(BANQUET_FILE, FACILITY_COLUMNS).empty
+
+    facilities.reserve_facility_slot("banquet_hall", DAY, SLOT, guest)
+    assert banquet_booked() == 1
+    assert load_csv(BANQUET_FILE, FACILITY_COLUMNS)["status"].tolist() == ["Booked"]
+
+
+def test_counts_are_kept_in_place_until_another_terminal_writes(guest, monkeypatch):
+    def pool_booked():
+        return facilities.facility_availability("swimming_pool", DAY)[5]["booked"]
+
+    facilities.reserve_facility_slot("swimming_pool", DAY, "02:00 PM", guest)
+    with monkeypatch.context() as patch:
+        patch.setattr(facilities, "build_facility_counts", None)
+        facilities.reserve_facility_slot("swimming_pool", DAY, "02:00 PM", guest)
+        assert pool_booked() == 2
+
+    # Another terminal logs a place directly: the stamp moves and the log is recounted.
+    append_record(POOL_FILE, {"date": DAY, "time_slot": "02:00 PM", "slot_type": "Paid",
+                              "customer_id": guest, "status": "Booked"}, FACILITY_COLUMNS)
+    assert pool_booked() == 3
@@ -0,0 +1,75 @@
+import json
+
+import pandas as pd
+
+import customers
+from storage import CUSTOMER_COLUMNS, CUSTOMER_FILE, load_table
+
+
+def write_guests(path, rows):
+    pd.DataFrame(rows, columns=["Name", "Phone", "Email", "DaysOfStay"]).to_csv(path, index=False)
+
+
+def test_import_keeps_valid_rows_and_rejects_the_rest(write_table, hotel):
+    write_table(CUSTOMER_FILE, CUSTOMER_COLUMNS,
+                [[1, "Tanvi", "9000000009", "abc@def.com", "101", 2, "2025-01-01 10:00:00"]])
+    path = str(hotel / "guests.csv")
+    write_guests(path, [
+        ["Aarav", "9000000001", "aarav@example.com", "3"],
+        ["", "9000000002", "x@example.com", "1"],
+        ["Divya", "12345", "divya@example.com", "1"],
+        ["Kabir", "9000000003", "not-an-email", "1"],
+        ["Meera", "9000000004", "meera@example.com", "3.5"],
+        ["Riya", "9000000005", "riya@example.com", "-1"],
+        ["Arjun", "9000000009", "arjun@example.com", "1"],
+        ["Ishaan", "9000000001", "ishaan@example.com", "1"],
+        ["Saanvi", "9000000006", "saanvi@example.com", "4.0"],
+    ])
+
+    summary = customers.import_customers(path)
+
+    assert summary["read"] == 9
+    assert summary["imported"] == 2
+    assert summary["rejected"] == 7
+    rejects = pd.read_csv(summary["reject_file"], dtype=str).set_index("Line")["Reason"]
+    assert rejects.to_dict() == {
+        "3": "missing name",
+        "4": "invalid phone",
+        "5": "invalid email",
+        "6": "invalid DaysOfStay",
+        "7": "invalid DaysOfStay",
+        "8": "phone already exists",
+        "9": "duplicate phone in file",
+    }
+
+    table = load_table(CUSTOMER_FILE)
+    assert table["Name"].tolist() == ["Tanvi", "Aarav", "Saanvi"]
+    assert table["DaysOfStay"].tolist() == [2, 3, 4]
+    assert table["CustomerID"].is_unique
+
+
+def test_default_reject_files_do_not_collide(hotel):
+    csv_path = str(hotel / "guests.csv")
+    jsonl_path = str(hotel / "guests.jsonl")
+    write_guests(csv_path, [["Aarav", "12", "aarav@example.com", "1"]])
+    with open(jsonl_path, "w") as f:
+        f.write(json.dumps({"Name": "Divya", "Phone": "34", "Email": "divya@example.com"}) + "\n")
+
+    first = customers.import_customers(csv_path)
+    second = customers.import_customers(jsonl_path)
+
+    assert first["reject_file"] == csv_path + ".rejects.csv"
+    assert second["reject_file"] == jsonl_path + ".rejects.csv"
+    assert pd.read_csv(first["reject_file"])["Name"].tolist() == ["Aarav"]
+    assert pd.read_csv(second["reject_file"])["Name"].tolist() == ["Divya"]
+
+
+def test_import_streams_in_chunks(hotel):
+    path = str(hotel / "guests.csv")
+    write_guests(path, [[f"Guest {i}", f"90000{i:05d}", f"g{i}@example.com", "1"] for i in range(25)])
+
+    summary = customers.import_customers(path, chunk_size=10)
+
+    assert summary["imported"] == 25
+    ids = sorted(load_table(CUSTOMER_FILE)["CustomerID"].tolist())
+    assert ids == list(range(ids[0], ids[0] + 25))
@@ -0,0 +1,78 @@
+from datetime import date
+
+import os
+
+import pandas as pd
+import pytest
+
+import storage
+from storage import BOOK_COLUMNS, BOOKING_FILE, append_record, append_records, day_number, journal_path, read_page
+
+
+@pytest.fixture
+def booking_rows(write_table, monkeypatch):
+    # Small chunks so every page and sort has to cross chunk boundaries.
+    monkeypatch.setattr(storage, "PAGER_CHUNK_ROWS", 4)
+    rows = [[f"B{i:03d}", f"Guest {i}", str(100 + i % 3), f"{i + 1:02d}-03-2025", f"{i + 2:02d}-03-2025"]
+            for i in range(10)]
+    write_table(BOOKING_FILE, BOOK_COLUMNS, rows)
+    # Journal rows are read after the CSV.
+    append_record(BOOKING_FILE, dict(zip(BOOK_COLUMNS, ["B010", "Late Guest", "100", "15-02-2025", "16-02-2025"])),
+                  BOOK_COLUMNS)
+    return rows
+
+
+def test_pages_in_file_order(booking_rows):
+    first, more = read_page(BOOKING_FILE, 0, 4)
+    assert first["BookingID"].tolist() == ["B000", "B001", "B002", "B003"]
+    assert more
+
+    last, more = read_page(BOOKING_FILE, 2, 4)
+    assert last["BookingID"].tolist() == ["B008", "B009", "B010"]
+    assert not more
+
+    empty, more = read_page(BOOKING_FILE, 3, 4)
+    assert empty.empty and not more
+
+
+def test_sorts_dates_by_date_not_text(booking_rows):
+    page, more = read_page(BOOKING_FILE, 0, 3, sort_by="CheckIn")
+    assert page["BookingID"].tolist() == ["B010", "B000", "B001"]
+    assert more
+
+    page, _ = read_page(BOOKING_FILE, 1, 3, sort_by="CheckIn", descending=True)
+    assert page["BookingID"].tolist() == ["B006", "B005", "B004"]
+
+
+def test_filters_and_date_ranges(booking_rows):
+    page, more = read_page(BOOKING_FILE, 0, 20, contains=("RoomID", "101"))
+    assert page["BookingID"].tolist() == ["B001", "B004", "B007"]
+    assert not more
+
+    march = ("CheckIn", day_number(date(2025, 3, 3)), day_number(date(2025, 3, 6)))
+    page, _ = read_page(BOOKING_FILE, 0, 20, between=march)
+    assert page["BookingID"].tolist() == ["B002", "B003", "B004"]
+
+    page, _ = read_page(BOOKING_FILE, 0, 2, sort_by="BookingID", descending=True, between=march)
+    assert page["BookingID"].tolist() == ["B004", "B003"]
+
+
+def test_rejects_unknown_columns(booking_rows):
+    with pytest.raises(ValueError):
+        read_page(BOOKING_FILE, 0, 5, sort_by="Nope")
+    with pytest.raises(ValueError):
+        read_page(BOOKING_FILE, 0, 5, contains=("Nope", "x"))
+    with pytest.raises(ValueError):
+        read_page(BOOKING_FILE, 0, 5, between=("CustomerName", 0, 1))
+
+
+def test_journal_is_streamed_in_chunks_too(booking_rows):
+    walk_ins = [[f"B{i:03d}", "Walk-in", "100", "01-04-2025", "02-04-2025"] for i in range(11, 20)]
+    append_records(BOOKING_FILE, [dict(zip(BOOK_COLUMNS, row)) for row in walk_ins], BOOK_COLUMNS)
+
+    chunks = list(storage.table_chunks(BOOKING_FILE))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2, 4, 4, 2]
+    assert pd.concat(chunks)["BookingID"].tolist() == [f"B{i:03d}" for i in range(20)]
+    journal = os.path.abspath(journal_path(BOOKING_FILE))
+    assert not any(path == journal for path, _ in storage.TABLE_CACHE)
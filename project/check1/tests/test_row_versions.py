@@ -0,0 +1,48 @@
+import pytest
+
+import rooms
+import staff
+from storage import ROOM_COLUMNS, ROOM_FILE, STAFF_COLUMNS, STAFF_FILE, find_rows, update_rows
+
+
+def answers(monkeypatch, *replies):
+    """Feeds the menu prompts; a callable reply runs (as another terminal) and answers the next one."""
+    replies = list(replies)
+
+    def reply(prompt=""):
+        answer = replies.pop(0)
+        if callable(answer):
+            answer()
+            answer = replies.pop(0)
+        return answer
+    monkeypatch.setattr("builtins.input", reply)
+    return replies
+
+
+@pytest.mark.parametrize("backend", ["csv", "sqlite"], indirect=True)
+def test_room_edit_on_stale_data_is_asked_again(backend, monkeypatch):
+    rooms.create_room("101", "Double", 2000)
+
+    def other_terminal():
+        update_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", "101", {"Status": "Maintenance"})
+
+    left = answers(monkeypatch, "101", "2500", other_terminal, "available", "2600", "booked")
+    rooms.update_room()
+
+    assert not left
+    room = find_rows(ROOM_FILE, ROOM_COLUMNS, "RoomID", "101").iloc[0]
+    assert (float(room["Price"]), room["Status"]) == (2600.0, "Booked")
+
+
+def test_staff_edit_on_stale_data_is_asked_again(hotel, monkeypatch):
+    sid = staff.create_staff("Asha", "Chef", "9000000001", 30000)["StaffID"]
+
+    def other_terminal():
+        update_rows(STAFF_FILE, STAFF_COLUMNS, "StaffID", sid, {"Role": "Manager"})
+
+    left = answers(monkeypatch, sid, "35000", other_terminal, "", "36000", "")
+    staff.update_staff()
+
+    assert not left
+    member = find_rows(STAFF_FILE, STAFF_COLUMNS, "StaffID", sid).iloc[0]
+    assert (float(member["Salary"]), member["Role"]) == (36000.0, "Manager")
@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+import inventory
+from storage import (
+    INVENTORY_COLUMNS, INVENTORY_FILE, MOVEMENT_COLUMNS, MOVEMENTS_FILE, STOCK_SNAPSHOT_COLUMNS,
+    STOCK_SNAPSHOT_FILE, load_table,
+)
+
+
+@pytest.fixture
+def movement_log(write_table):
+    # IT1 starts at 10 and IT2 at 5 (snapshot 1, before any movement); the
+    # second snapshot is taken after move 3 and the log carries on after it.
+    write_table(MOVEMENTS_FILE, MOVEMENT_COLUMNS, [
+        [1, "2025-01-01 09:00:00", "IT1", "Use", -2, 8, ""],
+        [2, "2025-01-02 09:00:00", "IT2", "Restock", 10, 15, ""],
+        [3, "2025-01-03 09:00:00", "IT1", "Use", -3, 5, ""],
+        [4, "2025-01-04 09:00:00", "IT1", "Restock", 20, 25, ""],
+        [5, "2025-01-05 09:00:00", "IT2", "Use", -4, 11, ""],
+    ])
+    write_table(STOCK_SNAPSHOT_FILE, STOCK_SNAPSHOT_COLUMNS, [
+        [1, "2024-12-31 23:00:00", 0, "IT1", 10],
+        [1, "2024-12-31 23:00:00", 0, "IT2", 5],
+        [2, "2025-01-03 12:00:00", 3, "IT1", 5],
+        [2, "2025-01-03 12:00:00", 3, "IT2", 15],
+    ])
+
+
+@pytest.mark.parametrize("when, expected", [
+    ("2024-12-31 23:30:00", {"IT1": 10, "IT2": 5}),
+    ("2025-01-02 12:00:00", {"IT1": 8, "IT2": 15}),
+    ("2025-01-03 12:00:00", {"IT1": 5, "IT2": 15}),
+    ("2025-01-04 12:00:00", {"IT1": 25, "IT2": 15}),
+    ("2025-02-01 00:00:00", {"IT1": 25, "IT2": 11}),
+])
+def test_stock_at_replays_from_the_newest_snapshot(movement_log, when, expected):
+    assert inventory.stock_at(when).to_dict() == expected
+    assert {item: inventory.stock_at(when, item) for item in expected} == expected
+
+
+def test_stock_index_matches_the_log(movement_log):
+    assert inventory.current_stock("IT1") == 25
+    assert inventory.current_stock("IT2") == 11
+    assert inventory.current_stock("missing") == 0
+
+
+def test_record_movement_snapshots_and_stays_consistent(write_table, monkeypatch):
+    monkeypatch.setattr(inventory, "STOCK_SNAPSHOT_EVERY", 3)
+    write_table(INVENTORY_FILE, INVENTORY_COLUMNS, [
+        ["IT1", "Towel", "Linen", 10, 2, 150, "2025-01-01 00:00:00"],
+    ])
+
+    changes = [5, -3, -4, 7, -1, 2, -6]
+    quantities = [inventory.record_movement("IT1", change) for change in changes]
+
+    expected = list(pd.Series(changes).cumsum() + 10)
+    assert quantities == expected
+    assert load_table(MOVEMENTS_FILE)["QuantityAfter"].tolist() == expected
+    # Seed snapshot plus one every 3 movements.
+    assert load_table(STOCK_SNAPSHOT_FILE)["SnapshotID"].nunique() == 3
+    assert inventory.stock_at(pd.Timestamp.now() + pd.Timedelta(seconds=1), "IT1") == expected[-1]
+    assert inventory.current_stock("IT1") == expected[-1]